@@ -2,6 +2,6 @@
 API v1 endpoints.
 """
 
-from app.api.v1.endpoints import search, company, prices, news, fundamentals
+from app.api.v1.endpoints import search, company, prices, news, fundamentals, admin, test
 
-__all__ = ["search", "company", "prices", "news", "fundamentals"]
+__all__ = ["search", "company", "prices", "news", "fundamentals", "admin", "test"]
@@ -0,0 +1,54 @@
+"""
+Administrative endpoints (cache management).
+
+Every route requires the X-Admin-Token header when ADMIN_TOKEN is set.
+Without a token the router is only mounted outside production.
+"""
+
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from loguru import logger
+
+from app.core.cache import invalidate
+from app.core.config import settings
+from app.core.dependencies import Symbol
+
+
+async def require_admin_token(
+    x_admin_token: str | None = Header(default=None, description="Admin token")
+) -> None:
+    """
+    Reject requests without the configured admin token.
+
+    Raises:
+        HTTPException: 401 if ADMIN_TOKEN is set and the header does not match
+    """
+    if settings.ADMIN_TOKEN is None:
+        return
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode(), settings.ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+
+@router.delete("/admin/cache/{symbol}", tags=["admin"])
+async def invalidate_cache(symbol: Symbol):
+    """
+    Invalidate all cached responses for a symbol.
+
+    Clears quote, info, prices, technicals, shareholding, news and
+    fundamentals entries (including those filled by the warm-up job).
+    The symbol is validated like every other {symbol} route, so glob
+    characters are rejected with 422.
+
+    **Example:**
+    - `DELETE /api/v1/admin/cache/RELIANCE` - Drop cached Reliance data
+    """
+    deleted = await invalidate(symbol)
+    logger.info(f"Invalidated {deleted} cache entries for {symbol}")
+
+    return {"symbol": symbol, "deleted": deleted}
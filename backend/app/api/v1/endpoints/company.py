@@ -2,20 +2,127 @@
 Company information and quote endpoints.
 """
 
-from fastapi import APIRouter, Path, Depends, HTTPException
+import asyncio
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from loguru import logger
 
-from app.api.v1.schemas.responses import QuoteResponse, ShareholdingPattern, CompanyInfo
-from app.core.dependencies import ServiceFactory, get_service_factory
+from app.api.v1.schemas.responses import (
+    QuoteResponse,
+    ShareholdingPattern,
+    CompanyInfo,
+    CompanyOverview,
+    FundamentalsResponse
+)
+from app.core.cache import cached
+from app.core.config import settings
+from app.core.symbols import with_ns, strip_suffix
+from app.core.errors import handle_upstream_errors
+from app.core.http_cache import conditional_get
+from app.core.dependencies import (
+    Symbol,
+    get_nse_service,
+    get_screener_service,
+    get_yahoo_service,
+)
+from app.core.responses import PydanticORJSONResponse
+from app.core.rate_limit import limiter, concurrency_limit
 from app.services.base import ServiceError
+from app.services.nse import NSEService
+from app.services.screener import ScreenerService
+from app.services.yahoo import YahooFinanceService
 
 router = APIRouter()
 
+# Fields /company/{symbol}/info needs from YahooFinanceService.fetch_data
+COMPANY_INFO_FIELDS = frozenset({'symbol', 'name', 'sector', 'industry', 'market_cap'})
+
+
+def _build_quote(data: Dict[str, Any]) -> QuoteResponse:
+    """Project YahooFinanceService.fetch_data output onto QuoteResponse (trusted, unvalidated)."""
+    return QuoteResponse.model_construct(
+        symbol=data['symbol'],
+        name=data.get('name'),
+        current_price=data.get('current_price', 0),
+        previous_close=data.get('previous_close'),
+        open=data.get('open'),
+        day_high=data.get('day_high'),
+        day_low=data.get('day_low'),
+        volume=data.get('volume'),
+        change=data.get('change'),
+        percent_change=data.get('percent_change'),
+        market_cap=data.get('market_cap'),
+        pe_ratio=data.get('pe_ratio'),
+        week_52_high=data.get('week_52_high'),
+        week_52_low=data.get('week_52_low'),
+        timestamp=data.get('timestamp')
+    )
+
+
+def _build_shareholding(data: Dict[str, Any]) -> ShareholdingPattern:
+    """
+    Project NSEService.get_shareholding output onto ShareholdingPattern.
 
-@router.get("/company/{symbol}/quote", response_model=QuoteResponse, tags=["company"])
+    Validated: NSE returns raw JSON values (percentages may be strings).
+    """
+    # Extract data
+    promoter = data.get('promoter', {})
+    fii = data.get('fii', {})
+    dii = data.get('dii', {})
+    public = data.get('public', {})
+    pledging = data.get('pledging', {})
+
+    return ShareholdingPattern(
+        promoter_percentage=promoter.get('percentage'),
+        fii_percentage=fii.get('percentage'),
+        dii_percentage=dii.get('percentage'),
+        public_percentage=public.get('percentage'),
+        promoter_pledged_percentage=pledging.get('promoter_pledged_percentage'),
+        date=data.get('date')
+    )
+
+
+def _build_fundamentals(symbol: str, data: Dict[str, Any]) -> FundamentalsResponse:
+    """Project ScreenerService.fetch_data output onto FundamentalsResponse (no validation)."""
+    return FundamentalsResponse.model_construct(
+        symbol=symbol,
+        years=data.get('years', []),
+        revenue=data.get('revenue', []),
+        net_profit=data.get('net_profit', []),
+        roce=data.get('roce', []),
+        roe=data.get('roe', []),
+        debt_to_equity=data.get('debt_to_equity', []),
+        eps=data.get('eps', []),
+        book_value=data.get('book_value', []),
+        pe_ratio=data.get('pe_ratio', []),
+        market_cap=data.get('market_cap', []),
+        source="screener.in"
+    )
+
+
+def _section_error(result: Any) -> str | None:
+    """Return an error message if a gathered section failed, else None."""
+    if isinstance(result, Exception):
+        return str(result) or type(result).__name__
+    if isinstance(result, dict) and result.get('status') == 'error':
+        return result.get('message', 'Unknown error')
+    return None
+
+
+@router.get(
+    "/company/{symbol}/quote",
+    response_model=None,
+    responses={200: {"model": QuoteResponse}},
+    tags=["company"]
+)
+@limiter.limit("30/minute")
+@handle_upstream_errors
 async def get_quote(
-    symbol: str = Path(..., description="Stock symbol (e.g., 'RELIANCE' without .NS suffix)"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    request: Request,
+    response: Response,
+    symbol: Symbol,
+    yahoo: YahooFinanceService = Depends(get_yahoo_service)
 ):
     """
     Get current quote and market data for a stock.
@@ -28,46 +135,44 @@ async def get_quote(
 
     **Note:** Symbol should be without .NS/.BO suffix. The API will add .NS automatically.
     """
-    logger.info(f"Fetching quote for {symbol}")
-
-    try:
-        yahoo = factory.create_yahoo_service()
-
-        # Ensure .NS suffix for NSE
-        symbol_with_suffix = symbol if '.NS' in symbol or '.BO' in symbol else f"{symbol}.NS"
-
-        data = await yahoo.fetch_data(symbol_with_suffix)
-
-        return QuoteResponse(
-            symbol=data['symbol'],
-            name=data.get('name'),
-            current_price=data.get('current_price', 0),
-            previous_close=data.get('previous_close'),
-            open=data.get('open'),
-            day_high=data.get('day_high'),
-            day_low=data.get('day_low'),
-            volume=data.get('volume'),
-            change=data.get('current_price', 0) - data.get('previous_close', 0) if data.get('previous_close') else None,
-            percent_change=((data.get('current_price', 0) - data.get('previous_close', 0)) / data.get('previous_close', 1) * 100) if data.get('previous_close') else None,
-            market_cap=data.get('market_cap'),
-            pe_ratio=data.get('pe_ratio'),
-            week_52_high=data.get('week_52_high'),
-            week_52_low=data.get('week_52_low'),
-            timestamp=data.get('timestamp')
-        )
+    logger.debug("Fetching quote for {}", symbol)
+
+    # Ensure .NS suffix for NSE
+    symbol_with_suffix = with_ns(symbol)
+
+    data = await cached(
+        f"quote:{symbol_with_suffix}",
+        settings.CACHE_TTL_QUOTE,
+        lambda: yahoo.fetch_data(symbol_with_suffix)
+    )
+
+    if data.get('status') == 'error':
+        raise ServiceError(data.get('message', 'Unknown error'))
+
+    quote = _build_quote(data)
 
-    except ServiceError as e:
-        logger.error(f"Service error fetching quote for {symbol}: {e}")
-        raise HTTPException(status_code=503, detail=f"Unable to fetch quote: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error fetching quote for {symbol}: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    not_modified = conditional_get(
+        request, response, quote.model_dump(mode='json'), settings.CACHE_TTL_QUOTE
+    )
+    if not_modified is not None:
+        return not_modified
 
+    return PydanticORJSONResponse(quote, headers=response.headers)
 
-@router.get("/company/{symbol}/info", response_model=CompanyInfo, tags=["company"])
+
+@router.get(
+    "/company/{symbol}/info",
+    response_model=None,
+    responses={200: {"model": CompanyInfo}},
+    tags=["company"]
+)
+@limiter.limit("30/minute")
+@handle_upstream_errors
 async def get_company_info(
-    symbol: str = Path(..., description="Stock symbol"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    request: Request,
+    response: Response,
+    symbol: Symbol,
+    yahoo: YahooFinanceService = Depends(get_yahoo_service)
 ):
     """
     Get basic company information.
@@ -75,31 +180,51 @@ async def get_company_info(
     **Example:**
     - `/api/v1/company/RELIANCE/info` - Get Reliance company info
     """
-    logger.info(f"Fetching company info for {symbol}")
-
-    try:
-        yahoo = factory.create_yahoo_service()
-        symbol_with_suffix = symbol if '.NS' in symbol or '.BO' in symbol else f"{symbol}.NS"
-
-        data = await yahoo.fetch_data(symbol_with_suffix)
-
-        return CompanyInfo(
-            symbol=data['symbol'],
-            name=data.get('name', symbol),
-            sector=data.get('sector'),
-            industry=data.get('industry'),
-            market_cap=data.get('market_cap')
-        )
-
-    except Exception as e:
-        logger.error(f"Error fetching company info for {symbol}: {e}")
-        raise HTTPException(status_code=500, detail="Unable to fetch company information")
-
-
-@router.get("/company/{symbol}/shareholding", response_model=ShareholdingPattern, tags=["company"])
+    logger.debug("Fetching company info for {}", symbol)
+
+    symbol_with_suffix = with_ns(symbol)
+
+    # Profile fields only; skips the price history request
+    data = await cached(
+        f"info:{symbol_with_suffix}",
+        settings.CACHE_TTL_SEARCH,
+        lambda: yahoo.fetch_data(symbol_with_suffix, fields=COMPANY_INFO_FIELDS)
+    )
+
+    if data.get('status') == 'error':
+        raise ServiceError(data.get('message', 'Unknown error'))
+
+    info = CompanyInfo.model_construct(
+        symbol=data['symbol'],
+        name=data.get('name', symbol),
+        sector=data.get('sector'),
+        industry=data.get('industry'),
+        market_cap=data.get('market_cap')
+    )
+
+    # Company metadata changes rarely; cache it as long as search results
+    not_modified = conditional_get(
+        request, response, info.model_dump(mode='json'), settings.CACHE_TTL_SEARCH
+    )
+    if not_modified is not None:
+        return not_modified
+
+    return PydanticORJSONResponse(info, headers=response.headers)
+
+
+@router.get(
+    "/company/{symbol}/shareholding",
+    response_model=None,
+    responses={200: {"model": ShareholdingPattern}},
+    tags=["company"]
+)
+@limiter.limit(f"{settings.RATE_LIMIT_NSE}/minute")
+@handle_upstream_errors
 async def get_shareholding(
-    symbol: str = Path(..., description="NSE stock symbol (without .NS)"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    request: Request,
+    response: Response,
+    symbol: Symbol,
+    nse: NSEService = Depends(get_nse_service)
 ):
     """
     Get shareholding pattern from NSE.
@@ -112,44 +237,119 @@ async def get_shareholding(
     **Note:** This data comes from NSE and may not always be available due to
     rate limiting or API restrictions.
     """
-    logger.info(f"Fetching shareholding for {symbol}")
-
-    try:
-        nse = factory.create_nse_service()
-
-        # Remove any suffix for NSE
-        symbol_clean = symbol.replace('.NS', '').replace('.BO', '')
-
-        data = await nse.get_shareholding(symbol_clean)
-
-        # Handle case where NSE returns error dict
-        if data.get('status') == 'error':
-            raise HTTPException(
-                status_code=503,
-                detail=f"NSE service unavailable: {data.get('message', 'Unknown error')}"
-            )
-
-        # Extract data
-        promoter = data.get('promoter', {})
-        fii = data.get('fii', {})
-        dii = data.get('dii', {})
-        public = data.get('public', {})
-        pledging = data.get('pledging', {})
-
-        return ShareholdingPattern(
-            promoter_percentage=promoter.get('percentage'),
-            fii_percentage=fii.get('percentage'),
-            dii_percentage=dii.get('percentage'),
-            public_percentage=public.get('percentage'),
-            promoter_pledged_percentage=pledging.get('promoter_pledged_percentage'),
-            date=data.get('date')
-        )
+    logger.debug("Fetching shareholding for {}", symbol)
+
+    # Remove any suffix for NSE
+    symbol_clean = strip_suffix(symbol)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching shareholding for {symbol}: {e}")
+    data = await cached(
+        f"shareholding:{symbol_clean}",
+        settings.CACHE_TTL_SHAREHOLDING,
+        lambda: nse.get_shareholding(symbol_clean)
+    )
+
+    # Handle case where NSE returns error dict
+    if data.get('status') == 'error':
         raise HTTPException(
             status_code=503,
-            detail="NSE service temporarily unavailable. Please try again later."
+            detail=f"NSE service unavailable: {data.get('message', 'Unknown error')}"
         )
+
+    shareholding = _build_shareholding(data)
+
+    not_modified = conditional_get(
+        request, response, shareholding.model_dump(mode='json'), settings.CACHE_TTL_SHAREHOLDING
+    )
+    if not_modified is not None:
+        return not_modified
+
+    return PydanticORJSONResponse(shareholding, headers=response.headers)
+
+
+@router.get(
+    "/company/{symbol}/full",
+    response_model=None,
+    responses={200: {"model": CompanyOverview}},
+    tags=["company"],
+    dependencies=[Depends(concurrency_limit("screener", settings.RATE_LIMIT_SCRAPER_CONCURRENCY))]
+)
+@limiter.limit("30/minute")
+async def get_company_full(
+    request: Request,
+    response: Response,
+    symbol: Symbol,
+    yahoo: YahooFinanceService = Depends(get_yahoo_service),
+    nse: NSEService = Depends(get_nse_service),
+    screener: Optional[ScreenerService] = Depends(get_screener_service)
+):
+    """
+    Get quote, shareholding and fundamentals in a single call.
+
+    The three upstream sources (Yahoo, NSE, Screener.in) are fetched concurrently.
+    Sections that fail are returned as null with a message in `errors`.
+
+    **Example:**
+    - `/api/v1/company/RELIANCE/full` - Complete Reliance overview
+
+    **Note:** Fundamentals are only included when SCREENER_COOKIE is configured.
+    """
+    logger.debug("Fetching full overview for {}", symbol)
+
+    symbol_with_suffix = with_ns(symbol)
+    symbol_clean = strip_suffix(symbol)
+
+    async def load_fundamentals() -> Dict[str, Any]:
+        if screener is None:
+            raise ValueError("SCREENER_COOKIE is not configured")
+        return await cached(
+            f"fundamentals:{symbol_clean}",
+            settings.CACHE_TTL_FUNDAMENTALS,
+            lambda: screener.fetch_data(symbol_clean)
+        )
+
+    quote, shareholding, fundamentals = await asyncio.gather(
+        cached(
+            f"quote:{symbol_with_suffix}",
+            settings.CACHE_TTL_QUOTE,
+            lambda: yahoo.fetch_data(symbol_with_suffix)
+        ),
+        cached(
+            f"shareholding:{symbol_clean}",
+            settings.CACHE_TTL_SHAREHOLDING,
+            lambda: nse.get_shareholding(symbol_clean)
+        ),
+        load_fundamentals(),
+        return_exceptions=True
+    )
+
+    overview = CompanyOverview(symbol=symbol_clean)
+    sections = (
+        ('quote', quote, _build_quote),
+        ('shareholding', shareholding, _build_shareholding),
+        ('fundamentals', fundamentals, lambda data: _build_fundamentals(symbol_clean, data)),
+    )
+
+    for name, result, build in sections:
+        error = _section_error(result)
+        if error is None:
+            try:
+                setattr(overview, name, build(result))
+                continue
+            except Exception as e:
+                error = str(e)
+
+        logger.warning(f"{name} unavailable for {symbol}: {error}")
+        overview.errors[name] = error
+
+    if len(overview.errors) == len(sections):
+        raise HTTPException(status_code=503, detail="All upstream sources are unavailable")
+
+    # Partial results are not cacheable; a complete overview lives as long as its quote
+    if not overview.errors:
+        not_modified = conditional_get(
+            request, response, overview.model_dump(mode='json'), settings.CACHE_TTL_QUOTE
+        )
+        if not_modified is not None:
+            return not_modified
+
+    return PydanticORJSONResponse(overview, headers=response.headers)
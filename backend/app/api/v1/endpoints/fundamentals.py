@@ -2,20 +2,37 @@
 Fundamental data endpoints (10-year historical).
 """
 
-from fastapi import APIRouter, Path, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
 from loguru import logger
 
 from app.api.v1.schemas.responses import FundamentalsResponse
-from app.core.dependencies import ServiceFactory, get_service_factory
+from app.core.config import settings
+from app.core.errors import handle_upstream_errors
+from app.core.symbols import strip_suffix
+from app.core.dependencies import Symbol, get_screener_service
+from app.core.responses import PydanticORJSONResponse
+from app.core.rate_limit import limiter, concurrency_limit
 from app.services.base import ServiceError
+from app.services.screener import ScreenerService
 
 router = APIRouter()
 
 
-@router.get("/fundamentals/{symbol}", response_model=FundamentalsResponse, tags=["fundamentals"])
+@router.get(
+    "/fundamentals/{symbol}",
+    response_model=None,
+    responses={200: {"model": FundamentalsResponse}},
+    tags=["fundamentals"],
+    dependencies=[Depends(concurrency_limit("screener", settings.RATE_LIMIT_SCRAPER_CONCURRENCY))]
+)
+@limiter.limit(f"{settings.RATE_LIMIT_SCRAPER}/minute")
+@handle_upstream_errors
 async def get_fundamentals(
-    symbol: str = Path(..., description="Stock symbol (NSE, without .NS suffix)"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    request: Request,
+    symbol: Symbol,
+    screener: Optional[ScreenerService] = Depends(get_screener_service)
 ):
     """
     Get 10-year fundamental data from Screener.in.
@@ -42,15 +59,13 @@ async def get_fundamentals(
 
     If cookie is not configured or has expired, this endpoint will return an error.
     """
-    logger.info(f"Fetching fundamentals for {symbol}")
+    logger.debug("Fetching fundamentals for {}", symbol)
 
     # --- TEMPORARY: Mock data while Screener is being fixed ---
     # try:
     #     # Check if Screener cookie is configured
-    #     try:
-    #         screener = factory.create_screener_service()
-    #     except ValueError as e:
-    #         logger.warning(f"Screener service not available: {e}")
+    #     if screener is None:
+    #         logger.warning("Screener service not available: SCREENER_COOKIE is not configured")
     #         raise HTTPException(
     #             status_code=503,
     #             detail="Screener service not configured. Please set SCREENER_COOKIE in .env file. See API docs for setup instructions."
@@ -105,20 +120,22 @@ async def get_fundamentals(
     #     logger.error(f"Error fetching fundamentals for {symbol}: {e}")
     #     raise HTTPException(status_code=500, detail="Internal server error")
 
-    symbol_clean = symbol.replace('.NS', '').replace('.BO', '')
+    symbol_clean = strip_suffix(symbol)
     logger.warning(f"Returning MOCK fundamentals for {symbol_clean}")
 
-    return FundamentalsResponse(
-        symbol=symbol_clean,
-        years=["Mar 2024", "Mar 2023", "Mar 2022", "Mar 2021", "Mar 2020"],
-        revenue=[10000, 9000, 8000, 7500, 6000],
-        net_profit=[2000, 1800, 1500, 1200, 1000],
-        roce=[25.5, 24.0, 22.5, 20.0, 18.5],
-        roe=[20.5, 19.0, 18.5, 16.0, 15.5],
-        debt_to_equity=[0.1, 0.12, 0.15, 0.2, 0.25],
-        eps=[50.5, 45.0, 40.0, 35.0, 30.0],
-        book_value=[250, 220, 200, 180, 160],
-        pe_ratio=[30.5, 28.0, 25.0, 22.0, 20.0],
-        market_cap=[500000, 450000, 400000, 350000, 300000],
-        source="mock_data (screener disabled)"
+    return PydanticORJSONResponse(
+        FundamentalsResponse.model_construct(
+            symbol=symbol_clean,
+            years=["Mar 2024", "Mar 2023", "Mar 2022", "Mar 2021", "Mar 2020"],
+            revenue=[10000, 9000, 8000, 7500, 6000],
+            net_profit=[2000, 1800, 1500, 1200, 1000],
+            roce=[25.5, 24.0, 22.5, 20.0, 18.5],
+            roe=[20.5, 19.0, 18.5, 16.0, 15.5],
+            debt_to_equity=[0.1, 0.12, 0.15, 0.2, 0.25],
+            eps=[50.5, 45.0, 40.0, 35.0, 30.0],
+            book_value=[250, 220, 200, 180, 160],
+            pe_ratio=[30.5, 28.0, 25.0, 22.0, 20.0],
+            market_cap=[500000, 450000, 400000, 350000, 300000],
+            source="mock_data (screener disabled)"
+        )
     )
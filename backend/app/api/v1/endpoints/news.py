@@ -2,20 +2,97 @@
 News and information endpoints.
 """
 
-from fastapi import APIRouter, Path, Query, Depends
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Path, Query, Depends, Request, Response
 from loguru import logger
 
-from app.api.v1.schemas.responses import NewsResponse, NewsArticle
-from app.core.dependencies import ServiceFactory, get_service_factory
+from app.api.v1.schemas.responses import NewsBatchResponse, NewsResponse
+from app.core.cache import cached
+from app.core.config import settings
+from app.core.http_cache import conditional_get
+from app.core.dependencies import get_news_service
+from app.core.responses import PydanticORJSONResponse
+from app.core.rate_limit import limiter
+from app.services.news import NewsService
 
 router = APIRouter()
 
+# Upper bound on symbols per /news/batch request (each is one upstream fetch on a miss)
+NEWS_BATCH_MAX_SYMBOLS = 20
+
+
+def _to_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Project NewsService article dicts onto the NewsArticle fields.
+
+    Articles stay plain dicts so orjson encodes them directly; building
+    NewsArticle models per article dominated the cost of large responses.
+    """
+    return [
+        {
+            'title': article['title'],
+            'link': article['link'],
+            'source': article['source'],
+            'published': article['published'],
+            'summary': article.get('summary'),
+        }
+        for article in articles
+    ]
+
+
+def _news_envelope(
+    query: str,
+    articles: List[Dict[str, Any]],
+    symbol: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a NewsResponse-shaped payload from raw service articles."""
+    news_articles = _to_articles(articles)
+    return {
+        'symbol': symbol,
+        'query': query,
+        'articles': news_articles,
+        'count': len(news_articles),
+    }
+
+
+def _company_news_query(symbol: str) -> str:
+    """Build the Google News query for a company ("stock India" improves relevance)."""
+    return f"{symbol} stock India"
+
+
+async def _load_company_news(
+    news_service: NewsService,
+    symbol: str,
+    limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Fetch company news through the shared Redis cache.
 
-@router.get("/news", response_model=NewsResponse, tags=["news"])
+    Used by both /news/{symbol} and /news/batch so they share cache entries.
+    """
+    query = _company_news_query(symbol)
+    return await cached(
+        f"news:{symbol.upper()}:{limit}",
+        settings.CACHE_TTL_NEWS,
+        lambda: news_service.get_news(query, limit=limit)
+    )
+
+
+@router.get(
+    "/news",
+    response_model=None,
+    responses={200: {"model": NewsResponse}},
+    tags=["news"]
+)
+@limiter.limit("60/minute")
 async def get_news(
+    request: Request,
+    response: Response,
     q: str = Query(..., min_length=2, description="Search query"),
     limit: int = Query(10, ge=1, le=50, description="Number of articles"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    news_service: NewsService = Depends(get_news_service)
 ):
     """
     Get news articles for a query.
@@ -27,29 +104,22 @@ async def get_news(
     - `/api/v1/news?q=India+stock+market&limit=20` - Market news
     - `/api/v1/news?q=IT+sector+stocks` - IT sector news
     """
-    logger.info(f"Fetching news for query: '{q}'")
+    logger.debug("Fetching news for query: '{}'", q)
 
     try:
-        news_service = factory.create_news_service()
-
-        articles = await news_service.get_news(q, limit=limit)
-
-        # Transform to response format
-        news_articles = [
-            NewsArticle(
-                title=article['title'],
-                link=article['link'],
-                source=article['source'],
-                published=article['published'],
-                summary=article.get('summary')
-            )
-            for article in articles
-        ]
-
-        return NewsResponse(
-            query=q,
-            articles=news_articles,
-            count=len(news_articles)
+        articles = await cached(
+            f"news:query:{q.lower()}:{limit}",
+            settings.CACHE_TTL_NEWS,
+            lambda: news_service.get_news(q, limit=limit)
+        )
+
+        not_modified = conditional_get(request, response, articles, settings.CACHE_TTL_NEWS)
+        if not_modified is not None:
+            return not_modified
+
+        return PydanticORJSONResponse(
+            _news_envelope(q, articles),
+            headers=response.headers
         )
 
     except Exception as e:
@@ -57,11 +127,89 @@ async def get_news(
         return NewsResponse(query=q, articles=[], count=0)
 
 
-@router.get("/news/{symbol}", response_model=NewsResponse, tags=["news"])
+@router.get(
+    "/news/batch",
+    response_model=None,
+    responses={200: {"model": NewsBatchResponse}},
+    tags=["news"]
+)
+@limiter.limit("20/minute")
+async def get_news_batch(
+    request: Request,
+    response: Response,
+    symbols: str = Query(
+        ..., min_length=1, description="Comma-separated stock symbols or company names"
+    ),
+    limit: int = Query(10, ge=1, le=50, description="Number of articles per symbol"),
+    news_service: NewsService = Depends(get_news_service)
+):
+    """
+    Get news for several companies in one request.
+
+    Symbols are fetched concurrently and share the cache with `/news/{symbol}`.
+    Symbols that fail are omitted from `items` with a message in `errors`.
+
+    **Examples:**
+    - `/api/v1/news/batch?symbols=RELIANCE,TCS,INFY` - News for three companies
+    - `/api/v1/news/batch?symbols=HDFCBANK,ICICIBANK&limit=5` - 5 articles each
+    """
+    # Deduplicate (case-insensitive) while keeping request order
+    requested = list(dict.fromkeys(
+        s.strip().upper() for s in symbols.split(",") if s.strip()
+    ))
+
+    if not requested:
+        raise HTTPException(status_code=422, detail="No symbols provided")
+    if len(requested) > NEWS_BATCH_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Too many symbols (max {NEWS_BATCH_MAX_SYMBOLS})"
+        )
+    if any(len(s) > 50 for s in requested):
+        raise HTTPException(status_code=422, detail="Symbol too long (max 50 characters)")
+
+    logger.debug("Fetching batch news for {} symbols", len(requested))
+
+    results = await asyncio.gather(
+        *(_load_company_news(news_service, s, limit) for s in requested),
+        return_exceptions=True
+    )
+
+    items: Dict[str, List[Dict[str, Any]]] = {}
+    errors: Dict[str, str] = {}
+    for symbol, result in zip(requested, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error fetching news for {symbol}: {result}")
+            errors[symbol] = str(result) or result.__class__.__name__
+        else:
+            items[symbol] = _to_articles(result)
+
+    # Partial results are not cacheable
+    if not errors:
+        not_modified = conditional_get(
+            request, response, dict(zip(requested, results)), settings.CACHE_TTL_NEWS
+        )
+        if not_modified is not None:
+            return not_modified
+
+    return PydanticORJSONResponse({'items': items, 'errors': errors}, headers=response.headers)
+
+
+@router.get(
+    "/news/{symbol}",
+    response_model=None,
+    responses={200: {"model": NewsResponse}},
+    tags=["news"]
+)
+@limiter.limit("60/minute")
 async def get_company_news(
-    symbol: str = Path(..., description="Stock symbol or company name"),
+    request: Request,
+    response: Response,
+    symbol: str = Path(
+        ..., min_length=1, max_length=50, description="Stock symbol or company name"
+    ),
     limit: int = Query(10, ge=1, le=50, description="Number of articles"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    news_service: NewsService = Depends(get_news_service)
 ):
     """
     Get news articles for a specific company/stock.
@@ -70,31 +218,19 @@ async def get_company_news(
     - `/api/v1/news/RELIANCE` - News about Reliance
     - `/api/v1/news/TCS?limit=5` - TCS news, max 5 articles
     """
-    logger.info(f"Fetching company news for: {symbol}")
+    logger.debug("Fetching company news for: {}", symbol)
 
     try:
-        news_service = factory.create_news_service()
-
-        # Add "stock India" to query for better results
-        query = f"{symbol} stock India"
-        articles = await news_service.get_news(query, limit=limit)
-
-        news_articles = [
-            NewsArticle(
-                title=article['title'],
-                link=article['link'],
-                source=article['source'],
-                published=article['published'],
-                summary=article.get('summary')
-            )
-            for article in articles
-        ]
-
-        return NewsResponse(
-            symbol=symbol,
-            query=query,
-            articles=news_articles,
-            count=len(news_articles)
+        query = _company_news_query(symbol)
+        articles = await _load_company_news(news_service, symbol, limit)
+
+        not_modified = conditional_get(request, response, articles, settings.CACHE_TTL_NEWS)
+        if not_modified is not None:
+            return not_modified
+
+        return PydanticORJSONResponse(
+            _news_envelope(query, articles, symbol=symbol),
+            headers=response.headers
         )
 
     except Exception as e:
@@ -102,10 +238,18 @@ async def get_company_news(
         return NewsResponse(symbol=symbol, query=symbol, articles=[], count=0)
 
 
-@router.get("/news/market/india", response_model=NewsResponse, tags=["news"])
+@router.get(
+    "/news/market/india",
+    response_model=None,
+    responses={200: {"model": NewsResponse}},
+    tags=["news"]
+)
+@limiter.limit("60/minute")
 async def get_market_news(
+    request: Request,
+    response: Response,
     limit: int = Query(15, ge=1, le=50, description="Number of articles"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    news_service: NewsService = Depends(get_news_service)
 ):
     """
     Get general Indian stock market news.
@@ -114,28 +258,22 @@ async def get_market_news(
     - `/api/v1/news/market/india` - Latest market news
     - `/api/v1/news/market/india?limit=20` - More market news
     """
-    logger.info("Fetching Indian market news")
+    logger.debug("Fetching Indian market news")
 
     try:
-        news_service = factory.create_news_service()
-
-        articles = await news_service.get_market_news(market="India", limit=limit)
-
-        news_articles = [
-            NewsArticle(
-                title=article['title'],
-                link=article['link'],
-                source=article['source'],
-                published=article['published'],
-                summary=article.get('summary')
-            )
-            for article in articles
-        ]
-
-        return NewsResponse(
-            query="India stock market",
-            articles=news_articles,
-            count=len(news_articles)
+        articles = await cached(
+            f"news:market:india:{limit}",
+            settings.CACHE_TTL_NEWS,
+            lambda: news_service.get_market_news(market="India", limit=limit)
+        )
+
+        not_modified = conditional_get(request, response, articles, settings.CACHE_TTL_NEWS)
+        if not_modified is not None:
+            return not_modified
+
+        return PydanticORJSONResponse(
+            _news_envelope("India stock market", articles),
+            headers=response.headers
         )
 
     except Exception as e:
@@ -143,11 +281,19 @@ async def get_market_news(
         return NewsResponse(query="India stock market", articles=[], count=0)
 
 
-@router.get("/news/sector/{sector}", response_model=NewsResponse, tags=["news"])
+@router.get(
+    "/news/sector/{sector}",
+    response_model=None,
+    responses={200: {"model": NewsResponse}},
+    tags=["news"]
+)
+@limiter.limit("60/minute")
 async def get_sector_news(
+    request: Request,
+    response: Response,
     sector: str = Path(..., description="Sector name (IT, Banking, Pharma, etc.)"),
     limit: int = Query(10, ge=1, le=50, description="Number of articles"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    news_service: NewsService = Depends(get_news_service)
 ):
     """
     Get sector-specific news.
@@ -157,28 +303,22 @@ async def get_sector_news(
     - `/api/v1/news/sector/Banking` - Banking sector news
     - `/api/v1/news/sector/Pharma?limit=15` - Pharma news
     """
-    logger.info(f"Fetching news for sector: {sector}")
+    logger.debug("Fetching news for sector: {}", sector)
 
     try:
-        news_service = factory.create_news_service()
-
-        articles = await news_service.get_sector_news(sector=sector, limit=limit)
-
-        news_articles = [
-            NewsArticle(
-                title=article['title'],
-                link=article['link'],
-                source=article['source'],
-                published=article['published'],
-                summary=article.get('summary')
-            )
-            for article in articles
-        ]
-
-        return NewsResponse(
-            query=f"{sector} sector India",
-            articles=news_articles,
-            count=len(news_articles)
+        articles = await cached(
+            f"news:sector:{sector.lower()}:{limit}",
+            settings.CACHE_TTL_NEWS,
+            lambda: news_service.get_sector_news(sector=sector, limit=limit)
+        )
+
+        not_modified = conditional_get(request, response, articles, settings.CACHE_TTL_NEWS)
+        if not_modified is not None:
+            return not_modified
+
+        return PydanticORJSONResponse(
+            _news_envelope(f"{sector} sector India", articles),
+            headers=response.headers
         )
 
     except Exception as e:
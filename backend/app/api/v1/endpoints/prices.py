@@ -2,22 +2,93 @@
 Stock price data endpoints.
 """
 
-from fastapi import APIRouter, Path, Query, Depends, HTTPException
-from loguru import logger
+from typing import Any, Dict, Iterator, List
 
-from app.api.v1.schemas.responses import PricesResponse, PriceData, TechnicalIndicators
-from app.core.dependencies import ServiceFactory, get_service_factory
+from fastapi import APIRouter, Query, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from loguru import logger
+import orjson
+
+from app.api.v1.schemas.responses import PricesColumnarResponse, PricesResponse, TechnicalIndicators
+from app.core.cache import cached
+from app.core.config import settings
+from app.core.errors import handle_upstream_errors
+from app.core.http_cache import conditional_get
+from app.core.symbols import with_ns
+from app.core.dependencies import Symbol, get_yahoo_service
+from app.core.responses import PydanticORJSONResponse
+from app.core.rate_limit import limiter
+from app.services.yahoo import YahooFinanceService
 from app.services.base import ServiceError
 
 router = APIRouter()
 
+# OHLC rows serialized per streamed chunk
+PRICE_CHUNK_ROWS = 256
+
+# Accepted ?format= aliases for the row (array-of-structs) and columnar (struct-of-arrays) layouts
+PRICE_LAYOUTS = {'rows': 'rows', 'aos': 'rows', 'columns': 'columns', 'soa': 'columns'}
+
+# Column order of YahooFinanceService.get_prices()['columns'] / PriceData fields
+PRICE_FIELDS = ('date', 'timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+def _stream_prices(
+    symbol: str,
+    period: str,
+    interval: str,
+    columns: Dict[str, List[Any]]
+) -> Iterator[bytes]:
+    """
+    Serialize a PricesResponse body (row per bar) incrementally.
+
+    Emits the envelope first, then rows in chunks of PRICE_CHUNK_ROWS,
+    so the first bytes go out before the whole series is encoded.
+    """
+    rows = list(zip(*(columns[field] for field in PRICE_FIELDS)))
+
+    yield (
+        b'{"symbol":' + orjson.dumps(symbol)
+        + b',"period":' + orjson.dumps(period)
+        + b',"interval":' + orjson.dumps(interval)
+        + b',"count":' + orjson.dumps(len(rows))
+        + b',"prices":['
+    )
+
+    for start in range(0, len(rows), PRICE_CHUNK_ROWS):
+        chunk = b','.join(
+            orjson.dumps(dict(zip(PRICE_FIELDS, row)))
+            for row in rows[start:start + PRICE_CHUNK_ROWS]
+        )
+        yield chunk if start == 0 else b',' + chunk
+
+    yield b']}'
 
-@router.get("/prices/{symbol}", response_model=PricesResponse, tags=["prices"])
+
+@router.get(
+    "/prices/{symbol}",
+    response_model=None,
+    responses={200: {"model": PricesResponse | PricesColumnarResponse}},
+    tags=["prices"]
+)
+@limiter.limit("30/minute")
+@handle_upstream_errors
 async def get_prices(
-    symbol: str = Path(..., description="Stock symbol"),
-    period: str = Query("1y", description="Time period", regex="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$"),
-    interval: str = Query("1d", description="Data interval", regex="^(1m|2m|5m|15m|30m|60m|90m|1h|1d|5d|1wk|1mo|3mo)$"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    request: Request,
+    response: Response,
+    symbol: Symbol,
+    period: str = Query(
+        "1y", description="Time period", pattern="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$"
+    ),
+    interval: str = Query(
+        "1d", description="Data interval",
+        pattern="^(1m|2m|5m|15m|30m|60m|90m|1h|1d|5d|1wk|1mo|3mo)$"
+    ),
+    layout: str = Query(
+        "rows", alias="format", description="Response layout",
+        pattern="^(rows|aos|columns|soa)$"
+    ),
+    yahoo: YahooFinanceService = Depends(get_yahoo_service)
 ):
     """
     Get historical OHLC price data.
@@ -25,62 +96,75 @@ async def get_prices(
     **Parameters:**
     - `period`: 1d, 5d, 1mo, 3mo, 6mo, 1y (default), 2y, 5y, 10y, ytd, max
     - `interval`: 1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d (default), 5d, 1wk, 1mo, 3mo
+    - `format`: `rows`/`aos` (default, one object per bar) or `columns`/`soa`
+      (parallel arrays, ~half the bytes)
 
     **Examples:**
     - `/api/v1/prices/RELIANCE?period=1y&interval=1d` - 1 year daily data
     - `/api/v1/prices/TCS?period=1mo&interval=1h` - 1 month hourly data
-    - `/api/v1/prices/INFY?period=5y` - 5 years daily data
+    - `/api/v1/prices/INFY?period=5y&format=columns` - 5 years daily data as arrays
 
     **Note:** Intraday intervals (1m, 2m, etc.) are only valid for periods <= 60 days
     """
-    logger.info(f"Fetching prices for {symbol}: period={period}, interval={interval}")
-
-    try:
-        yahoo = factory.create_yahoo_service()
-
-        # Ensure .NS suffix
-        symbol_with_suffix = symbol if '.NS' in symbol or '.BO' in symbol else f"{symbol}.NS"
-
-        data = await yahoo.get_prices(symbol_with_suffix, period=period, interval=interval)
-
-        # Transform to response format
-        prices = [
-            PriceData(
-                date=p['date'],
-                timestamp=p['timestamp'],
-                open=p['open'],
-                high=p['high'],
-                low=p['low'],
-                close=p['close'],
-                volume=p['volume']
-            )
-            for p in data['prices']
-        ]
-
-        return PricesResponse(
-            symbol=data['symbol'],
-            period=period,
-            interval=interval,
-            prices=prices,
-            count=len(prices)
+    logger.debug("Fetching prices for {}: period={}, interval={}", symbol, period, interval)
+
+    # Ensure .NS suffix
+    symbol_with_suffix = with_ns(symbol)
+    layout = PRICE_LAYOUTS[layout]
+
+    data = await cached(
+        f"ohlc:{symbol_with_suffix}:{period}:{interval}",
+        settings.CACHE_TTL_PRICES,
+        lambda: yahoo.get_prices(symbol_with_suffix, period=period, interval=interval)
+    )
+
+    if data.get('status') == 'error':
+        raise ServiceError(data.get('message', 'Unknown error'))
+
+    not_modified = conditional_get(request, response, [layout, data], settings.CACHE_TTL_PRICES)
+    if not_modified is not None:
+        return not_modified
+
+    if layout == "columns":
+        # Already in PricesColumnarResponse shape; one orjson pass, no models
+        return Response(
+            content=orjson.dumps({
+                'symbol': data['symbol'],
+                'period': period,
+                'interval': interval,
+                'columns': data['columns'],
+                'count': data['count']
+            }),
+            media_type="application/json",
+            headers=dict(response.headers)
         )
 
-    except ServiceError as e:
-        logger.error(f"Service error fetching prices for {symbol}: {e}")
-        raise HTTPException(status_code=503, detail=str(e))
-    except ValueError as e:
-        logger.error(f"Invalid parameters for {symbol}: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error fetching prices for {symbol}: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@router.get("/prices/{symbol}/technicals", response_model=TechnicalIndicators, tags=["prices"])
+    # Rows are assembled from our own columns and streamed through
+    # orjson instead of building PriceData models
+    return StreamingResponse(
+        _stream_prices(data['symbol'], period, interval, data['columns']),
+        media_type="application/json",
+        headers=dict(response.headers)
+    )
+
+
+@router.get(
+    "/prices/{symbol}/technicals",
+    response_model=None,
+    responses={200: {"model": TechnicalIndicators}},
+    tags=["prices"]
+)
+@limiter.limit("30/minute")
+@handle_upstream_errors
 async def get_technicals(
-    symbol: str = Path(..., description="Stock symbol"),
-    period: str = Query("1y", description="Period for calculation"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    request: Request,
+    response: Response,
+    symbol: Symbol,
+    period: str = Query(
+        "1y", description="Period for calculation",
+        pattern="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$"
+    ),
+    yahoo: YahooFinanceService = Depends(get_yahoo_service)
 ):
     """
     Get technical indicators (SMA, RSI, trend).
@@ -97,32 +181,35 @@ async def get_technicals(
 
     **Note:** Requires sufficient historical data (at least 200 days for SMA200)
     """
-    logger.info(f"Fetching technicals for {symbol}: period={period}")
-
-    try:
-        yahoo = factory.create_yahoo_service()
-
-        symbol_with_suffix = symbol if '.NS' in symbol or '.BO' in symbol else f"{symbol}.NS"
-
-        data = await yahoo.get_technicals(symbol_with_suffix, period=period)
-
-        # Handle error response
-        if data.get('status') == 'error':
-            raise HTTPException(status_code=503, detail=data.get('message', 'Unknown error'))
-
-        return TechnicalIndicators(
-            current_price=data['current_price'],
-            sma_20=data.get('sma_20'),
-            sma_50=data.get('sma_50'),
-            sma_200=data.get('sma_200'),
-            rsi_14=data.get('rsi_14'),
-            momentum_percent=data.get('momentum_percent'),
-            trend=data.get('trend'),
-            rsi_signal=data.get('rsi_signal')
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching technicals for {symbol}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.debug("Fetching technicals for {}: period={}", symbol, period)
+
+    symbol_with_suffix = with_ns(symbol)
+
+    data = await cached(
+        f"technicals:{symbol_with_suffix}:{period}",
+        settings.CACHE_TTL_PRICES,
+        lambda: yahoo.get_technicals(symbol_with_suffix, period=period)
+    )
+
+    # Handle error response
+    if data.get('status') == 'error':
+        raise HTTPException(status_code=503, detail=data.get('message', 'Unknown error'))
+
+    technicals = TechnicalIndicators.model_construct(
+        current_price=data['current_price'],
+        sma_20=data.get('sma_20'),
+        sma_50=data.get('sma_50'),
+        sma_200=data.get('sma_200'),
+        rsi_14=data.get('rsi_14'),
+        momentum_percent=data.get('momentum_percent'),
+        trend=data.get('trend'),
+        rsi_signal=data.get('rsi_signal')
+    )
+
+    not_modified = conditional_get(
+        request, response, technicals.model_dump(mode='json'), settings.CACHE_TTL_PRICES
+    )
+    if not_modified is not None:
+        return not_modified
+
+    return PydanticORJSONResponse(technicals, headers=response.headers)
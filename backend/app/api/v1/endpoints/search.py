@@ -2,20 +2,34 @@
 Stock symbol search endpoints.
 """
 
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Request, Response
 from loguru import logger
 
-from app.api.v1.schemas.responses import SearchResponse, StockSearchResult
-from app.core.dependencies import ServiceFactory, get_service_factory
+from app.api.v1.schemas.responses import SearchResponse
+from app.core.cache import cached
+from app.core.config import settings
+from app.core.http_cache import conditional_get
+from app.core.dependencies import get_yahoo_service
+from app.core.responses import PydanticORJSONResponse
+from app.core.rate_limit import limiter
+from app.services.yahoo import YahooFinanceService
 
 router = APIRouter()
 
 
-@router.get("/search", response_model=SearchResponse, tags=["search"])
+@router.get(
+    "/search",
+    response_model=None,
+    responses={200: {"model": SearchResponse}},
+    tags=["search"]
+)
+@limiter.limit("60/minute")
 async def search_symbols(
+    request: Request,
+    response: Response,
     q: str = Query(..., min_length=1, description="Search query (symbol or company name)"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
-    factory: ServiceFactory = Depends(get_service_factory)
+    yahoo: YahooFinanceService = Depends(get_yahoo_service)
 ):
     """
     Search for stock symbols by company name or symbol.
@@ -26,28 +40,34 @@ async def search_symbols(
     - `/api/v1/search?q=RELIANCE` - Search for Reliance
     - `/api/v1/search?q=TCS&limit=5` - Search for TCS, max 5 results
     """
-    logger.info(f"Symbol search: query='{q}', limit={limit}")
+    logger.debug("Symbol search: query='{}', limit={}", q, limit)
 
     try:
-        yahoo = factory.create_yahoo_service()
-        results = await yahoo.search_symbols(q, limit=limit)
+        results = await cached(
+            f"search:{q.upper()}:{limit}",
+            settings.CACHE_TTL_SEARCH,
+            lambda: yahoo.search_symbols(q, limit=limit)
+        )
+
+        not_modified = conditional_get(request, response, results, settings.CACHE_TTL_SEARCH)
+        if not_modified is not None:
+            return not_modified
 
-        # Transform to response format
+        # Rows come from our own service: build plain dicts for orjson, skip validation
         search_results = [
-            StockSearchResult(
-                symbol=r['symbol'],
-                name=r['name'],
-                exchange=r['type'],
-                sector=r.get('sector'),
-                industry=r.get('industry')
-            )
+            {
+                'symbol': r['symbol'],
+                'name': r['name'],
+                'exchange': r['type'],
+                'sector': r.get('sector'),
+                'industry': r.get('industry'),
+            }
             for r in results
         ]
 
-        return SearchResponse(
-            query=q,
-            results=search_results,
-            count=len(search_results)
+        return PydanticORJSONResponse(
+            {'query': q, 'results': search_results, 'count': len(search_results)},
+            headers=response.headers
         )
 
     except Exception as e:
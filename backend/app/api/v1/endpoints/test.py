@@ -1,55 +1,57 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends
-from app.core.dependencies import ServiceFactory, get_service_factory
-from app.core.config import settings
+from app.core.dependencies import (
+    Factory,
+    get_news_service,
+    get_nse_service,
+    get_screener_service,
+    get_yahoo_service,
+)
+from app.services.news import NewsService
+from app.services.nse import NSEService
 from app.services.screener import ScreenerService
+from app.services.yahoo import YahooFinanceService
 
 router = APIRouter()
 
 @router.get("/test/yahoo/{symbol}")
 async def test_yahoo(
     symbol: str,
-    factory: ServiceFactory = Depends(get_service_factory)
+    yahoo: YahooFinanceService = Depends(get_yahoo_service)
 ):
-    yahoo = factory.create_yahoo_service()
     return await yahoo.fetch_data(f"{symbol}.NS")
 
 @router.get("/test/nse/{symbol}")
 async def test_nse(
     symbol: str,
-    factory: ServiceFactory = Depends(get_service_factory)
+    nse: NSEService = Depends(get_nse_service)
 ):
-    nse = factory.create_nse_service()
     return await nse.get_shareholding(symbol)
 
 @router.get("/test/news")
 async def test_news(
     q: str,
-    factory: ServiceFactory = Depends(get_service_factory)
+    news: NewsService = Depends(get_news_service)
 ):
-    news = factory.create_news_service()
     return await news.get_news(q, limit=5)
 
 @router.get("/test/screener/{symbol}")
 async def test_screener(
     symbol: str,
-    factory: ServiceFactory = Depends(get_service_factory)
+    screener: Optional[ScreenerService] = Depends(get_screener_service)
 ):
-    if not settings.has_screener_cookie:
-        print("❌ Cookie not set!")
-        return
-    
-    service = ScreenerService(session_cookie=settings.SCREENER_COOKIE)
-    
-    # Test fundamentals
-    data = await service.fetch_data(symbol)
-    
-    print(f"Got {len(data.get('revenue', []))} years of data")
-    
-    if data.get('roce'):
-        print(f"Latest ROCE: {data['roce'][0]:.2f}%")
-    if data.get('roe'):
-        print(f"Latest ROE: {data['roe'][0]:.2f}%")
-    if data.get('debt_to_equity'):
-        print(f"Latest D/E: {data['debt_to_equity'][0]:.2f}")
-
-    return data
+    if screener is None:
+        return {"status": "error", "message": "SCREENER_COOKIE is not configured"}
+
+    return await screener.fetch_data(symbol)
+
+@router.get("/test/all/{symbol}")
+async def test_all(symbol: str, factory: Factory):
+    # One call exercising NSE, Yahoo and news concurrently; failures are per source
+    results = await factory.fetch_all(symbol, news_limit=5)
+    return {
+        source: {"status": "error", "message": str(result)}
+        if isinstance(result, Exception) else result
+        for source, result in results.items()
+    }
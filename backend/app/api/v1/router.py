@@ -6,12 +6,15 @@ Combines all endpoint routers into a single router for the API.
 
 from fastapi import APIRouter
 
+from app.core.config import settings
 from app.api.v1.endpoints import (
     search,
     company,
     prices,
     news,
-    fundamentals
+    fundamentals,
+    admin,
+    test
 )
 
 # Create main API router
@@ -23,3 +26,11 @@ api_router.include_router(company.router, tags=["company"])
 api_router.include_router(prices.router, tags=["prices"])
 api_router.include_router(news.router, tags=["news"])
 api_router.include_router(fundamentals.router, tags=["fundamentals"])
+
+# Admin routes are only exposed in production behind ADMIN_TOKEN
+if not settings.is_production or settings.ADMIN_TOKEN:
+    api_router.include_router(admin.router, tags=["admin"])
+
+# Debug routes (uncached, unthrottled) are never exposed in production
+if not settings.is_production:
+    api_router.include_router(test.router, tags=["test"])
@@ -5,12 +5,30 @@ These Pydantic models define the structure of API responses.
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SerializerFunctionWrapHandler, model_serializer
+
+from app.core.clock import iso_now
+
+
+class CompactModel(BaseModel):
+    """
+    Base for sparse responses: fields that are None are left out of the output.
+
+    Quotes, shareholding, technicals and fundamentals carry many Optional
+    fields that upstream sources often don't fill; omitting them keeps the
+    payload small. Clients should treat a missing key the same as null.
+    """
+
+    @model_serializer(mode="wrap")
+    def _exclude_none(self, handler: SerializerFunctionWrapHandler):
+        # No return annotation: keeps the model's own fields in the OpenAPI schema
+        return {key: value for key, value in handler(self).items() if value is not None}
 
 
 class StockSearchResult(BaseModel):
     """Single stock search result."""
+    model_config = ConfigDict(frozen=True)
+
     symbol: str = Field(..., description="Stock symbol (e.g., 'RELIANCE.NS')")
     name: str = Field(..., description="Company name")
     exchange: str = Field(..., description="Exchange (NSE/BSE)")
@@ -37,6 +55,8 @@ class CompanyInfo(BaseModel):
 
 class PriceData(BaseModel):
     """Single OHLC price data point."""
+    model_config = ConfigDict(frozen=True)
+
     date: str = Field(..., description="Date in YYYY-MM-DD format")
     timestamp: int = Field(..., description="Unix timestamp")
     open: float
@@ -55,7 +75,27 @@ class PricesResponse(BaseModel):
     count: int = Field(..., description="Number of data points")
 
 
-class QuoteResponse(BaseModel):
+class PriceColumns(BaseModel):
+    """OHLC series as parallel arrays (index i of each array is one bar)."""
+    date: List[str] = Field(default_factory=list, description="Dates in YYYY-MM-DD format")
+    timestamp: List[int] = Field(default_factory=list, description="Unix timestamps")
+    open: List[float] = Field(default_factory=list)
+    high: List[float] = Field(default_factory=list)
+    low: List[float] = Field(default_factory=list)
+    close: List[float] = Field(default_factory=list)
+    volume: List[int] = Field(default_factory=list)
+
+
+class PricesColumnarResponse(BaseModel):
+    """Response for historical prices in columnar form (format=columns)."""
+    symbol: str
+    period: str = Field(..., description="Time period (1d, 1mo, 1y, etc.)")
+    interval: str = Field(..., description="Data interval (1d, 1h, etc.)")
+    columns: PriceColumns
+    count: int = Field(..., description="Number of data points")
+
+
+class QuoteResponse(CompactModel):
     """Response for current stock quote."""
     symbol: str
     name: Optional[str] = None
@@ -71,10 +111,10 @@ class QuoteResponse(BaseModel):
     pe_ratio: Optional[float] = None
     week_52_high: Optional[float] = None
     week_52_low: Optional[float] = None
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = Field(default_factory=iso_now)
 
 
-class ShareholdingPattern(BaseModel):
+class ShareholdingPattern(CompactModel):
     """Shareholding pattern data."""
     promoter_percentage: Optional[float] = Field(None, description="Promoter holding %")
     fii_percentage: Optional[float] = Field(None, description="FII holding %")
@@ -86,6 +126,8 @@ class ShareholdingPattern(BaseModel):
 
 class NewsArticle(BaseModel):
     """Single news article."""
+    model_config = ConfigDict(frozen=True)
+
     title: str
     link: str
     source: str
@@ -101,7 +143,19 @@ class NewsResponse(BaseModel):
     count: int
 
 
-class TechnicalIndicators(BaseModel):
+class NewsBatchResponse(BaseModel):
+    """Response for multi-symbol news."""
+    items: Dict[str, List[NewsArticle]] = Field(
+        default_factory=dict,
+        description="Articles keyed by symbol"
+    )
+    errors: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Per-symbol error messages for symbols that could not be loaded"
+    )
+
+
+class TechnicalIndicators(CompactModel):
     """Technical analysis indicators."""
     current_price: float
     sma_20: Optional[float] = Field(None, description="20-day Simple Moving Average")
@@ -113,7 +167,7 @@ class TechnicalIndicators(BaseModel):
     rsi_signal: Optional[str] = Field(None, description="RSI signal (overbought/oversold/neutral)")
 
 
-class FundamentalsResponse(BaseModel):
+class FundamentalsResponse(CompactModel):
     """Response for fundamental data (10-year)."""
     symbol: str
     years: List[str] = Field(default_factory=list, description="Year labels")
@@ -129,6 +183,18 @@ class FundamentalsResponse(BaseModel):
     source: str = Field(default="screener.in")
 
 
+class CompanyOverview(BaseModel):
+    """Composite company view (quote + shareholding + fundamentals)."""
+    symbol: str = Field(..., description="NSE symbol (without suffix)")
+    quote: Optional[QuoteResponse] = None
+    shareholding: Optional[ShareholdingPattern] = None
+    fundamentals: Optional[FundamentalsResponse] = None
+    errors: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Per-section error messages for sections that could not be loaded"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Error response."""
     status: str = Field(default="error")
@@ -0,0 +1,139 @@
+"""
+Redis-backed response cache.
+Read-through caching for upstream data with graceful degradation.
+"""
+
+import re
+from typing import Any, Awaitable, Callable
+
+import orjson
+from loguru import logger
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from app.core import singleflight
+from app.core.config import settings
+from app.core.symbols import strip_suffix
+
+# Redis glob metacharacters, escaped so a symbol only ever matches literally
+_GLOB_CHARS = re.compile(r"([*?\[\]\\])")
+
+# Module-level connection pool (created in FastAPI lifespan)
+_pool: ConnectionPool | None = None
+_client: Redis | None = None
+
+
+async def init_cache() -> None:
+    """
+    Create the Redis connection pool.
+    Called once on application startup.
+    """
+    global _pool, _client
+    _pool = ConnectionPool.from_url(
+        settings.REDIS_URL,
+        password=settings.REDIS_TOKEN or None,
+        socket_connect_timeout=1,
+        socket_timeout=1,
+    )
+    _client = Redis(connection_pool=_pool)
+    logger.info("Redis cache pool initialized")
+
+
+async def close_cache() -> None:
+    """Close the Redis connection pool."""
+    global _pool, _client
+    if _client is not None:
+        await _client.aclose()
+    if _pool is not None:
+        await _pool.disconnect()
+    _pool = None
+    _client = None
+    logger.info("Redis cache pool closed")
+
+
+def get_redis() -> Redis | None:
+    """Get the shared Redis client, or None if the cache is not initialized."""
+    return _client
+
+
+async def cached(
+    key: str,
+    ttl: int,
+    loader: Callable[[], Awaitable[Any]],
+    refresh: bool = False
+) -> Any:
+    """
+    Return the cached value for key, or call loader and cache its result.
+
+    Falls back to calling loader directly if Redis is unavailable.
+    Concurrent misses for the same key share a single loader call.
+    Service error payloads ({"status": "error", ...}) are never cached.
+
+    Args:
+        key: Cache key (e.g., "quote:RELIANCE.NS")
+        ttl: Time to live in seconds
+        loader: Zero-argument callable returning an awaitable with the fresh value
+        refresh: Skip the cache read and overwrite the entry with a fresh value
+
+    Returns:
+        Cached or freshly loaded value
+
+    Usage:
+        data = await cached(f"quote:{symbol}", 60, lambda: yahoo.fetch_data(symbol))
+    """
+    client = _client
+
+    if client is not None and not refresh:
+        try:
+            hit = await client.get(key)
+            if hit is not None:
+                return orjson.loads(hit)
+        except RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+
+    async def load_and_store() -> Any:
+        value = await loader()
+
+        if client is not None and not (isinstance(value, dict) and value.get("status") == "error"):
+            try:
+                payload = orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+                await client.set(key, payload, ex=ttl)
+            except (RedisError, TypeError) as e:
+                logger.warning(f"Cache write failed for {key}: {e}")
+
+        return value
+
+    return await singleflight.do(key, load_and_store)
+
+
+async def invalidate(symbol: str) -> int:
+    """
+    Delete all cached entries for a symbol.
+
+    Matches keys like "quote:RELIANCE.NS", "ohlc:RELIANCE.NS:1y:1d",
+    "shareholding:RELIANCE" and "fundamentals:RELIANCE". Glob characters
+    in the symbol are escaped, so "*" cannot match every key.
+
+    Args:
+        symbol: Stock symbol (with or without .NS/.BO suffix)
+
+    Returns:
+        Number of keys deleted
+    """
+    client = _client
+    if client is None:
+        return 0
+
+    symbol = strip_suffix(symbol.upper())
+    literal = _GLOB_CHARS.sub(r"\\\1", symbol)
+    deleted = 0
+
+    try:
+        for pattern in (f"*:{literal}", f"*:{literal}[.:]*"):
+            keys = [key async for key in client.scan_iter(match=pattern)]
+            if keys:
+                deleted += await client.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed for {symbol}: {e}")
+
+    return deleted
@@ -0,0 +1,28 @@
+"""
+Wall-clock timestamp helpers.
+Cheap ISO timestamps for response payloads.
+"""
+
+import time
+from datetime import datetime
+from typing import Tuple
+
+# (epoch second, ISO string) for the most recent iso_now() call
+_last_iso: Tuple[int, str] = (0, "")
+
+
+def iso_now() -> str:
+    """
+    Current local time as an ISO 8601 string, at one-second resolution.
+
+    The string is rebuilt at most once per second, so hot paths that stamp
+    every payload skip the datetime allocation and formatting.
+
+    Returns:
+        ISO timestamp (e.g., '2024-01-15T09:30:00')
+    """
+    global _last_iso
+    second = int(time.time())
+    if _last_iso[0] != second:
+        _last_iso = (second, datetime.fromtimestamp(second).isoformat())
+    return _last_iso[1]
@@ -3,8 +3,10 @@ Application configuration using Pydantic Settings.
 Loads and validates environment variables.
 """
 
+from functools import cached_property
 from typing import List
-from pydantic import Field, validator
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,6 +18,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Application
@@ -30,9 +33,9 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed CORS origins"
     )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Convert CORS_ORIGINS string to list."""
+        """Convert CORS_ORIGINS string to list (computed once; settings are frozen)."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
     # Database
@@ -42,6 +45,18 @@ class Settings(BaseSettings):
     )
     DATABASE_POOL_SIZE: int = Field(default=5, description="Database connection pool size")
     DATABASE_MAX_OVERFLOW: int = Field(default=10, description="Max overflow connections")
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Replace pooled connections older than this (seconds)"
+    )
+    DATABASE_POOL_TIMEOUT: int = Field(
+        default=10,
+        description="Max wait for a pooled connection (seconds)"
+    )
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(
+        default=1024,
+        description="Prepared statements cached per connection"
+    )
 
     # Redis
     REDIS_URL: str = Field(
@@ -65,6 +80,10 @@ class Settings(BaseSettings):
         default=None,
         description="Screener.in session cookie (required for 10-year fundamentals)"
     )
+    NSE_COOKIE_FILE: str | None = Field(
+        default="~/.cache/stonky/nse_cookies.txt",
+        description="File persisting NSE session cookies across restarts (empty to disable)"
+    )
 
     # AI/LLM
     OPENAI_API_KEY: str | None = Field(default=None, description="OpenAI API key")
@@ -85,8 +104,13 @@ class Settings(BaseSettings):
         default=30,
         description="Access token expiration time in minutes"
     )
+    ADMIN_TOKEN: str | None = Field(
+        default=None,
+        description="Token required in X-Admin-Token for /admin routes"
+    )
 
     # Cache TTL (Time To Live in seconds)
+    CACHE_TTL_QUOTE: int = Field(default=60, description="Quote cache TTL (1 min)")
     CACHE_TTL_PRICES: int = Field(default=300, description="Price data cache TTL (5 min)")
     CACHE_TTL_NEWS: int = Field(default=600, description="News cache TTL (10 min)")
     CACHE_TTL_ANALYSIS: int = Field(default=86400, description="Analysis cache TTL (24 hours)")
@@ -94,6 +118,32 @@ class Settings(BaseSettings):
         default=604800,
         description="Fundamentals cache TTL (7 days)"
     )
+    CACHE_TTL_SHAREHOLDING: int = Field(
+        default=21600,
+        description="Shareholding cache TTL (6 hours)"
+    )
+    CACHE_TTL_SEARCH: int = Field(default=3600, description="Symbol search cache TTL (1 hour)")
+
+    # Cache warming
+    WARM_FUNDAMENTALS_SYMBOLS: str = Field(
+        default="",
+        description="Comma-separated NSE symbols whose fundamentals are prefetched on startup"
+    )
+    WARM_FUNDAMENTALS_INTERVAL: int = Field(
+        default=86400,
+        description="Seconds between refreshes of the prefetched fundamentals (1 day)"
+    )
+
+    # Database maintenance
+    SNAPSHOT_VIEW_REFRESH_INTERVAL: int = Field(
+        default=0,
+        description="Seconds between latest_snapshot_by_kind refreshes (0 = view not used)"
+    )
+
+    @cached_property
+    def warm_fundamentals_symbols_list(self) -> List[str]:
+        """Convert WARM_FUNDAMENTALS_SYMBOLS string to list (computed once; settings are frozen)."""
+        return [s.strip().upper() for s in self.WARM_FUNDAMENTALS_SYMBOLS.split(",") if s.strip()]
 
     # Rate Limiting
     RATE_LIMIT_SCRAPER: int = Field(
@@ -101,8 +151,13 @@ class Settings(BaseSettings):
         description="Max requests per minute to Screener.in"
     )
     RATE_LIMIT_NSE: int = Field(default=20, description="Max requests per minute to NSE")
+    RATE_LIMIT_SCRAPER_CONCURRENCY: int = Field(
+        default=5,
+        description="Max simultaneous in-flight Screener.in requests per client IP"
+    )
 
-    @validator("ENV")
+    @field_validator("ENV", mode="after")
+    @classmethod
     def validate_env(cls, v: str) -> str:
         """Validate ENV is one of allowed values."""
         allowed = ["development", "staging", "production"]
@@ -110,7 +165,8 @@ class Settings(BaseSettings):
             raise ValueError(f"ENV must be one of {allowed}")
         return v
 
-    @validator("LOG_LEVEL")
+    @field_validator("LOG_LEVEL", mode="after")
+    @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate LOG_LEVEL is valid."""
         allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -128,20 +184,20 @@ class Settings(BaseSettings):
         """Check if running in production mode."""
         return self.ENV == "production"
 
-    @property
+    @cached_property
     def has_screener_cookie(self) -> bool:
         """Check if Screener.in cookie is configured."""
-        return bool(self.SCREENER_COOKIE and len(self.SCREENER_COOKIE) > 0)
+        return bool(self.SCREENER_COOKIE)
 
-    @property
+    @cached_property
     def has_openai_key(self) -> bool:
         """Check if OpenAI API key is configured."""
-        return bool(self.OPENAI_API_KEY and len(self.OPENAI_API_KEY) > 0)
+        return bool(self.OPENAI_API_KEY)
 
-    @property
+    @cached_property
     def has_openrouter_key(self) -> bool:
         """Check if OpenRouter API key is configured."""
-        return bool(self.OPENROUTER_API_KEY and len(self.OPENROUTER_API_KEY) > 0)
+        return bool(self.OPENROUTER_API_KEY)
 
 
 # Global settings instance
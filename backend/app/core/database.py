@@ -3,20 +3,42 @@ Database configuration and session management.
 Uses SQLAlchemy 2.0 async engine with AsyncSession.
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from loguru import logger
 
 from app.core.config import settings
 
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB parameters with orjson (numpy values, int keys allowed)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_pre_ping=True,  # Verify connections before using
+    # Refresh connections on a timer instead of a SELECT 1 on every checkout;
+    # pre-ping only in development, where the local database restarts often
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_pre_ping=settings.is_development,
+    # JSONB columns (snapshot payloads, raw Screener dumps) via orjson
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    # Keep hot queries prepared per connection, so PostgreSQL parses and
+    # plans them once rather than on every execution
+    connect_args={
+        "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+    },
 )
 
 # Create async session factory
@@ -34,7 +56,11 @@ Base = declarative_base()
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency function for FastAPI to get database session.
+    Dependency function for FastAPI to get a read-only database session.
+
+    The session is never committed; whatever transaction it opened is
+    rolled back when the request ends. Use get_db_writer for endpoints
+    that modify data.
 
     Usage:
         @router.get("/items")
@@ -42,6 +68,24 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(select(Item))
             return result.scalars().all()
     """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+async def get_db_writer() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function for FastAPI to get a database session that commits.
+
+    Commits after the endpoint returns, or rolls back if it raised.
+
+    Usage:
+        @router.post("/items")
+        async def create_item(db: AsyncSession = Depends(get_db_writer)):
+            db.add(Item(name="x"))
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -50,8 +94,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
             logger.error(f"Database session error: {e}")
             raise
-        finally:
-            await session.close()
 
 
 async def init_db() -> None:
@@ -60,6 +102,8 @@ async def init_db() -> None:
     Only use in development. Use Alembic migrations in production.
     """
     async with engine.begin() as conn:
+        # ix_companies_name_trgm uses the pg_trgm operator class
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables created")
 
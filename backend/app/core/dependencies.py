@@ -3,34 +3,90 @@ FastAPI dependency injection utilities.
 Service factories and shared dependencies.
 """
 
-from typing import Annotated
-from fastapi import Depends
+import asyncio
+from typing import Annotated, Any, Callable, Dict, Optional
+import httpx
+from fastapi import Depends, Path, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_db, get_db_writer
+from app.core.symbols import SYMBOL_PATTERN, SYMBOL_MAX_LENGTH, strip_suffix, with_ns
+from app.services.news import NewsService
+from app.services.nse import NSEService
+from app.services.screener import ScreenerService
+from app.services.yahoo import YahooFinanceService
 
 
 # Type alias for database session dependency
 DBSession = Annotated[AsyncSession, Depends(get_db)]
 
+# Type alias for a database session that commits on success
+DBWriter = Annotated[AsyncSession, Depends(get_db_writer)]
+
+
+def normalize_symbol(
+    symbol: str = Path(
+        ...,
+        min_length=1,
+        max_length=SYMBOL_MAX_LENGTH,
+        pattern=SYMBOL_PATTERN,
+        description="Stock symbol (e.g., 'RELIANCE' or 'RELIANCE.NS')"
+    )
+) -> str:
+    """
+    FastAPI dependency validating the {symbol} path parameter.
+
+    Malformed symbols are rejected with 422 before any upstream call,
+    and case variants collapse to one cache key.
+    """
+    return symbol.upper()
+
+
+# Type alias for validated, upper-cased symbol path parameter
+Symbol = Annotated[str, Depends(normalize_symbol)]
+
 
 class ServiceFactory:
     """
     Factory for creating service instances with proper dependency injection.
     Follows the Factory pattern for clean service instantiation.
+
+    Instances are memoized: each create_* method builds its service once
+    and returns the same object afterwards. The app keeps a single factory
+    in app.state.services (see app.main).
     """
 
-    def __init__(self, config: settings.__class__ = settings):
+    def __init__(
+        self,
+        config: settings.__class__ = settings,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize factory with configuration.
 
         Args:
             config: Application settings instance
+            http_client: Shared pooled HTTP client passed to every service
         """
         self.config = config
-
-    def create_screener_service(self):
+        self.http_client = http_client
+        self._instances: Dict[str, Any] = {}
+
+    def _memoized(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return the cached service called name, building it on first use."""
+        instance = self._instances.get(name)
+        if instance is None:
+            instance = self._instances[name] = build()
+        return instance
+
+    async def aclose(self) -> None:
+        """Drop memoized services and close the shared HTTP client."""
+        self._instances.clear()
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+    def create_screener_service(self) -> ScreenerService:
         """
         Create Screener.in service instance.
 
@@ -40,8 +96,6 @@ class ServiceFactory:
         Raises:
             ValueError: If SCREENER_COOKIE is not configured
         """
-        from app.services.screener import ScreenerService
-
         if not self.config.has_screener_cookie:
             raise ValueError(
                 "SCREENER_COOKIE is not configured. "
@@ -49,40 +103,45 @@ class ServiceFactory:
                 "See backend/README.md for instructions."
             )
 
-        return ScreenerService(
+        return self._memoized('screener', lambda: ScreenerService(
             session_cookie=self.config.SCREENER_COOKIE,
-            timeout=30
-        )
+            timeout=30,
+            http_client=self.http_client
+        ))
 
-    def create_nse_service(self):
+    def create_nse_service(self) -> NSEService:
         """
         Create NSE service instance.
 
         Returns:
             NSEService instance
         """
-        from app.services.nse import NSEService
-        return NSEService(timeout=30)
+        return self._memoized('nse', lambda: NSEService(
+            timeout=30,
+            http_client=self.http_client,
+            cookie_file=self.config.NSE_COOKIE_FILE
+        ))
 
-    def create_yahoo_service(self):
+    def create_yahoo_service(self) -> YahooFinanceService:
         """
         Create Yahoo Finance service instance.
 
         Returns:
             YahooFinanceService instance
         """
-        from app.services.yahoo import YahooFinanceService
-        return YahooFinanceService(timeout=30)
+        return self._memoized('yahoo', lambda: YahooFinanceService(
+            timeout=30,
+            http_client=self.http_client
+        ))
 
-    def create_news_service(self):
+    def create_news_service(self) -> NewsService:
         """
         Create News service instance.
 
         Returns:
             NewsService instance
         """
-        from app.services.news import NewsService
-        return NewsService(timeout=30)
+        return self._memoized('news', lambda: NewsService(timeout=30, http_client=self.http_client))
 
     def create_all_services(self) -> dict:
         """
@@ -107,10 +166,40 @@ class ServiceFactory:
 
         return services
 
+    async def fetch_all(self, symbol: str, news_limit: int = 10) -> Dict[str, Any]:
+        """
+        Fetch NSE quote, Yahoo prices and company news concurrently.
+
+        The upstream calls overlap, so a composite endpoint waits for the
+        slowest source instead of the sum of all three.
 
-def get_service_factory() -> ServiceFactory:
+        Args:
+            symbol: Stock symbol (with or without .NS suffix)
+            news_limit: Maximum number of news articles
+
+        Returns:
+            Dict with 'nse', 'yahoo' and 'news' results; a source that raised
+            is returned as its exception instead of failing the others
+        """
+        base = strip_suffix(symbol.upper())
+
+        nse, yahoo, news = await asyncio.gather(
+            self.create_nse_service().get_quote(base),
+            self.create_yahoo_service().get_prices(with_ns(base)),
+            # get_news adds "stock India" to the query itself
+            self.create_news_service().get_news(base, limit=news_limit),
+            return_exceptions=True
+        )
+
+        return {'nse': nse, 'yahoo': yahoo, 'news': news}
+
+
+def get_service_factory(request: Request) -> ServiceFactory:
     """
-    FastAPI dependency to get service factory.
+    FastAPI dependency to get the app-wide service factory.
+
+    Returns the factory created in the app lifespan, so services (and their
+    pooled HTTP connections) are shared across requests.
 
     Usage:
         @router.get("/analyze/{symbol}")
@@ -121,8 +210,35 @@ def get_service_factory() -> ServiceFactory:
             screener = factory.create_screener_service()
             data = await screener.fetch_fundamentals(symbol)
     """
-    return ServiceFactory()
+    return request.app.state.services
 
 
 # Type alias for service factory dependency
 Factory = Annotated[ServiceFactory, Depends(get_service_factory)]
+
+
+# Service singletons (created once in the app lifespan, see app.main)
+
+def get_yahoo_service(request: Request) -> YahooFinanceService:
+    """FastAPI dependency returning the shared YahooFinanceService."""
+    return request.app.state.yahoo
+
+
+def get_nse_service(request: Request) -> NSEService:
+    """FastAPI dependency returning the shared NSEService."""
+    return request.app.state.nse
+
+
+def get_news_service(request: Request) -> NewsService:
+    """FastAPI dependency returning the shared NewsService."""
+    return request.app.state.news
+
+
+def get_screener_service(request: Request) -> Optional[ScreenerService]:
+    """
+    FastAPI dependency returning the shared ScreenerService.
+
+    Returns:
+        ScreenerService instance, or None if SCREENER_COOKIE is not configured
+    """
+    return request.app.state.screener
@@ -0,0 +1,52 @@
+"""
+Endpoint error handling.
+Maps service-layer exceptions to HTTP responses in one place.
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+from fastapi import HTTPException
+from loguru import logger
+
+from app.services.base import ServiceError
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def handle_upstream_errors(fn: F) -> F:
+    """
+    Translate exceptions raised by an endpoint into HTTP errors.
+
+    - HTTPException: passed through unchanged
+    - ServiceError: 503 (upstream source failed)
+    - ValueError: 400 (invalid parameters)
+    - Anything else: 500, logged with traceback
+
+    Apply below the router/limiter decorators so FastAPI and slowapi
+    still see the original signature (functools.wraps).
+
+    Usage:
+        @router.get("/company/{symbol}/quote")
+        @limiter.limit("30/minute")
+        @handle_upstream_errors
+        async def get_quote(request: Request, symbol: Symbol): ...
+    """
+
+    @wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await fn(*args, **kwargs)
+        except HTTPException:
+            raise
+        except ServiceError as e:
+            logger.error(f"Service error in {fn.__name__}: {e}")
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        except ValueError as e:
+            logger.error(f"Invalid parameters in {fn.__name__}: {e}")
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        except Exception:
+            logger.exception(f"Unhandled error in {fn.__name__}")
+            raise HTTPException(status_code=500, detail="Internal server error") from None
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,42 @@
+"""
+Shared outbound HTTP client.
+One pooled httpx.AsyncClient per process, owned by the FastAPI lifespan.
+"""
+
+import ssl
+from importlib.util import find_spec
+
+import httpx
+
+# HTTP/2 multiplexes concurrent requests to one host over a single
+# connection; httpx needs the optional h2 package (httpx[http2]) for it
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Built once; creating an SSL context loads the CA bundle from disk
+SSL_CONTEXT = ssl.create_default_context()
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=75,
+)
+
+
+def create_http_client(timeout: float = 30) -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used by all services.
+
+    Args:
+        timeout: Default request timeout in seconds
+
+    Returns:
+        httpx.AsyncClient with keep-alive connection pooling (and HTTP/2
+        when h2 is installed)
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        verify=SSL_CONTEXT,
+        limits=HTTP_LIMITS,
+        timeout=timeout,
+        follow_redirects=True,
+    )
@@ -0,0 +1,73 @@
+"""
+HTTP caching headers (Cache-Control / ETag) for GET endpoints.
+Lets browsers and CDNs revalidate with 304 Not Modified.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response
+
+
+def compute_etag(data: Any) -> str:
+    """
+    Compute a strong ETag for a JSON-serializable payload.
+
+    Args:
+        data: Payload the response is built from
+
+    Returns:
+        Quoted ETag value (e.g., '"3f2a9c0d1b4e5f60"')
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS),
+        digest_size=8,
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_get(
+    request: Request,
+    response: Response,
+    data: Any,
+    max_age: int
+) -> Optional[Response]:
+    """
+    Attach ETag/Cache-Control headers, or short-circuit with 304.
+
+    Args:
+        request: Incoming request (reads If-None-Match)
+        response: FastAPI sub-response whose headers are merged into the reply
+        data: Payload the response body is built from
+        max_age: Seconds browsers/CDNs may reuse the response
+
+    Returns:
+        A 304 response if the client's copy is current, else None
+
+    Usage:
+        if (not_modified := conditional_get(request, response, data, 60)) is not None:
+            return not_modified
+    """
+    headers = {
+        "ETag": compute_etag(data),
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -14,6 +14,10 @@ def setup_logging() -> None:
 
     Development: Pretty console output
     Production: JSON structured logs
+
+    All sinks are enqueued: records are written by a background thread,
+    so request handlers never block on stdout or file I/O (including
+    rotation). Call `await logger.complete()` on shutdown to flush.
     """
     # Remove default handler
     logger.remove()
@@ -26,6 +30,7 @@ def setup_logging() -> None:
             colorize=True,
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
             level=settings.LOG_LEVEL,
+            enqueue=True,
         )
     else:
         # JSON format for production (easier to parse)
@@ -33,6 +38,7 @@ def setup_logging() -> None:
             sys.stdout,
             serialize=True,  # JSON output
             level=settings.LOG_LEVEL,
+            enqueue=True,
         )
 
     # File handler (rotate at 10 MB)
@@ -43,6 +49,7 @@ def setup_logging() -> None:
         compression="zip",
         level=settings.LOG_LEVEL,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        enqueue=True,
     )
 
     # Error file handler (errors only)
@@ -53,6 +60,7 @@ def setup_logging() -> None:
         compression="zip",
         level="ERROR",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        enqueue=True,
     )
 
     logger.info(f"Logging configured for {settings.ENV} environment")
@@ -0,0 +1,77 @@
+"""
+Periodic database maintenance.
+refresh_snapshot_views runs in the FastAPI lifespan (opt-in);
+ensure_price_partitions runs from scripts/create_price_partitions.py.
+"""
+
+import asyncio
+from datetime import date
+from typing import Awaitable, Callable
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.price import PriceRepository
+from app.repositories.snapshot import SnapshotRepository
+
+# Advisory lock key serializing partition DDL across processes and hosts
+_PARTITION_LOCK_ID = 7_260_001
+
+
+async def refresh_snapshot_views() -> None:
+    """Refresh latest_snapshot_by_kind so get_latest() sees new snapshots."""
+    async with AsyncSessionLocal() as session:
+        await SnapshotRepository(session).refresh_latest()
+        await session.commit()
+
+
+async def ensure_price_partitions(years_ahead: int = 1) -> bool:
+    """
+    Create prices_ohlc partitions from this year to years_ahead if missing.
+
+    Meant for a daily cron (scripts/create_price_partitions.py), so next
+    year's partition exists months before the first bar dated in it;
+    prices_ohlc has no DEFAULT partition to catch rows. The DDL runs under
+    a transaction-scoped advisory lock, so overlapping runs skip instead
+    of racing.
+
+    Args:
+        years_ahead: Future years to cover besides the current one
+
+    Returns:
+        False if another run held the lock, True otherwise
+    """
+    year = date.today().year
+    async with AsyncSessionLocal() as session:
+        locked = await session.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": _PARTITION_LOCK_ID}
+        )
+        if not locked:
+            return False
+        prices = PriceRepository(session)
+        for partition_year in range(year, year + years_ahead + 1):
+            await prices.create_year_partition(partition_year)
+        await session.commit()
+    return True
+
+
+async def run_periodic(job: Callable[[], Awaitable[None]], interval: int, name: str) -> None:
+    """
+    Run job now, then every interval seconds, until cancelled.
+
+    A failing run (e.g., the database is briefly unreachable) is logged
+    and retried on the next tick rather than stopping the loop.
+
+    Args:
+        job: Zero-argument coroutine function
+        interval: Seconds between runs
+        name: Job name for logs
+    """
+    while True:
+        try:
+            await job()
+            logger.debug("Maintenance job {} done", name)
+        except Exception as e:
+            logger.warning(f"Maintenance job {name} failed: {e}")
+        await asyncio.sleep(interval)
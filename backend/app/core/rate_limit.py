@@ -0,0 +1,95 @@
+"""
+Rate limiting for endpoints that proxy third-party APIs.
+
+- Per-IP request rate limits (slowapi, Redis-backed)
+- Per-IP concurrent request caps (Redis sorted set + Lua)
+"""
+
+import time
+import uuid
+from typing import AsyncGenerator, Callable
+
+from fastapi import HTTPException, Request
+from loguru import logger
+from redis.exceptions import RedisError
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.core.cache import get_redis
+from app.core.config import settings
+
+# Per-IP rate limiter (falls back to in-memory counters if Redis is down)
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.REDIS_URL,
+    in_memory_fallback_enabled=True,
+)
+
+# Atomically drop expired entries and claim a slot if under the limit.
+# KEYS[1] = zset key; ARGV = now, window (s), limit, request id
+_ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1] - ARGV[2])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Entries older than this are treated as leaked (crashed worker) and released
+_CONCURRENCY_WINDOW = 60
+
+
+def concurrency_limit(scope: str, max_in_flight: int) -> Callable:
+    """
+    Build a dependency that caps simultaneous in-flight requests per client IP.
+
+    Args:
+        scope: Limit name (e.g., "screener")
+        max_in_flight: Maximum concurrent requests per IP
+
+    Returns:
+        FastAPI dependency raising 429 when the cap is reached
+
+    Usage:
+        @router.get(
+            "/fundamentals/{symbol}",
+            dependencies=[Depends(concurrency_limit("screener", 5))]
+        )
+    """
+
+    async def dependency(request: Request) -> AsyncGenerator[None, None]:
+        client = get_redis()
+        key = f"concurrency:{scope}:{get_remote_address(request)}"
+        request_id = uuid.uuid4().hex
+        acquired = False
+
+        if client is not None:
+            try:
+                allowed = await client.eval(
+                    _ACQUIRE_SCRIPT, 1, key,
+                    time.time(), _CONCURRENCY_WINDOW, max_in_flight, request_id
+                )
+                if not allowed:
+                    raise HTTPException(
+                        status_code=429,
+                        detail=(
+                            f"Too many concurrent requests (max {max_in_flight}). "
+                            "Please retry shortly."
+                        )
+                    )
+                acquired = True
+            except RedisError as e:
+                logger.warning(f"Concurrency limiter unavailable for {key}: {e}")
+
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    await client.zrem(key, request_id)
+                except RedisError as e:
+                    logger.warning(f"Failed to release concurrency slot {key}: {e}")
+
+    return dependency
@@ -0,0 +1,47 @@
+"""
+orjson-backed JSON response that serializes Pydantic models directly.
+Skips FastAPI's jsonable_encoder pass and stdlib json.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def _default(obj: Any) -> Any:
+    """orjson fallback for types it doesn't serialize natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class PydanticORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, accepting Pydantic models as content.
+
+    Returning this from an endpoint bypasses response_model validation and
+    jsonable_encoder; the response_model is still used for the OpenAPI schema.
+    Headers set on an injected `response: Response` are not merged
+    automatically, so pass them through explicitly.
+
+    Usage:
+        return PydanticORJSONResponse(quote, headers=response.headers)
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            # Every model class carries a compiled pydantic-core serializer;
+            # dump straight to JSON bytes without an intermediate dict
+            try:
+                return content.__pydantic_serializer__.to_json(content, warnings=False)
+            except PydanticSerializationError:
+                pass  # e.g. numpy scalars in a model_construct()ed model
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
@@ -0,0 +1,48 @@
+"""
+In-process request coalescing (singleflight).
+Concurrent calls for the same key share one in-flight upstream call.
+"""
+
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict
+
+# In-flight calls keyed by cache key
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def do(key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run fn once per key at a time; concurrent callers await the same result.
+
+    fn runs in its own task, not in the first caller's: cancelling any
+    caller (e.g. its client disconnected), the first one included, only
+    stops that caller's wait, never the shared call the others await.
+
+    Args:
+        key: Deduplication key (e.g., "prices:RELIANCE.NS:1y:1d")
+        fn: Zero-argument callable returning an awaitable
+
+    Returns:
+        Result of fn (shared by all concurrent callers)
+
+    Raises:
+        Whatever fn raised, re-raised in every waiting caller
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fn())
+        _inflight[key] = task
+        task.add_done_callback(partial(_finish, key))
+
+    # shield: a cancelled caller must not cancel the shared call
+    return await asyncio.shield(task)
+
+
+def _finish(key: str, task: asyncio.Future) -> None:
+    """Forget a finished call so the next do() for key starts a fresh one."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        # Mark retrieved so a call whose callers all left doesn't log a warning
+        task.exception()
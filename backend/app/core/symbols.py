@@ -0,0 +1,68 @@
+"""
+Stock symbol normalization helpers.
+Memoized so popular tickers resolve with a single dict lookup.
+"""
+
+import re
+from functools import lru_cache
+
+# Exchange suffixes used by Yahoo Finance
+EXCHANGE_SUFFIXES = ('.NS', '.BO')
+
+# Allowed characters in a ticker (NSE uses '&' and '-', e.g. 'M&M', 'BAJAJ-AUTO')
+SYMBOL_PATTERN = r"^[A-Za-z0-9.&_-]+$"
+SYMBOL_MAX_LENGTH = 20
+
+# Upper-cased form of SYMBOL_PATTERN with the length bound, checked in one pass
+_NORMALIZED_SYMBOL_RE = re.compile(rf"[A-Z0-9.&_-]{{1,{SYMBOL_MAX_LENGTH}}}")
+
+
+@lru_cache(maxsize=4096)
+def normalize_symbol(symbol: str) -> str:
+    """
+    Strip and upper-case a symbol, validating it against SYMBOL_PATTERN.
+
+    Args:
+        symbol: Raw symbol (e.g., ' reliance.ns ')
+
+    Returns:
+        Normalized symbol (e.g., 'RELIANCE.NS')
+
+    Raises:
+        ValueError: If the symbol is empty, too long or has invalid characters
+    """
+    normalized = symbol.strip().upper()
+    if not _NORMALIZED_SYMBOL_RE.fullmatch(normalized):
+        raise ValueError(
+            f"Invalid symbol '{symbol}': expected 1-{SYMBOL_MAX_LENGTH} letters, "
+            f"digits or '.', '&', '_', '-'"
+        )
+    return normalized
+
+
+@lru_cache(maxsize=4096)
+def with_ns(symbol: str) -> str:
+    """
+    Ensure a symbol carries an exchange suffix, defaulting to NSE.
+
+    Args:
+        symbol: Symbol with or without suffix (e.g., 'RELIANCE', 'TCS.BO')
+
+    Returns:
+        Yahoo Finance symbol (e.g., 'RELIANCE.NS', 'TCS.BO')
+    """
+    return symbol if symbol.endswith(EXCHANGE_SUFFIXES) else symbol + '.NS'
+
+
+@lru_cache(maxsize=4096)
+def strip_suffix(symbol: str) -> str:
+    """
+    Remove the .NS/.BO exchange suffix (NSE APIs and Screener use bare symbols).
+
+    Args:
+        symbol: Symbol with or without suffix
+
+    Returns:
+        Bare symbol (e.g., 'RELIANCE')
+    """
+    return symbol[:-3] if symbol.endswith(EXCHANGE_SUFFIXES) else symbol
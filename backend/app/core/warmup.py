@@ -0,0 +1,79 @@
+"""
+Background cache warming.
+Prefetches Screener.in fundamentals for a watchlist into the Redis cache.
+"""
+
+import asyncio
+from typing import Sequence
+
+from loguru import logger
+
+from app.core.cache import cached
+from app.core.config import settings
+from app.services.screener import ScreenerService
+
+
+async def warm_fundamentals(
+    screener: ScreenerService,
+    symbols: Sequence[str],
+    refresh: bool = False
+) -> int:
+    """
+    Load fundamentals for symbols into the cache read by /company/{symbol}/full.
+
+    Symbols are fetched concurrently (ScreenerService bounds how many are
+    in flight); one failing symbol does not stop the others.
+
+    Args:
+        screener: Screener.in service
+        symbols: NSE symbols without suffix (e.g., ['RELIANCE', 'TCS'])
+        refresh: Re-fetch symbols that are already cached
+
+    Returns:
+        Number of symbols cached successfully
+    """
+    results = await asyncio.gather(
+        *(
+            cached(
+                f"fundamentals:{symbol}",
+                settings.CACHE_TTL_FUNDAMENTALS,
+                lambda symbol=symbol: screener.fetch_data(symbol),
+                refresh=refresh
+            )
+            for symbol in symbols
+        ),
+        return_exceptions=True
+    )
+
+    warmed = 0
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Fundamentals warm-up failed for {symbol}: {result}")
+        else:
+            warmed += 1
+    return warmed
+
+
+async def run_fundamentals_warmer(
+    screener: ScreenerService,
+    symbols: Sequence[str],
+    interval: int
+) -> None:
+    """
+    Warm fundamentals now, then refresh them every interval seconds.
+
+    The first pass only fills symbols missing from the cache, so a restart
+    with a populated Redis costs no Screener.in requests. Runs until
+    cancelled (on application shutdown).
+
+    Args:
+        screener: Screener.in service
+        symbols: NSE symbols without suffix
+        interval: Seconds between refreshes
+    """
+    refresh = False
+    while True:
+        warmed = await warm_fundamentals(screener, symbols, refresh=refresh)
+        logger.info(f"Warmed fundamentals for {warmed}/{len(symbols)} symbols")
+        refresh = True
+        await asyncio.sleep(interval)
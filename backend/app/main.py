@@ -3,17 +3,25 @@ FastAPI application entry point.
 Main application setup with middleware, CORS, and routers.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from brotli_asgi import BrotliMiddleware
 from loguru import logger
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.core.database import close_db
-from app.api.v1.endpoints import test
+from app.core.cache import init_cache, close_cache
+from app.core.dependencies import ServiceFactory
+from app.core.http import create_http_client
+from app.core.maintenance import refresh_snapshot_views, run_periodic
+from app.core.rate_limit import limiter
+from app.core.responses import PydanticORJSONResponse
+from app.core.warmup import run_fundamentals_warmer
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -23,9 +31,20 @@ async def lifespan(app: FastAPI):
     Startup:
         - Configure logging
         - Log configuration status
+        - Initialize Redis cache pool
+        - Create shared HTTP client (app.state.http)
+        - Create the service factory (app.state.services) and its
+          singletons (app.state.yahoo, .nse, .news, .screener)
+        - Start background jobs: warming WARM_FUNDAMENTALS_SYMBOLS and
+          (if SNAPSHOT_VIEW_REFRESH_INTERVAL > 0) refreshing the
+          latest-snapshot view
 
     Shutdown:
+        - Stop the background jobs
+        - Close the service factory and shared HTTP client
+        - Close Redis cache pool
         - Close database connections
+        - Flush queued log records
     """
     # Startup
     setup_logging()
@@ -40,11 +59,41 @@ async def lifespan(app: FastAPI):
     logger.info(f"OpenAI configured: {settings.has_openai_key}")
     logger.info(f"OpenRouter configured: {settings.has_openrouter_key}")
 
+    await init_cache()
+    app.state.http = create_http_client()
+
+    factory = app.state.services = ServiceFactory(http_client=app.state.http)
+    app.state.yahoo = factory.create_yahoo_service()
+    app.state.nse = factory.create_nse_service()
+    app.state.news = factory.create_news_service()
+    app.state.screener = factory.create_screener_service() if settings.has_screener_cookie else None
+
+    background = []
+    # Opt-in: needs Postgres with the latest_snapshot_by_kind migration
+    if settings.SNAPSHOT_VIEW_REFRESH_INTERVAL > 0:
+        background.append(asyncio.create_task(run_periodic(
+            refresh_snapshot_views,
+            settings.SNAPSHOT_VIEW_REFRESH_INTERVAL,
+            "refresh_snapshot_views"
+        )))
+    if app.state.screener is not None and settings.warm_fundamentals_symbols_list:
+        background.append(asyncio.create_task(run_fundamentals_warmer(
+            app.state.screener,
+            settings.warm_fundamentals_symbols_list,
+            settings.WARM_FUNDAMENTALS_INTERVAL
+        )))
+
     yield
 
     # Shutdown
     logger.info("Shutting down Stonky FastAPI Backend")
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await app.state.services.aclose()
+    await close_cache()
     await close_db()
+    await logger.complete()
 
 
 # Create FastAPI application
@@ -54,9 +103,15 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/docs" if settings.DEBUG else None,  # Disable docs in production
     redoc_url="/redoc" if settings.DEBUG else None,
+    openapi_url="/openapi.json" if settings.DEBUG else None,  # Never build the schema without docs
     lifespan=lifespan,
+    default_response_class=PydanticORJSONResponse,
 )
 
+# Rate limiting (per client IP)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -66,8 +121,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# GZip compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Compression middleware: Brotli when the client accepts it, else gzip.
+# Quality 4 is close to gzip-9 ratio on repetitive JSON for far less CPU.
+# Bodies under ~one TCP segment (1400 bytes) go out uncompressed: they
+# cost a packet either way, so compressing them only burns CPU.
+app.add_middleware(BrotliMiddleware, quality=4, mode="text", minimum_size=1400, gzip_fallback=True)
 
 
 # Health check endpoint
@@ -77,7 +135,7 @@ async def health_check():
     Health check endpoint.
     Returns application status and configuration info.
     """
-    return JSONResponse(
+    return PydanticORJSONResponse(
         content={
             "status": "healthy",
             "environment": settings.ENV,
@@ -101,8 +159,6 @@ async def root():
         "health": "/health",
     }
 
-app.include_router(test.router, prefix="/api/v1", tags=["test"])
-
 # API v1 router
 from app.api.v1.router import api_router
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
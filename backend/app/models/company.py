@@ -3,10 +3,8 @@ Company model - Core entity for stock analysis.
 """
 
 from datetime import datetime
-from sqlalchemy import String, DateTime, Index
+from sqlalchemy import BigInteger, String, DateTime, Identity, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
 from app.core.database import Base
 
@@ -16,7 +14,7 @@ class Company(Base):
     Company entity representing a stock/security.
 
     Attributes:
-        id: Unique identifier (UUID)
+        id: Unique identifier (internal; symbol is the external key)
         symbol: Stock symbol (e.g., "RELIANCE.NS")
         isin: International Securities Identification Number
         name: Company name (e.g., "Reliance Industries Limited")
@@ -27,11 +25,11 @@ class Company(Base):
 
     __tablename__ = "companies"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+    # 8-byte identity keeps btree inserts sequential and child FKs small
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True,
     )
 
     symbol: Mapped[str] = mapped_column(
@@ -63,28 +61,37 @@ class Company(Base):
         comment="Sector classification",
     )
 
+    # Naive UTC timestamps filled in by PostgreSQL, not sent with each INSERT
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
+        onupdate=func.timezone("utc", func.now()),
         nullable=False,
     )
 
+    # Server-side created_at/updated_at come back via RETURNING on INSERT and
+    # UPDATE, so they are loaded without a refresh (or an async lazy load)
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Trigram GIN (pg_trgm) so name ILIKE '%query%' autocomplete is an
+        # index probe rather than a sequential scan
+        Index(
+            "ix_companies_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
     # Relationships (to be added as we build other models)
     # snapshots: Mapped[list["Snapshot"]] = relationship(back_populates="company")
     # financials: Mapped[list["FinancialsAnnual"]] = relationship(back_populates="company")
     # prices: Mapped[list["PriceOHLC"]] = relationship(back_populates="company")
 
-    # Indexes
-    __table_args__ = (
-        Index("ix_companies_symbol_sector", "symbol", "sector"),
-    )
-
     def __repr__(self) -> str:
         return f"<Company(symbol={self.symbol}, name={self.name})>"
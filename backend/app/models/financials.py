@@ -4,7 +4,7 @@ Stores 10-year historical data from Screener.in.
 """
 
 from datetime import datetime, date
-from sqlalchemy import String, DateTime, Float, Integer, ForeignKey, Index, Date
+from sqlalchemy import BigInteger, String, DateTime, Float, Integer, ForeignKey, Index, Date, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
@@ -46,8 +46,8 @@ class FinancialsAnnual(Base):
         default=uuid.uuid4,
     )
 
-    company_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+    company_id: Mapped[int] = mapped_column(
+        BigInteger,
         ForeignKey("companies.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -144,16 +144,17 @@ class FinancialsAnnual(Base):
         comment="Complete JSON from Screener.in",
     )
 
+    # Naive UTC stamped by PostgreSQL, not sent with each INSERT
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
+        onupdate=func.timezone("utc", func.now()),
         nullable=False,
     )
 
@@ -161,9 +162,18 @@ class FinancialsAnnual(Base):
     # company: Mapped["Company"] = relationship(back_populates="financials")
 
     # Composite unique constraint: one record per company per year
+    # Server-side created_at/updated_at come back via RETURNING on INSERT and
+    # UPDATE, so they are loaded without a refresh (or an async lazy load)
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("ix_financials_company_year", "company_id", "fiscal_year", unique=True),
         Index("ix_financials_year", "fiscal_year"),
+        # Containment (@>) queries on the raw Screener.in payload
+        Index(
+            "ix_financials_raw_gin", "raw_data",
+            postgresql_using="gin", postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -184,8 +194,8 @@ class FinancialsQuarterly(Base):
         default=uuid.uuid4,
     )
 
-    company_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+    company_id: Mapped[int] = mapped_column(
+        BigInteger,
         ForeignKey("companies.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -204,11 +214,26 @@ class FinancialsQuarterly(Base):
 
     raw_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        onupdate=func.timezone("utc", func.now()),
+        nullable=False,
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
 
     __table_args__ = (
         Index("ix_financials_quarterly_company_date", "company_id", "quarter_date", unique=True),
+        Index(
+            "ix_financials_quarterly_raw_gin", "raw_data",
+            postgresql_using="gin", postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
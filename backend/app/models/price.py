@@ -3,7 +3,7 @@ Price models for historical OHLC data.
 """
 
 from datetime import datetime, date
-from sqlalchemy import Float, ForeignKey, Index, Date, DateTime
+from sqlalchemy import BigInteger, Float, ForeignKey, Index, Date, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -17,6 +17,13 @@ class PriceOHLC(Base):
 
     Source: Yahoo Finance
 
+    The table is range-partitioned by date, one partition per year
+    (prices_ohlc_<year>, plus prices_ohlc_history before 2000), so the
+    primary key includes date. Partitions are created by migrations and,
+    a year ahead, by the daily scripts/create_price_partitions.py cron
+    (PriceRepository.create_year_partition()); Base.metadata.create_all()
+    creates only the parent table.
+
     Attributes:
         id: Unique identifier
         company_id: Reference to Company
@@ -37,17 +44,18 @@ class PriceOHLC(Base):
         default=uuid.uuid4,
     )
 
-    company_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+    company_id: Mapped[int] = mapped_column(
+        BigInteger,
         ForeignKey("companies.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
 
+    # Partition key, so part of the primary key
     date: Mapped[date] = mapped_column(
         Date,
+        primary_key=True,
         nullable=False,
-        index=True,
         comment="Trading date",
     )
 
@@ -83,7 +91,7 @@ class PriceOHLC(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
         nullable=False,
     )
 
@@ -91,7 +99,13 @@ class PriceOHLC(Base):
     # Index for efficient time-series queries
     __table_args__ = (
         Index("ix_prices_company_date", "company_id", "date", unique=True),
-        Index("ix_prices_date", "date"),
+        # Rows arrive in date order, so a BRIN index (a few KB) serves
+        # cross-company date-range scans in place of a B-tree on date
+        Index(
+            "ix_prices_date_brin", "date",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
     def __repr__(self) -> str:
@@ -3,14 +3,19 @@ Base repository pattern for database operations.
 Provides generic CRUD operations for all models.
 """
 
-from typing import Generic, TypeVar, Type, Any, Sequence
-from sqlalchemy import select, update, delete
+from typing import AsyncIterator, Generic, TypeVar, Type, Any, Dict, List, Sequence, Tuple
+from sqlalchemy import Executable, bindparam, select, update, delete, insert, literal, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
 # Type variable for model classes
 ModelType = TypeVar("ModelType")
 
+# Filter statements built by BaseRepository._filtered(), keyed by
+# (model, statement kind, filter shape)
+_FILTER_STATEMENTS: Dict[Tuple[Any, ...], Executable] = {}
+
 
 class BaseRepository(Generic[ModelType]):
     """
@@ -39,6 +44,45 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
 
+    def _filtered(self, kind: str, filters: Dict[str, Any]) -> Tuple[Executable, Dict[str, Any]]:
+        """
+        Get the cached "select"/"exists"/"count" statement for a filter shape.
+
+        Filter values are bound parameters, so each (model, kind, columns)
+        shape is built once and every later call with the same columns reuses
+        the statement object and its compiled SQL. None values become
+        IS NULL and are part of the shape.
+
+        Args:
+            kind: Statement kind: "select", "exists" or "count"
+            filters: Column=value pairs
+
+        Returns:
+            Tuple of (statement, bind parameters)
+        """
+        shape = tuple((key, value is None) for key, value in filters.items())
+        cache_key = (self.model, kind, shape)
+
+        statement = _FILTER_STATEMENTS.get(cache_key)
+        if statement is None:
+            if kind == "select":
+                query = select(self.model)
+            elif kind == "count":
+                query = select(func.count()).select_from(self.model)
+            else:
+                # SELECT EXISTS (SELECT 1 ...): no columns (or TOASTed JSONB) are fetched
+                query = select(literal(1)).select_from(self.model)
+
+            for key, is_null in shape:
+                column = getattr(self.model, key)
+                query = query.where(column.is_(None) if is_null else column == bindparam(key))
+
+            statement = select(query.exists()) if kind == "exists" else query
+            _FILTER_STATEMENTS[cache_key] = statement
+
+        params = {key: value for key, value in filters.items() if value is not None}
+        return statement, params
+
     async def get(self, id: Any) -> ModelType | None:
         """
         Get a single record by ID.
@@ -61,11 +105,8 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Model instance or None if not found
         """
-        query = select(self.model)
-        for key, value in filters.items():
-            query = query.where(getattr(self.model, key) == value)
-
-        result = await self.db.execute(query)
+        query, params = self._filtered("select", filters)
+        result = await self.db.execute(query, params)
         return result.scalar_one_or_none()
 
     async def get_many(
@@ -86,22 +127,49 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             List of model instances
         """
-        query = select(self.model)
-
-        # Apply filters
-        for key, value in filters.items():
-            query = query.where(getattr(self.model, key) == value)
+        query, params = self._filtered("select", filters)
 
         # Apply pagination
         query = query.offset(skip).limit(limit)
 
-        result = await self.db.execute(query)
+        result = await self.db.execute(query, params)
         return result.scalars().all()
 
+    async def iter_many(
+        self,
+        *,
+        batch_size: int = 1000,
+        **filters
+    ) -> AsyncIterator[ModelType]:
+        """
+        Stream all matching records instead of loading them at once.
+
+        Rows are fetched from a server-side cursor batch_size at a time, so
+        memory stays bounded for large reads (e.g., every price bar of a
+        company). The session is busy until iteration finishes.
+
+        Args:
+            batch_size: Rows fetched per round trip
+            **filters: Column=value pairs
+
+        Yields:
+            Model instances
+        """
+        query, params = self._filtered("select", filters)
+
+        result = await self.db.stream_scalars(
+            query.execution_options(yield_per=batch_size), params
+        )
+        async for instance in result:
+            yield instance
+
     async def create(self, **data) -> ModelType:
         """
         Create a new record.
 
+        No refresh() round trip after the INSERT: primary keys and server
+        defaults come back through INSERT ... RETURNING during the flush.
+
         Args:
             **data: Model fields
 
@@ -111,11 +179,89 @@ class BaseRepository(Generic[ModelType]):
         instance = self.model(**data)
         self.db.add(instance)
         await self.db.flush()
-        await self.db.refresh(instance)
 
-        logger.debug(f"Created {self.model.__name__}: {instance}")
+        logger.debug("Created {}: {}", self.model.__name__, instance)
         return instance
 
+    async def bulk_create(
+        self,
+        rows: Sequence[Dict[str, Any]],
+        *,
+        chunk_size: int = 1000,
+        returning: bool = False
+    ) -> List[Any]:
+        """
+        Insert many records with executemany-style Core INSERTs.
+
+        Skips ORM instance construction and per-row refresh; SQLAlchemy
+        batches each chunk into multi-row INSERT ... VALUES statements
+        (insertmanyvalues). PostgreSQL throughput plateaus somewhere in the
+        1k-10k rows per chunk range; larger chunks mostly add memory.
+
+        Args:
+            rows: Column=value dicts, one per record
+            chunk_size: Records sent per execute() call
+            returning: Return the primary keys of the inserted records
+
+        Returns:
+            Inserted primary keys in input order if returning=True, else []
+        """
+        statement = insert(self.model)
+        if returning:
+            statement = statement.returning(self.model.id)
+
+        ids: List[Any] = []
+        for start in range(0, len(rows), chunk_size):
+            result = await self.db.execute(statement, list(rows[start:start + chunk_size]))
+            if returning:
+                ids.extend(result.scalars().all())
+
+        logger.debug("Bulk created {} {} rows", len(rows), self.model.__name__)
+        return ids
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[Dict[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Sequence[str] | None = None,
+        *,
+        chunk_size: int = 1000
+    ) -> int:
+        """
+        Insert many records, updating those that already exist (PostgreSQL).
+
+        One INSERT ... ON CONFLICT DO UPDATE per chunk replaces the
+        exists/update/create round trips per record. conflict_cols must
+        match a unique index (e.g., ["company_id", "date"] for PriceOHLC,
+        ["company_id", "fiscal_year"] for FinancialsAnnual).
+
+        Args:
+            rows: Column=value dicts, one per record (all with the same keys)
+            conflict_cols: Columns of the unique index that identifies a record
+            update_cols: Columns to overwrite on conflict (default: every
+                column in rows except conflict_cols)
+            chunk_size: Records per statement
+
+        Returns:
+            Number of records inserted or updated
+        """
+        if not rows:
+            return 0
+
+        if update_cols is None:
+            update_cols = [column for column in rows[0] if column not in conflict_cols]
+
+        for start in range(0, len(rows), chunk_size):
+            statement = pg_insert(self.model).values(list(rows[start:start + chunk_size]))
+            statement = statement.on_conflict_do_update(
+                index_elements=list(conflict_cols),
+                set_={column: statement.excluded[column] for column in update_cols}
+            )
+            await self.db.execute(statement)
+
+        logger.debug("Upserted {} {} rows", len(rows), self.model.__name__)
+        return len(rows)
+
     async def update(self, id: Any, **data) -> ModelType | None:
         """
         Update a record by ID.
@@ -134,10 +280,10 @@ class BaseRepository(Generic[ModelType]):
         for key, value in data.items():
             setattr(instance, key, value)
 
+        # onupdate columns are fetched via UPDATE ... RETURNING (eager_defaults)
         await self.db.flush()
-        await self.db.refresh(instance)
 
-        logger.debug(f"Updated {self.model.__name__} {id}: {data}")
+        logger.debug("Updated {} {}: {}", self.model.__name__, id, data)
         return instance
 
     async def delete(self, id: Any) -> bool:
@@ -157,7 +303,7 @@ class BaseRepository(Generic[ModelType]):
         await self.db.delete(instance)
         await self.db.flush()
 
-        logger.debug(f"Deleted {self.model.__name__} {id}")
+        logger.debug("Deleted {} {}", self.model.__name__, id)
         return True
 
     async def exists(self, **filters) -> bool:
@@ -170,16 +316,17 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             True if exists, False otherwise
         """
-        query = select(self.model)
-        for key, value in filters.items():
-            query = query.where(getattr(self.model, key) == value)
-
-        result = await self.db.execute(query.limit(1))
-        return result.scalar_one_or_none() is not None
+        query, params = self._filtered("exists", filters)
+        result = await self.db.execute(query, params)
+        return bool(result.scalar())
 
     async def count(self, **filters) -> int:
         """
-        Count records matching filters.
+        Count records matching filters (exact).
+
+        Fast when the filters cover an index prefix (e.g., company_id);
+        otherwise PostgreSQL scans the table. For dashboard-style totals
+        where a recent estimate is fine, use approx_count() instead.
 
         Args:
             **filters: Column=value pairs
@@ -187,11 +334,28 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Number of matching records
         """
-        from sqlalchemy import func
+        query, params = self._filtered("count", filters)
+        result = await self.db.execute(query, params)
+        return result.scalar_one()
 
-        query = select(func.count()).select_from(self.model)
-        for key, value in filters.items():
-            query = query.where(getattr(self.model, key) == value)
+    async def approx_count(self) -> int:
+        """
+        Estimate the total number of records from planner statistics.
 
-        result = await self.db.execute(query)
-        return result.scalar_one()
+        Reads pg_class.reltuples (kept current by autovacuum/ANALYZE) instead
+        of scanning the table, so it costs the same for any table size but
+        may lag recent writes. Falls back to count() if the table has never
+        been analyzed.
+
+        Returns:
+            Estimated number of records
+        """
+        result = await self.db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": self.model.__tablename__}
+        )
+        estimate = result.scalar_one_or_none()
+
+        if estimate is None or estimate < 0:
+            return await self.count()
+        return estimate
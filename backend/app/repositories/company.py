@@ -2,12 +2,17 @@
 Company repository with business-specific queries.
 """
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.company import Company
 from app.repositories.base import BaseRepository
 
+# Point lookups hit on most requests: built once, values bound per call
+_BY_SYMBOL = select(Company).where(Company.symbol == bindparam("symbol"))
+_BY_ISIN = select(Company).where(Company.isin == bindparam("isin"))
+_ID_BY_SYMBOL = select(Company.id).where(Company.symbol == bindparam("symbol"))
+
 
 class CompanyRepository(BaseRepository[Company]):
     """
@@ -28,9 +33,24 @@ class CompanyRepository(BaseRepository[Company]):
         Returns:
             Company instance or None
         """
-        result = await self.db.execute(
-            select(Company).where(Company.symbol == symbol)
-        )
+        result = await self.db.execute(_BY_SYMBOL, {"symbol": symbol})
+        return result.scalar_one_or_none()
+
+    async def get_id_by_symbol(self, symbol: str) -> int | None:
+        """
+        Get a company's primary key by stock symbol.
+
+        Selects only companies.id through the unique symbol index. Not
+        memoized in process: another worker may delete or re-create the
+        company, and a stale id would misdirect foreign-key writes.
+
+        Args:
+            symbol: Stock symbol (e.g., "RELIANCE.NS")
+
+        Returns:
+            Company id or None if the symbol is unknown
+        """
+        result = await self.db.execute(_ID_BY_SYMBOL, {"symbol": symbol})
         return result.scalar_one_or_none()
 
     async def get_by_isin(self, isin: str) -> Company | None:
@@ -43,9 +63,7 @@ class CompanyRepository(BaseRepository[Company]):
         Returns:
             Company instance or None
         """
-        result = await self.db.execute(
-            select(Company).where(Company.isin == isin)
-        )
+        result = await self.db.execute(_BY_ISIN, {"isin": isin})
         return result.scalar_one_or_none()
 
     async def get_by_sector(
@@ -81,7 +99,10 @@ class CompanyRepository(BaseRepository[Company]):
         limit: int = 10
     ) -> list[Company]:
         """
-        Search companies by name (case-insensitive).
+        Search companies by name (case-insensitive), best matches first.
+
+        The substring match is served by the ix_companies_name_trgm trigram
+        index; results are ranked by trigram similarity to the query.
 
         Args:
             query: Search query
@@ -93,6 +114,7 @@ class CompanyRepository(BaseRepository[Company]):
         result = await self.db.execute(
             select(Company)
             .where(Company.name.ilike(f"%{query}%"))
+            .order_by(func.similarity(Company.name, query).desc())
             .limit(limit)
         )
         return list(result.scalars().all())
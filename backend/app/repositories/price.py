@@ -0,0 +1,161 @@
+"""
+Price repository for historical OHLC reads and bulk loads.
+"""
+
+import uuid
+from datetime import date
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.price import PriceOHLC
+from app.repositories.base import BaseRepository
+
+# Column order of the records passed to COPY in copy_columns();
+# created_at is left to its server default
+_COPY_COLUMNS = ('id', 'company_id', 'date', 'open', 'high', 'low', 'close', 'volume')
+
+# Range read for one company, oldest first (served by ix_prices_company_date)
+_OHLC_RANGE_SQL = (
+    "SELECT date, open, high, low, close, volume "
+    "FROM prices_ohlc "
+    "WHERE company_id = $1 AND date BETWEEN $2 AND $3 "
+    "ORDER BY date"
+)
+
+
+class PriceRepository(BaseRepository[PriceOHLC]):
+    """
+    Repository for PriceOHLC model.
+    Extends BaseRepository with bulk time-series reads and writes.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(PriceOHLC, db)
+
+    async def get_columns(
+        self,
+        company_id: int,
+        start: date,
+        end: date
+    ) -> Dict[str, List[Any]]:
+        """
+        Get OHLC bars for a date range as parallel columns.
+
+        Runs on the session's underlying asyncpg connection: asyncpg decodes
+        rows in C and no ORM instance is built per bar, which matters for
+        multi-year ranges. The result has the same shape as
+        YahooFinanceService.get_prices()['columns'] minus 'timestamp'.
+
+        Args:
+            company_id: Company primary key
+            start: First trading date (inclusive)
+            end: Last trading date (inclusive)
+
+        Returns:
+            Dict of column name -> list of values (e.g., {'date': [...], 'close': [...]})
+        """
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        rows = await raw.driver_connection.fetch(_OHLC_RANGE_SQL, company_id, start, end)
+
+        dates, opens, highs, lows, closes, volumes = zip(*rows) if rows else ((),) * 6
+
+        return {
+            'date': [d.isoformat() for d in dates],
+            'open': list(opens),
+            'high': list(highs),
+            'low': list(lows),
+            'close': list(closes),
+            'volume': [int(v) if v is not None else None for v in volumes],
+        }
+
+    async def insert_columns(
+        self,
+        company_id: int,
+        columns: Dict[str, List[Any]],
+        chunk_size: int = 1000
+    ) -> int:
+        """
+        Store an OHLC series in YahooFinanceService.get_prices()['columns'] shape.
+
+        Rows go straight from the columns into bulk_create, with no
+        PriceOHLC instance per bar.
+
+        Args:
+            company_id: Company primary key
+            columns: Parallel 'date' (YYYY-MM-DD), 'open', 'high', 'low',
+                'close' and 'volume' lists
+            chunk_size: Rows per INSERT batch
+
+        Returns:
+            Number of rows inserted
+        """
+        rows = [
+            {
+                'company_id': company_id,
+                'date': date.fromisoformat(day),
+                'open': open_,
+                'high': high,
+                'low': low,
+                'close': close,
+                'volume': volume,
+            }
+            for day, open_, high, low, close, volume in zip(
+                columns['date'], columns['open'], columns['high'],
+                columns['low'], columns['close'], columns['volume']
+            )
+        ]
+
+        await self.bulk_create(rows, chunk_size=chunk_size)
+        return len(rows)
+
+    async def copy_columns(self, company_id: int, columns: Dict[str, List[Any]]) -> int:
+        """
+        Load an OHLC series with PostgreSQL COPY (fastest bulk path).
+
+        Streams records to asyncpg's copy_records_to_table on the session's
+        connection, bypassing SQLAlchemy statement building entirely. COPY
+        has no ON CONFLICT: use it for first-time backfills, and
+        insert_columns()/bulk_upsert() when the range may already exist.
+
+        Args:
+            company_id: Company primary key
+            columns: Series in YahooFinanceService.get_prices()['columns'] shape
+
+        Returns:
+            Number of rows copied
+        """
+        records = [
+            (uuid.uuid4(), company_id, date.fromisoformat(day), open_, high, low, close, volume)
+            for day, open_, high, low, close, volume in zip(
+                columns['date'], columns['open'], columns['high'],
+                columns['low'], columns['close'], columns['volume']
+            )
+        ]
+
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            PriceOHLC.__tablename__, records=records, columns=_COPY_COLUMNS
+        )
+        return len(records)
+
+    async def create_year_partition(self, year: int) -> None:
+        """
+        Create the prices_ohlc partition for a calendar year if missing.
+
+        Called for the current and next year by the daily
+        scripts/create_price_partitions.py cron (via
+        app.core.maintenance.ensure_price_partitions); inserts for a date
+        without a partition fail.
+
+        Args:
+            year: Calendar year (e.g., 2027)
+        """
+        year = int(year)
+        await self.db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS prices_ohlc_{year} PARTITION OF prices_ohlc "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        ))
@@ -0,0 +1,145 @@
+"""
+Snapshot repository with latest-per-kind lookups.
+"""
+
+from typing import List, Tuple
+
+from sqlalchemy import BigInteger, DateTime, String, column, select, table, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.snapshot import Snapshot
+from app.repositories.base import BaseRepository
+
+# Materialized view (see migration 296490f25015): newest snapshot id per
+# (company_id, kind). Not part of Base.metadata, so create_all() skips it.
+latest_snapshot_by_kind = table(
+    "latest_snapshot_by_kind",
+    column("id", UUID(as_uuid=True)),
+    column("company_id", BigInteger),
+    column("kind", String),
+    column("created_at", DateTime),
+)
+
+
+class SnapshotRepository(BaseRepository[Snapshot]):
+    """
+    Repository for Snapshot model.
+    Extends BaseRepository with latest-snapshot queries.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Snapshot, db)
+
+    async def get_latest(self, company_id: int, kind: str) -> Snapshot | None:
+        """
+        Get the most recent snapshot of a kind for a company.
+
+        When SNAPSHOT_VIEW_REFRESH_INTERVAL > 0 the winning id is resolved
+        through latest_snapshot_by_kind (refreshed on that interval by
+        app.core.maintenance), so only that one row and its JSONB payload
+        are read from snapshots. A company/kind with no row in the view yet
+        (first snapshot since the last refresh), or any lookup with the
+        refresh disabled, reads snapshots directly.
+
+        Args:
+            company_id: Company primary key
+            kind: Snapshot kind (e.g., "full_analysis")
+
+        Returns:
+            Snapshot instance or None
+        """
+        # An unrefreshed view would serve stale winners, so only trust it
+        # while the refresh job runs
+        if settings.SNAPSHOT_VIEW_REFRESH_INTERVAL > 0:
+            view = latest_snapshot_by_kind
+            result = await self.db.execute(
+                select(Snapshot)
+                .join(view, view.c.id == Snapshot.id)
+                .where(view.c.company_id == company_id, view.c.kind == kind)
+            )
+            snapshot = result.scalar_one_or_none()
+            if snapshot is not None:
+                return snapshot
+
+        result = await self.db.execute(
+            select(Snapshot)
+            .where(Snapshot.company_id == company_id, Snapshot.kind == kind)
+            .order_by(Snapshot.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_fresh(
+        self,
+        company_id: int,
+        kind: str,
+        max_age_hours: int = 24
+    ) -> Snapshot | None:
+        """
+        Get the newest snapshot of a kind that is not stale.
+
+        Staleness is filtered in SQL (Snapshot.stale_filter), so stale rows
+        are never hydrated; reads snapshots directly and is always current.
+
+        Args:
+            company_id: Company primary key
+            kind: Snapshot kind (e.g., "full_analysis")
+            max_age_hours: Maximum snapshot age in hours
+
+        Returns:
+            Snapshot instance or None if there is no fresh snapshot
+        """
+        result = await self.db.execute(
+            select(Snapshot)
+            .where(
+                Snapshot.company_id == company_id,
+                Snapshot.kind == kind,
+                ~Snapshot.stale_filter(max_age_hours)
+            )
+            .order_by(Snapshot.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_with_staleness(
+        self,
+        company_id: int,
+        max_age_hours: int = 24,
+        limit: int = 100
+    ) -> List[Tuple[Snapshot, bool]]:
+        """
+        List a company's snapshots, newest first, each with its stale flag.
+
+        The flag is computed by the database as an extra selected column
+        (Snapshot.stale_filter), so rendering a page of snapshots makes no
+        per-row is_stale() call.
+
+        Args:
+            company_id: Company primary key
+            max_age_hours: Maximum snapshot age in hours
+            limit: Maximum snapshots to return
+
+        Returns:
+            List of (snapshot, is_stale) tuples
+        """
+        result = await self.db.execute(
+            select(Snapshot, Snapshot.stale_filter(max_age_hours).label("stale"))
+            .where(Snapshot.company_id == company_id)
+            .order_by(Snapshot.created_at.desc())
+            .limit(limit)
+        )
+        return [(snapshot, stale) for snapshot, stale in result.all()]
+
+    async def refresh_latest(self) -> None:
+        """
+        Refresh latest_snapshot_by_kind without blocking readers.
+
+        Runs on a schedule (app.core.maintenance, every
+        SNAPSHOT_VIEW_REFRESH_INTERVAL seconds) rather than per insert;
+        each refresh recomputes the view.
+        """
+        await self.db.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY latest_snapshot_by_kind")
+        )
@@ -5,10 +5,28 @@ Provides common functionality for error handling, logging, and caching.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
 from loguru import logger
 import asyncio
-from functools import wraps
+import contextvars
+from functools import partial, wraps
+import httpx
+import orjson
+
+from app.core.http import create_http_client
+from app.core.symbols import normalize_symbol
+
+
+T = TypeVar("T")
+
+# Blocking upstream calls (yfinance scrapes) run on their own pool rather
+# than the loop's default executor, so slow scrapes cannot queue ahead of
+# short to_thread work (parsing, file I/O)
+BLOCKING_IO_WORKERS = 16
+_blocking_io_executor = ThreadPoolExecutor(
+    max_workers=BLOCKING_IO_WORKERS, thread_name_prefix="market-io"
+)
 
 
 class ServiceError(Exception):
@@ -34,17 +52,24 @@ class BaseService(ABC):
     - Consistent error handling
     - Logging
     - Timeout management
+    - Pooled outbound HTTP (_get)
     - Common utilities
     """
 
-    def __init__(self, timeout: int = 30):
+    # Process-wide fallback client for services built without one (scripts,
+    # ad-hoc use); the app injects its lifespan-owned client instead
+    _shared_client: Optional[httpx.AsyncClient] = None
+
+    def __init__(self, timeout: int = 30, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize base service.
 
         Args:
             timeout: Default timeout for operations in seconds
+            http_client: Shared pooled HTTP client (owned by the app lifespan)
         """
         self.timeout = timeout
+        self.http_client = http_client
         self.logger = logger.bind(service=self.__class__.__name__)
 
     @abstractmethod
@@ -63,6 +88,46 @@ class BaseService(ABC):
         """
         pass
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client: the injected one, else the shared fallback."""
+        if self.http_client is not None:
+            return self.http_client
+        if BaseService._shared_client is None or BaseService._shared_client.is_closed:
+            BaseService._shared_client = create_http_client(self.timeout)
+        return BaseService._shared_client
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET a URL over the pooled client (reused keep-alive connections).
+
+        Args:
+            url: Absolute URL
+            **kwargs: Passed to httpx.AsyncClient.get (params, headers, ...)
+
+        Returns:
+            Successful (2xx) response, or a 304 Not Modified answering a
+            conditional request (If-None-Match / If-Modified-Since headers)
+
+        Raises:
+            ServiceTimeoutError: If the request times out
+            ServiceUnavailableError: On connection errors or other non-2xx status
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        try:
+            response = await self.client.get(url, **kwargs)
+            if response.status_code != httpx.codes.NOT_MODIFIED:
+                response.raise_for_status()
+            return response
+        except httpx.TimeoutException as e:
+            raise ServiceTimeoutError(
+                f"GET {url} timed out after {kwargs['timeout']} seconds"
+            ) from e
+        except httpx.HTTPStatusError as e:
+            raise ServiceUnavailableError(f"GET {url} returned {e.response.status_code}") from e
+        except httpx.RequestError as e:
+            raise ServiceUnavailableError(f"GET {url} failed: {e}") from e
+
     def _handle_error(self, error: Exception, context: str = "") -> Dict[str, Any]:
         """
         Consistent error handling across services.
@@ -99,13 +164,25 @@ class BaseService(ABC):
         if not symbol or not isinstance(symbol, str):
             raise ValueError("Symbol must be a non-empty string")
 
-        # Remove whitespace and convert to uppercase
-        symbol = symbol.strip().upper()
+        # Compiled-regex check, memoized per raw symbol
+        return normalize_symbol(symbol)
 
-        if len(symbol) < 1 or len(symbol) > 20:
-            raise ValueError("Symbol length must be between 1 and 20 characters")
+    async def _run_blocking(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking upstream call on the market-io thread pool.
 
-        return symbol
+        Like asyncio.to_thread (context variables are propagated), but on
+        a dedicated pool of BLOCKING_IO_WORKERS threads.
+
+        Args:
+            fn: Blocking callable
+            *args: Positional arguments for fn
+
+        Returns:
+            fn's return value
+        """
+        call = partial(contextvars.copy_context().run, fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(_blocking_io_executor, call)
 
     async def _with_timeout(self, coro, timeout: Optional[int] = None):
         """
@@ -123,23 +200,25 @@ class BaseService(ABC):
         """
         timeout = timeout or self.timeout
         try:
-            return await asyncio.wait_for(coro, timeout=timeout)
-        except asyncio.TimeoutError:
-            raise ServiceTimeoutError(f"Operation timed out after {timeout} seconds")
+            # Deadline on the current task; unlike wait_for, no wrapper task
+            async with asyncio.timeout(timeout):
+                return await coro
+        except TimeoutError:
+            raise ServiceTimeoutError(f"Operation timed out after {timeout} seconds") from None
 
     def _extract_error_message(self, response) -> str:
         """
         Extract error message from HTTP response.
 
         Args:
-            response: HTTP response object
+            response: HTTP response object (requests or httpx)
 
         Returns:
             Error message string
         """
         try:
-            if hasattr(response, 'json'):
-                data = response.json()
+            if hasattr(response, 'content'):
+                data = orjson.loads(response.content)
                 return data.get('message', data.get('error', 'Unknown error'))
             return f"HTTP {response.status_code}"
         except Exception:
@@ -9,15 +9,193 @@ Fetches news from multiple sources:
 Sources are completely free using RSS feeds.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+import asyncio
+import io
+import re
+from collections import Counter
+from functools import lru_cache
 import feedparser
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from dateutil import parser as date_parser
+from dateutil.tz import UTC, gettz
 from urllib.parse import quote_plus
+from xml.sax.saxutils import escape
+from lxml import etree
 from loguru import logger
+import httpx
 
+from app.core.clock import iso_now
 from app.services.base import BaseService, ServiceError
 
 
+# Zone abbreviations email.utils does not know (it drops them), built once
+# rather than resolved per date
+_TZINFOS = {
+    'IST': gettz('Asia/Kolkata'),
+    'EST': gettz('US/Eastern'),
+    'EDT': gettz('US/Eastern'),
+    'PST': gettz('US/Pacific'),
+    'PDT': gettz('US/Pacific'),
+    'GMT': UTC,
+    'UTC': UTC,
+}
+
+
+def _keyword_regex(keywords: Sequence[str]) -> "re.Pattern[str]":
+    """
+    Compile keywords into one trie-shaped regex (shared prefixes factored).
+
+    search() then scans a text once for all keywords, branching on the
+    next character, instead of one substring scan per keyword.
+
+    Args:
+        keywords: Lowercase keywords (matched as substrings)
+
+    Returns:
+        Compiled pattern (e.g., 'g(?:ain|rowth)|up(?:grade)?')
+    """
+    trie: Dict[str, Any] = {}
+    for word in keywords:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        optional = '' in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if optional else group
+
+    return re.compile(build(trie))
+
+
+# Sentiment keywords for filter_by_sentiment (substring match)
+_POSITIVE_RE = _keyword_regex([
+    'profit', 'growth', 'surge', 'gain', 'rally', 'high', 'beat',
+    'upgrade', 'bullish', 'positive', 'strong', 'record', 'up'
+])
+_NEGATIVE_RE = _keyword_regex([
+    'loss', 'decline', 'fall', 'drop', 'crash', 'low', 'miss',
+    'downgrade', 'bearish', 'negative', 'weak', 'concern', 'down'
+])
+
+
+@lru_cache(maxsize=8192)
+def _sentiment_flags(title: str, summary: str) -> Tuple[bool, bool]:
+    """
+    Classify an article's text against both keyword sets.
+
+    Memoized on (title, summary), so re-filtering the same article list
+    (e.g., toggling positive/negative) is a cache lookup, not a rescan.
+
+    Args:
+        title: Article title
+        summary: Article summary
+
+    Returns:
+        (is_positive, is_negative) tuple
+    """
+    text = (title + ' ' + summary).lower()
+    return _POSITIVE_RE.search(text) is not None, _NEGATIVE_RE.search(text) is not None
+
+
+# extract_keywords: punctuation removed in one str.translate pass
+_PUNCTUATION_TABLE = str.maketrans('', '', '.,!?;:"()[]{}')
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
+})
+
+
+def _parse_published(value: Optional[str]) -> Optional[str]:
+    """
+    Parse an RSS date into a naive-UTC ISO string.
+
+    RFC 822 dates (the norm) go through email.utils, which is ~15x faster
+    than dateutil; dateutil with _TZINFOS only handles the rest.
+
+    Args:
+        value: Date string (e.g., 'Tue, 14 Oct 2025 09:30:00 GMT')
+
+    Returns:
+        ISO timestamp (e.g., '2025-10-14T09:30:00') or None if unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        published = None
+
+    if published is None or published.tzinfo is None:
+        try:
+            published = date_parser.parse(value, tzinfos=_TZINFOS)
+        except (ValueError, OverflowError):
+            return None
+
+    if published.tzinfo is not None:
+        published = published.astimezone(UTC).replace(tzinfo=None)
+    return published.isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_summary(html: str) -> str:
+    """
+    Sanitize an item's description HTML as feedparser does for `summary`.
+
+    Runs the HTML through feedparser.parse as a one-item feed, so it gets
+    feedparser's allow-list sanitizer via the public API: <script>,
+    <iframe> and friends are dropped, event-handler attributes (onerror=,
+    onclick=, ...) and javascript: URLs are stripped, harmless markup
+    (<a>, <font>) is kept. Memoized: the same Google News items recur
+    across refreshes.
+
+    Args:
+        html: Raw <description> text (HTML)
+
+    Returns:
+        Sanitized HTML
+    """
+    if not html:
+        return ''
+    # bytes, so feedparser never treats the document as a URL or path
+    feed = feedparser.parse(
+        b'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><item>'
+        + f'<description>{escape(html)}</description>'.encode('utf-8')
+        + b'</item></channel></rss>'
+    )
+    return feed.entries[0].get('summary', '') if feed.entries else ''
+
+
+def _iter_items(content: bytes, limit: Optional[int] = None) -> Iterator[etree._Element]:
+    """Yield up to `limit` (default all) RSS <item> elements, parsing no further than needed."""
+    if limit is not None and limit <= 0:
+        return
+    # libxml2 (C) pull parser; entities are not expanded, nothing is fetched
+    # over the network, and like feedparser it tolerates malformed feeds
+    items = etree.iterparse(
+        io.BytesIO(content), events=('end',), tag='item',
+        resolve_entities=False, no_network=True, huge_tree=False, recover=True
+    )
+    for count, (_, elem) in enumerate(items, start=1):
+        yield elem
+        if limit is not None and count >= limit:
+            return
+        # Children were read by the caller; free them as we go
+        elem.clear()
+
+
 class NewsService(BaseService):
     """
     Service for fetching stock-related news.
@@ -27,14 +205,32 @@ class NewsService(BaseService):
 
     GOOGLE_NEWS_RSS = "https://news.google.com/rss/search"
 
-    def __init__(self, timeout: int = 30):
+    # Google News RSS query string: /rss/search?q={query}&hl={lang}&gl={region}&ceid={region}:{lang}
+    FEED_URL_TEMPLATE = GOOGLE_NEWS_RSS + "?q={query}&hl={lang}&gl={region}&ceid={region}:{lang}"
+
+    # Parse feeds with feedparser instead of the streaming lxml
+    # parser (kept for parity checks; slower, parses every entry)
+    USE_FEEDPARSER = False
+
+    # Max feed downloads in flight per service instance
+    MAX_CONCURRENT_FETCHES = 8
+
+    # Feeds kept for conditional GETs (roughly 50-150 KB each)
+    FEED_CACHE_MAX = 256
+
+    def __init__(self, timeout: int = 30, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize News service.
 
         Args:
             timeout: Request timeout in seconds
+            http_client: Shared pooled HTTP client
         """
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, http_client=http_client)
+        self._fetch_sem = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
+        # feed URL -> (ETag, Last-Modified, body) of the last 200 response
+        self._feed_cache: Dict[str, Tuple[Optional[str], Optional[str], bytes]] = {}
 
     async def fetch_data(self, symbol: str) -> Dict[str, Any]:
         """
@@ -56,7 +252,7 @@ class NewsService(BaseService):
                 'articles': news,
                 'count': len(news),
                 'source': 'google_news',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }
 
         except Exception as e:
@@ -85,51 +281,185 @@ class NewsService(BaseService):
             return []
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
+            content = await self._fetch_feed(self._build_feed_url(query, language, region))
 
-            articles = await loop.run_in_executor(
-                None, self._get_news_sync, query, limit, language, region
-            )
+            if self.USE_FEEDPARSER:
+                return await asyncio.to_thread(
+                    self._get_news_sync, query, limit, language, region, content
+                )
+
+            # Stops after `limit` items, so this is cheap enough to run inline
+            articles = self._parse_feed(content, limit)
+            if not articles:
+                self.logger.warning(f"No news found for query: {query}")
             return articles
 
         except Exception as e:
             self.logger.error(f"Failed to fetch news for '{query}': {e}")
             return []
 
+    async def get_news_multi(
+        self,
+        queries: Sequence[str],
+        limit: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get news for several queries concurrently.
+
+        Feeds download in parallel (at most MAX_CONCURRENT_FETCHES at a
+        time), so N queries take about as long as the slowest one.
+
+        Args:
+            queries: Search queries (e.g., ['IT sector India stocks', 'trending stocks India'])
+            limit: Maximum number of articles per query
+
+        Returns:
+            Article lists in the same order as queries (empty on failure)
+        """
+        return list(await asyncio.gather(*(self.get_news(q, limit=limit) for q in queries)))
+
+    async def _fetch_feed(self, url: str) -> bytes:
+        """
+        Download a feed, revalidating the last copy with a conditional GET.
+
+        Google News answers 304 Not Modified when the feed is unchanged
+        since our ETag/Last-Modified, so repeated polls skip the body
+        transfer and reuse the stored bytes.
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            RSS bytes
+        """
+        cached = self._feed_cache.get(url)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        async with self._fetch_sem:
+            response = await self._get(url, headers=headers)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            self.logger.debug("Feed not modified: {}", url)
+            return cached[2]
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._feed_cache.pop(url, None)
+            if len(self._feed_cache) >= self.FEED_CACHE_MAX:
+                # Evict the least recently stored feed
+                del self._feed_cache[next(iter(self._feed_cache))]
+            self._feed_cache[url] = (etag, last_modified, response.content)
+
+        return response.content
+
+    def _build_feed_url(self, query: str, language: str, region: str) -> str:
+        """Construct the Google News RSS URL for a query (see FEED_URL_TEMPLATE)."""
+        return self.FEED_URL_TEMPLATE.format(
+            query=quote_plus(f"{query} stock India"), lang=language, region=region
+        )
+
+    def _parse_feed(self, content: bytes, limit: int) -> List[Dict[str, Any]]:
+        """
+        Parse the first `limit` items of an RSS document.
+
+        Streams the XML with lxml's iterparse and stops at the limit, so
+        the (often 100+) remaining items are never parsed.
+
+        Args:
+            content: RSS bytes
+            limit: Max articles
+
+        Returns:
+            List of news articles
+        """
+        try:
+            return [self._parse_item(item) for item in _iter_items(content, limit)]
+        except etree.XMLSyntaxError as e:
+            raise ServiceError(f"Failed to parse news feed: {e}")
+
+    def _iter_articles(self, content: bytes) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse every article in an RSS document, in feed order.
+
+        Args:
+            content: RSS bytes
+
+        Yields:
+            Articles as from _parse_item; a malformed feed ends iteration early
+        """
+        try:
+            for item in _iter_items(content):
+                yield self._parse_item(item)
+        except etree.XMLSyntaxError as e:
+            self.logger.warning(f"Stopped parsing malformed news feed: {e}")
+
+    def _parse_item(self, item: etree._Element) -> Dict[str, Any]:
+        """
+        Parse a single RSS <item> element.
+
+        Same output as _parse_entry; the summary HTML is sanitized the
+        same way feedparser sanitizes it.
+
+        Args:
+            item: <item> element
+
+        Returns:
+            Dictionary with article information
+        """
+        # Extract published date (normalized to naive UTC)
+        published = _parse_published(item.findtext('pubDate'))
+
+        # Extract source from title (Google News format: "Title - Source")
+        title = item.findtext('title') or ''
+        source = None
+        if ' - ' in title:
+            title, source = title.rsplit(' - ', 1)
+
+        link = item.findtext('link') or ''
+
+        return {
+            'title': title,
+            'link': link,
+            'source': source or 'Unknown',
+            'published': published or iso_now(),
+            'summary': _sanitize_summary(item.findtext('description') or ''),
+            'id': item.findtext('guid') or link
+        }
+
     def _get_news_sync(
         self,
         query: str,
         limit: int,
         language: str,
-        region: str
+        region: str,
+        content: Optional[bytes] = None
     ) -> List[Dict[str, Any]]:
         """
-        Synchronous fetch of news articles.
+        Synchronous fetch of news articles with feedparser (USE_FEEDPARSER).
 
         Args:
             query: Search query
             limit: Max articles
             language: Language code
             region: Region code
+            content: Pre-fetched RSS bytes (feedparser downloads the URL if None)
 
         Returns:
             List of news articles
         """
         try:
-            # Construct RSS URL
-            # Google News RSS format: /rss/search?q={query}&hl={lang}&gl={region}&ceid={region}:{lang}
-            encoded_query = quote_plus(f"{query} stock India")
-            url = (
-                f"{self.GOOGLE_NEWS_RSS}?"
-                f"q={encoded_query}&"
-                f"hl={language}&"
-                f"gl={region}&"
-                f"ceid={region}:{language}"
-            )
-
             # Parse RSS feed
-            feed = feedparser.parse(url)
+            feed = feedparser.parse(
+                content if content is not None
+                else self._build_feed_url(query, language, region)
+            )
 
             if not feed.entries:
                 self.logger.warning(f"No news found for query: {query}")
@@ -157,12 +487,7 @@ class NewsService(BaseService):
             Dictionary with article information
         """
         # Extract published date
-        published = None
-        if hasattr(entry, 'published_parsed'):
-            try:
-                published = datetime(*entry.published_parsed[:6]).isoformat()
-            except Exception:
-                pass
+        published = _parse_published(entry.get('published'))
 
         # Extract source from title (Google News format: "Title - Source")
         title = entry.get('title', '')
@@ -176,7 +501,7 @@ class NewsService(BaseService):
             'title': title,
             'link': entry.get('link', ''),
             'source': source or 'Unknown',
-            'published': published or datetime.now().isoformat(),
+            'published': published or iso_now(),
             'summary': entry.get('summary', ''),
             'id': entry.get('id', entry.get('link', ''))
         }
@@ -261,29 +586,18 @@ class NewsService(BaseService):
         if sentiment == 'all':
             return articles
 
-        positive_keywords = [
-            'profit', 'growth', 'surge', 'gain', 'rally', 'high', 'beat',
-            'upgrade', 'bullish', 'positive', 'strong', 'record', 'up'
-        ]
+        if sentiment == 'positive':
+            flag = 0
+        elif sentiment == 'negative':
+            flag = 1
+        else:
+            return []
 
-        negative_keywords = [
-            'loss', 'decline', 'fall', 'drop', 'crash', 'low', 'miss',
-            'downgrade', 'bearish', 'negative', 'weak', 'concern', 'down'
+        return [
+            article for article in articles
+            if _sentiment_flags(article.get('title', ''), article.get('summary', ''))[flag]
         ]
 
-        filtered = []
-        for article in articles:
-            text = (article.get('title', '') + ' ' + article.get('summary', '')).lower()
-
-            if sentiment == 'positive':
-                if any(keyword in text for keyword in positive_keywords):
-                    filtered.append(article)
-            elif sentiment == 'negative':
-                if any(keyword in text for keyword in negative_keywords):
-                    filtered.append(article)
-
-        return filtered
-
     async def get_trending_stocks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get news about trending/popular stocks.
@@ -307,7 +621,8 @@ class NewsService(BaseService):
         Search for news within a date range.
 
         Note: Google News RSS doesn't support exact date filtering,
-        so we filter results after fetching.
+        so we filter results after fetching. Items are parsed one at a
+        time and parsing stops once `limit` articles qualify.
 
         Args:
             query: Search query
@@ -317,14 +632,20 @@ class NewsService(BaseService):
         Returns:
             Filtered articles within date range
         """
-        # Fetch more articles than needed since we'll filter
-        articles = await self.get_news(query, limit=limit * 2)
+        if not query or limit <= 0:
+            return []
+
+        try:
+            content = await self._fetch_feed(self._build_feed_url(query, 'en', 'IN'))
+        except Exception as e:
+            self.logger.error(f"Failed to fetch news for '{query}': {e}")
+            return []
 
         cutoff_date = datetime.now() - timedelta(days=days_back)
 
         # Filter by date
         filtered = []
-        for article in articles:
+        for article in self._iter_articles(content):
             try:
                 published = datetime.fromisoformat(article['published'])
                 if published >= cutoff_date:
@@ -352,25 +673,8 @@ class NewsService(BaseService):
         Returns:
             List of keywords
         """
-        # Remove common words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
-        }
-
-        # Tokenize and count
-        words = text.lower().split()
-        word_count = {}
-
-        for word in words:
-            # Clean word
-            word = word.strip('.,!?;:"()[]{}')
-            if len(word) > 3 and word not in stop_words:
-                word_count[word] = word_count.get(word, 0) + 1
-
-        # Sort by frequency
-        sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
+        # Tokenize (punctuation stripped in C) and count, skipping common words
+        words = text.lower().translate(_PUNCTUATION_TABLE).split()
+        word_count = Counter(word for word in words if len(word) > 3 and word not in _STOP_WORDS)
 
-        return [word for word, count in sorted_words[:top_n]]
+        return [word for word, _ in word_count.most_common(top_n)]
@@ -11,11 +11,22 @@ Note: NSE requires session cookies. This service automatically handles
 session initialization by visiting the homepage first.
 """
 
-from typing import Dict, Any, Optional, List
-import requests
-from datetime import datetime
+import asyncio
+import csv
+import io
+import os
+import time
+from bisect import bisect_left
+from http.cookiejar import LWPCookieJar
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
 from loguru import logger
+import httpx
+import orjson
 
+from app.core import singleflight
+from app.core.cache import cached
+from app.core.clock import iso_now
 from app.services.base import BaseService, ServiceError, ServiceUnavailableError
 
 
@@ -27,19 +38,41 @@ class NSEService(BaseService):
     1. Valid cookies (obtained by visiting homepage)
     2. Proper headers (User-Agent, Referer)
     3. Session management
+
+    All requests are native async on the shared pooled client, whose cookie
+    jar keeps the NSE session cookies (scoped to nseindia.com).
     """
 
     BASE_URL = "https://www.nseindia.com"
     API_BASE = f"{BASE_URL}/api"
 
-    def __init__(self, timeout: int = 30):
+    # In-process TTLs (seconds), per symbol: quote-equity payloads (which
+    # quotes are parsed from) and parsed shareholding
+    QUOTE_TTL = 30
+    SHAREHOLDING_TTL = 3600
+    CACHE_MAX_SYMBOLS = 2048
+
+    # Listed-equity master (~2000 rows) for local prefix autocomplete
+    EQUITY_LIST_URL = "https://nsearchives.nseindia.com/content/equities/EQUITY_L.csv"
+    EQUITY_LIST_TTL = 86400
+    SEARCH_LIMIT = 10
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cookie_file: Optional[str] = None
+    ):
         """
         Initialize NSE service.
 
         Args:
             timeout: Request timeout in seconds
+            http_client: Shared pooled HTTP client
+            cookie_file: Where to persist NSE session cookies between runs
+                (None disables persistence)
         """
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, http_client=http_client)
 
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
@@ -47,14 +80,27 @@ class NSEService(BaseService):
                          'Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
         }
 
-        # Session for maintaining cookies
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
-        self._session_initialized = False
+        # Concurrent first requests share one homepage visit
+        self._session_lock = asyncio.Lock()
+
+        # symbol -> (expires_at monotonic, payload or parsed result)
+        self._payload_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._shareholding_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Local autocomplete index: listings plus (KEY, listing index) pairs
+        # sorted by key, for bisect prefix lookups; built on first search
+        self._listings: List[Dict[str, str]] = []
+        self._symbol_keys: List[Tuple[str, int]] = []
+        self._name_keys: List[Tuple[str, int]] = []
+        self._listings_expire_at = 0.0
+
+        # Reuse a live session: cookies another instance already set on the
+        # shared client's jar, else the previous run's persisted cookies.
+        # Either skips the homepage visit until NSE rejects them (401)
+        self._cookie_path = Path(cookie_file).expanduser() if cookie_file else None
+        self._session_initialized = bool(self._nse_cookies()) or self._load_cookies()
 
     async def fetch_data(self, symbol: str) -> Dict[str, Any]:
         """
@@ -72,19 +118,10 @@ class NSEService(BaseService):
         symbol = self._validate_symbol(symbol)
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-
-            # Ensure session is initialized
-            if not self._session_initialized:
-                await loop.run_in_executor(None, self._init_session)
-
-            # Fetch all data in parallel (using executor for sync requests)
-            shareholding_task = loop.run_in_executor(None, self._get_shareholding_sync, symbol)
-            quote_task = loop.run_in_executor(None, self._get_quote_sync, symbol)
-
+            # Both requests overlap on the event loop
             shareholding, quote = await asyncio.gather(
-                shareholding_task, quote_task, return_exceptions=True
+                self._get_shareholding(symbol), self._get_quote(symbol),
+                return_exceptions=True
             )
 
             # Handle errors
@@ -101,13 +138,13 @@ class NSEService(BaseService):
                 'shareholding': shareholding,
                 'quote': quote,
                 'source': 'nse',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }
 
         except Exception as e:
             return self._handle_error(e, f"Failed to fetch NSE data for {symbol}")
 
-    def _init_session(self) -> None:
+    async def _init_session(self) -> None:
         """
         Initialize NSE session by visiting homepage to get cookies.
 
@@ -115,19 +152,188 @@ class NSEService(BaseService):
         """
         try:
             self.logger.info("Initializing NSE session...")
-            response = self.session.get(
+            response = await self.client.get(
                 self.BASE_URL,
+                headers=self.headers,
                 timeout=self.timeout
             )
 
             if response.status_code == 200:
                 self._session_initialized = True
                 self.logger.info("NSE session initialized successfully")
+                await asyncio.to_thread(self._save_cookies)
             else:
                 raise ServiceError(f"Failed to initialize NSE session: {response.status_code}")
 
-        except requests.RequestException as e:
-            raise ServiceUnavailableError(f"NSE is unreachable: {e}")
+        except httpx.RequestError as e:
+            raise ServiceUnavailableError(f"NSE is unreachable: {e}") from e
+
+    def _nse_cookies(self) -> List[Any]:
+        """Cookies in the client jar that belong to nseindia.com."""
+        return [c for c in self.client.cookies.jar if c.domain.lstrip('.').endswith('nseindia.com')]
+
+    def _load_cookies(self) -> bool:
+        """
+        Load persisted NSE cookies into the client jar.
+
+        Returns:
+            True if unexpired cookies were loaded
+        """
+        if self._cookie_path is None:
+            return False
+
+        jar = LWPCookieJar(str(self._cookie_path))
+        try:
+            jar.load(ignore_discard=True)  # expired cookies are skipped
+        except (OSError, ValueError):  # missing or unreadable file
+            return False
+
+        for cookie in jar:
+            self.client.cookies.jar.set_cookie(cookie)
+
+        loaded = len(jar) > 0
+        if loaded:
+            self.logger.debug("Loaded {} NSE cookies from {}", len(jar), self._cookie_path)
+        return loaded
+
+    def _save_cookies(self) -> None:
+        """Persist the current NSE cookies (atomically replaces the file)."""
+        if self._cookie_path is None:
+            return
+
+        jar = LWPCookieJar()
+        for cookie in self._nse_cookies():
+            jar.set_cookie(cookie)
+
+        try:
+            self._cookie_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cookie_path.with_name(f"{self._cookie_path.name}.{os.getpid()}.tmp")
+            jar.save(str(tmp_path), ignore_discard=True)
+            # Readers (other workers) never see a partial file
+            os.replace(tmp_path, self._cookie_path)
+        except OSError as e:
+            self.logger.warning(f"Could not persist NSE cookies: {e}")
+
+    async def _ensure_session(self) -> None:
+        """Initialize the NSE session once, even under concurrent callers."""
+        if self._session_initialized:
+            return
+        async with self._session_lock:
+            if not self._session_initialized:
+                await self._init_session()
+
+    async def _api_get(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        referer: Optional[str] = None
+    ) -> httpx.Response:
+        """
+        GET an NSE API endpoint, re-initializing the session once on 401.
+
+        Args:
+            path: Path under API_BASE (e.g., 'quote-equity')
+            params: Query parameters
+            referer: Referer header NSE expects for this page, if any
+
+        Returns:
+            HTTP response (status not checked beyond the 401 retry)
+        """
+        await self._ensure_session()
+
+        url = f"{self.API_BASE}/{path}"
+        headers = self.headers if referer is None else {**self.headers, 'Referer': referer}
+
+        response = await self.client.get(url, params=params, headers=headers, timeout=self.timeout)
+
+        # Handle session expiry
+        if response.status_code == 401:
+            self.logger.warning("NSE session expired, reinitializing...")
+            self._session_initialized = False
+            await self._ensure_session()
+            # Retry once
+            response = await self.client.get(
+                url, params=params, headers=headers, timeout=self.timeout
+            )
+
+        return response
+
+    def _cache_get(
+        self,
+        cache: Dict[str, Tuple[float, Dict[str, Any]]],
+        symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached result for symbol if it has not expired."""
+        entry = cache.get(symbol)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(
+        self,
+        cache: Dict[str, Tuple[float, Dict[str, Any]]],
+        symbol: str,
+        value: Dict[str, Any],
+        ttl: int
+    ) -> None:
+        """Store a result for ttl seconds, evicting the oldest entry when full."""
+        cache.pop(symbol, None)
+        if len(cache) >= self.CACHE_MAX_SYMBOLS:
+            cache.pop(next(iter(cache)))
+        cache[symbol] = (time.monotonic() + ttl, value)
+
+    async def _quote_equity(self, symbol: str) -> Dict[str, Any]:
+        """
+        Fetch the quote-equity payload (source of both quote and shareholding).
+
+        Cached for QUOTE_TTL; concurrent callers for the same symbol share
+        one request.
+
+        Args:
+            symbol: NSE symbol
+
+        Returns:
+            Raw API response
+        """
+        data = self._cache_get(self._payload_cache, symbol)
+        if data is None:
+            data = await singleflight.do(
+                f"nse:quote-equity:{symbol}", lambda: self._fetch_quote_equity(symbol)
+            )
+            self._cache_put(self._payload_cache, symbol, data, self.QUOTE_TTL)
+        return data
+
+    async def _fetch_quote_equity(self, symbol: str) -> Dict[str, Any]:
+        """
+        Request the quote-equity endpoint.
+
+        Args:
+            symbol: NSE symbol
+
+        Returns:
+            Raw API response
+        """
+        try:
+            response = await self._api_get(
+                'quote-equity',
+                {'symbol': symbol},
+                referer=f"{self.BASE_URL}/get-quotes/equity?symbol={symbol}"
+            )
+
+            if response.status_code == 404:
+                raise ServiceError(f"Symbol '{symbol}' not found on NSE")
+
+            if response.status_code != 200:
+                raise ServiceError(f"NSE API returned status {response.status_code}")
+
+            return orjson.loads(response.content)
+
+        except httpx.TimeoutException as e:
+            raise ServiceError(f"Timeout fetching NSE data for {symbol}") from e
+        except httpx.RequestError as e:
+            raise ServiceUnavailableError(f"Network error: {e}") from e
+        except orjson.JSONDecodeError as e:
+            raise ServiceError(f"Invalid JSON response: {e}") from e
 
     async def get_shareholding(self, symbol: str) -> Dict[str, Any]:
         """
@@ -149,21 +355,14 @@ class NSEService(BaseService):
         symbol = self._validate_symbol(symbol)
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-
-            if not self._session_initialized:
-                await loop.run_in_executor(None, self._init_session)
-
-            result = await loop.run_in_executor(None, self._get_shareholding_sync, symbol)
-            return result
+            return await self._get_shareholding(symbol)
 
         except Exception as e:
             return self._handle_error(e, f"Failed to get shareholding for {symbol}")
 
-    def _get_shareholding_sync(self, symbol: str) -> Dict[str, Any]:
+    async def _get_shareholding(self, symbol: str) -> Dict[str, Any]:
         """
-        Synchronous fetch of shareholding data.
+        Fetch shareholding data (cached for SHAREHOLDING_TTL).
 
         Args:
             symbol: NSE symbol
@@ -171,49 +370,13 @@ class NSEService(BaseService):
         Returns:
             Dictionary with shareholding information
         """
-        # NSE shareholding API endpoint
-        url = f"{self.API_BASE}/quote-equity"
-        params = {'symbol': symbol}
-
-        # Update referer for this specific request
-        headers = self.session.headers.copy()
-        headers['Referer'] = f"{self.BASE_URL}/get-quotes/equity?symbol={symbol}"
-
-        try:
-            response = self.session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=self.timeout
-            )
-
-            # Handle session expiry
-            if response.status_code == 401:
-                self.logger.warning("NSE session expired, reinitializing...")
-                self._session_initialized = False
-                self._init_session()
-                # Retry once
-                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
-
-            if response.status_code == 404:
-                raise ServiceError(f"Symbol '{symbol}' not found on NSE")
-
-            if response.status_code != 200:
-                raise ServiceError(f"NSE API returned status {response.status_code}")
-
-            data = response.json()
-
+        shareholding = self._cache_get(self._shareholding_cache, symbol)
+        if shareholding is None:
             # Extract shareholding pattern
-            shareholding = self._parse_shareholding(data)
+            shareholding = self._parse_shareholding(await self._quote_equity(symbol))
+            self._cache_put(self._shareholding_cache, symbol, shareholding, self.SHAREHOLDING_TTL)
 
-            return shareholding
-
-        except requests.Timeout:
-            raise ServiceError(f"Timeout fetching shareholding for {symbol}")
-        except requests.RequestException as e:
-            raise ServiceUnavailableError(f"Network error: {e}")
-        except ValueError as e:
-            raise ServiceError(f"Invalid JSON response: {e}")
+        return shareholding
 
     def _parse_shareholding(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -282,21 +445,14 @@ class NSEService(BaseService):
         symbol = self._validate_symbol(symbol)
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-
-            if not self._session_initialized:
-                await loop.run_in_executor(None, self._init_session)
-
-            result = await loop.run_in_executor(None, self._get_quote_sync, symbol)
-            return result
+            return await self._get_quote(symbol)
 
         except Exception as e:
             return self._handle_error(e, f"Failed to get quote for {symbol}")
 
-    def _get_quote_sync(self, symbol: str) -> Dict[str, Any]:
+    async def _get_quote(self, symbol: str) -> Dict[str, Any]:
         """
-        Synchronous fetch of live quote.
+        Fetch live quote (at most QUOTE_TTL seconds old).
 
         Args:
             symbol: NSE symbol
@@ -304,54 +460,35 @@ class NSEService(BaseService):
         Returns:
             Dictionary with quote information
         """
-        url = f"{self.API_BASE}/quote-equity"
-        params = {'symbol': symbol}
-
-        headers = self.session.headers.copy()
-        headers['Referer'] = f"{self.BASE_URL}/get-quotes/equity?symbol={symbol}"
-
-        try:
-            response = self.session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=self.timeout
-            )
-
-            if response.status_code == 401:
-                self._session_initialized = False
-                self._init_session()
-                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
-
-            if response.status_code != 200:
-                raise ServiceError(f"NSE API returned status {response.status_code}")
+        return self._parse_quote(await self._quote_equity(symbol))
 
-            data = response.json()
-
-            # Extract price information
-            price_info = data.get('priceInfo', {})
+    def _parse_quote(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse NSE API response to extract quote information.
 
-            return {
-                'last_price': price_info.get('lastPrice', 0),
-                'change': price_info.get('change', 0),
-                'percent_change': price_info.get('pChange', 0),
-                'previous_close': price_info.get('previousClose', 0),
-                'open': price_info.get('open', 0),
-                'close': price_info.get('close', 0),
-                'day_high': price_info.get('intraDayHighLow', {}).get('max', 0),
-                'day_low': price_info.get('intraDayHighLow', {}).get('min', 0),
-                'week_52_high': price_info.get('weekHighLow', {}).get('max', 0),
-                'week_52_low': price_info.get('weekHighLow', {}).get('min', 0),
-                'volume': data.get('preOpenMarket', {}).get('totalTradedVolume', 0),
-                'timestamp': datetime.now().isoformat()
-            }
+        Args:
+            data: Raw API response
 
-        except requests.Timeout:
-            raise ServiceError(f"Timeout fetching quote for {symbol}")
-        except requests.RequestException as e:
-            raise ServiceUnavailableError(f"Network error: {e}")
-        except ValueError as e:
-            raise ServiceError(f"Invalid JSON response: {e}")
+        Returns:
+            Parsed quote data
+        """
+        # Extract price information
+        price_info = data.get('priceInfo', {})
+
+        return {
+            'last_price': price_info.get('lastPrice', 0),
+            'change': price_info.get('change', 0),
+            'percent_change': price_info.get('pChange', 0),
+            'previous_close': price_info.get('previousClose', 0),
+            'open': price_info.get('open', 0),
+            'close': price_info.get('close', 0),
+            'day_high': price_info.get('intraDayHighLow', {}).get('max', 0),
+            'day_low': price_info.get('intraDayHighLow', {}).get('min', 0),
+            'week_52_high': price_info.get('weekHighLow', {}).get('max', 0),
+            'week_52_low': price_info.get('weekHighLow', {}).get('min', 0),
+            'volume': data.get('preOpenMarket', {}).get('totalTradedVolume', 0),
+            'timestamp': iso_now()
+        }
 
     async def search_symbol(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -367,22 +504,90 @@ class NSEService(BaseService):
             return []
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
+            # Prefix matches are served from the local equity list; only
+            # misses go to NSE's autocomplete API
+            results = await self._search_local(query)
+            return results or await self._search_symbol(query)
 
-            if not self._session_initialized:
-                await loop.run_in_executor(None, self._init_session)
+        except Exception as e:
+            self.logger.error(f"Search failed for '{query}': {e}")
+            return []
+
+    async def _search_local(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Prefix-search symbols, then company names, in the equity list.
 
-            result = await loop.run_in_executor(None, self._search_symbol_sync, query)
-            return result
+        Args:
+            query: Search query
 
+        Returns:
+            Up to SEARCH_LIMIT matches, or [] if none (or the list is unavailable)
+        """
+        try:
+            await self._ensure_listings()
         except Exception as e:
-            self.logger.error(f"Search failed for '{query}': {e}")
+            self.logger.warning(f"NSE equity list unavailable, using remote search: {e}")
             return []
 
-    def _search_symbol_sync(self, query: str) -> List[Dict[str, Any]]:
+        prefix = query.strip().upper()
+        seen = set()
+        results = []
+        for keys in (self._symbol_keys, self._name_keys):
+            for i in range(bisect_left(keys, (prefix,)), len(keys)):
+                key, index = keys[i]
+                if not key.startswith(prefix) or len(results) >= self.SEARCH_LIMIT:
+                    break
+                if index not in seen:
+                    seen.add(index)
+                    results.append(self._listings[index])
+
+        return [{**listing, 'type': 'NSE'} for listing in results]
+
+    async def _ensure_listings(self) -> None:
+        """(Re)build the local autocomplete index when missing or older than EQUITY_LIST_TTL."""
+        if time.monotonic() < self._listings_expire_at:
+            return
+
+        # Redis-cached, so workers and restarts share one download per day
+        listings = await cached("nse:equity_list", self.EQUITY_LIST_TTL, self._fetch_listings)
+
+        self._listings = listings
+        self._symbol_keys = sorted((row['symbol'], i) for i, row in enumerate(listings))
+        self._name_keys = sorted((row['name'].upper(), i) for i, row in enumerate(listings))
+        self._listings_expire_at = time.monotonic() + self.EQUITY_LIST_TTL
+
+    async def _fetch_listings(self) -> List[Dict[str, str]]:
         """
-        Synchronous symbol search.
+        Download and parse the NSE listed-equity master (EQUITY_L.csv).
+
+        Returns:
+            Listings as {'symbol', 'name', 'series'} dicts
+        """
+        response = await self.client.get(
+            self.EQUITY_LIST_URL, headers=self.headers, timeout=self.timeout
+        )
+        response.raise_for_status()
+
+        reader = csv.reader(io.StringIO(response.text))
+        # Header cells carry stray spaces (e.g. ' SERIES')
+        columns = {name.strip(): i for i, name in enumerate(next(reader, []))}
+        symbol_col = columns['SYMBOL']
+        name_col = columns['NAME OF COMPANY']
+        series_col = columns['SERIES']
+
+        return [
+            {
+                'symbol': row[symbol_col].strip(),
+                'name': row[name_col].strip(),
+                'series': row[series_col].strip(),
+            }
+            for row in reader
+            if len(row) > max(symbol_col, name_col, series_col)
+        ]
+
+    async def _search_symbol(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Symbol search against the NSE autocomplete API.
 
         Args:
             query: Search query
@@ -390,20 +595,13 @@ class NSEService(BaseService):
         Returns:
             List of matching symbols
         """
-        url = f"{self.API_BASE}/search/autocomplete"
-        params = {'q': query}
-
         try:
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=self.timeout
-            )
+            response = await self._api_get('search/autocomplete', {'q': query})
 
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
             symbols = data.get('symbols', [])
 
             # Format results
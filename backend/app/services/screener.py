@@ -12,14 +12,79 @@ To get the cookie:
 4. Set SCREENER_COOKIE in .env file
 """
 
-from typing import Dict, Any, Optional
-import pandas as pd
-import requests
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import asyncio
+from datetime import date, datetime, time
 from io import BytesIO
 from loguru import logger
-from bs4 import BeautifulSoup
+import httpx
+from lxml import etree, html as lxml_html
+from openpyxl import load_workbook
 
-from app.services.base import BaseService, ServiceError, ServiceUnavailableError
+from app.services.base import (
+    BaseService,
+    ServiceError,
+    ServiceTimeoutError,
+    ServiceUnavailableError
+)
+
+try:
+    # python-calamine (Rust) reads the export workbook ~5x faster than openpyxl
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+
+# Company-page lookups, compiled once (first match in document order)
+_EXPORT_LINK = etree.XPath("//a[contains(@href, '/export/')]/@href")
+_WAREHOUSE_ID = etree.XPath("//*[@data-warehouse-id]/@data-warehouse-id")
+_COMPANY_NAME = etree.XPath("//h1")
+_SECTOR_LINK = etree.XPath("//a[contains(concat(' ', normalize-space(@class), ' '), ' sub ')]")
+
+
+def _parse_html(content: bytes) -> etree._Element:
+    """Parse an HTML page with libxml2 (lenient; empty input gives an empty document)."""
+    return lxml_html.fromstring(content.strip() or b'<html></html>')
+
+
+def _read_sheet_rows(content: bytes, sheet_name: str) -> List[List[Any]]:
+    """
+    Read a worksheet as rows of cell values, without building a DataFrame.
+
+    Args:
+        content: Workbook (.xlsx) bytes
+        sheet_name: Worksheet name
+
+    Returns:
+        Rows as lists, trailing empty cells trimmed; empty cells are None
+    """
+    if CalamineWorkbook is not None:
+        sheet = CalamineWorkbook.from_filelike(BytesIO(content)).get_sheet_by_name(sheet_name)
+        raw_rows = sheet.to_python()
+    else:
+        workbook = load_workbook(BytesIO(content), read_only=True, data_only=True)
+        raw_rows = workbook[sheet_name].iter_rows(values_only=True)
+
+    rows = []
+    for raw in raw_rows:
+        # calamine gives empty cells as '' and date-only cells as date;
+        # normalize to openpyxl's None and datetime
+        row = [
+            None if cell == '' else datetime.combine(cell, time()) if type(cell) is date else cell
+            for cell in raw
+        ]
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(row)
+    return rows
+
+
+def _cell_float(value: Any) -> Optional[float]:
+    """Cell value as float, or None for an empty (None/NaN) cell."""
+    if value is None:
+        return None
+    value = float(value)
+    return None if value != value else value
 
 
 class ScreenerService(BaseService):
@@ -31,15 +96,57 @@ class ScreenerService(BaseService):
 
     BASE_URL = "https://www.screener.in"
 
-    def __init__(self, session_cookie: str, timeout: int = 30):
+    # Export URLs (warehouse ids) remembered per symbol
+    EXPORT_URL_CACHE_MAX = 4096
+
+    # Max symbols fetched from screener.in at once per service instance
+    MAX_CONCURRENT_FETCHES = 8
+
+    # Output metric -> Data Sheet row names to try, in priority order
+    METRIC_ALIASES = {
+        # Revenue metrics
+        'revenue': ('Sales', 'Revenue'),
+        'expenses': ('Expenses', 'Operating Expenses'),
+        'operating_profit': ('Operating Profit', 'EBIT', 'OPM'),
+        'net_profit': ('Net Profit', 'Profit'),
+        # Quality metrics
+        'roce': ('ROCE %', 'ROCE'),
+        'roe': ('ROE %', 'ROE'),
+        # Debt metrics
+        'debt': ('Debt', 'Borrowings'),
+        'debt_to_equity': ('Debt to equity', 'D/E', 'Debt/Equity'),
+        # Asset metrics
+        'assets': ('Total Assets', 'Assets'),
+        'equity': ('Equity', 'Shareholders Equity'),
+        # Per share metrics
+        'eps': ('EPS in Rs', 'EPS'),
+        'book_value': ('Book Value', 'BVPS', 'Book Value Per Share'),
+        # Valuation metrics
+        'pe_ratio': ('PE Ratio', 'P/E', 'Stock P/E'),
+        'market_cap': ('Market Cap', 'Market Capitalization'),
+    }
+
+    # METRIC_ALIASES as (name, lowercased name) pairs, lowered once
+    _METRIC_SEARCH = {
+        metric: tuple((name, name.lower()) for name in names)
+        for metric, names in METRIC_ALIASES.items()
+    }
+
+    def __init__(
+        self,
+        session_cookie: str,
+        timeout: int = 30,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Screener service.
 
         Args:
             session_cookie: Screener.in session cookie (from browser)
             timeout: Request timeout in seconds
+            http_client: Shared pooled HTTP client
         """
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, http_client=http_client)
         self.session_cookie = session_cookie
 
         self.headers = {
@@ -51,7 +158,13 @@ class ScreenerService(BaseService):
             'Accept-Language': 'en-US,en;q=0.9',
         }
 
-        self.cookies = {'sessionid': session_cookie}
+        # Sent as a header: the shared client's cookie jar is process-wide,
+        # and an explicit Cookie header takes precedence over it
+        self.headers['Cookie'] = f'sessionid={session_cookie}'
+
+        # symbol -> export URL found on its company page (stable per company)
+        self._export_urls: Dict[str, str] = {}
+        self._fetch_sem = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
 
     async def fetch_data(self, symbol: str) -> Dict[str, Any]:
         """
@@ -67,16 +180,11 @@ class ScreenerService(BaseService):
             ServiceError: If fetch fails
         """
         symbol = self._validate_symbol(symbol)
-        self.logger.info(f"Fetching fundamentals for {symbol}")
+        self.logger.debug("Fetching fundamentals for {}", symbol)
 
         try:
-            # Use asyncio to run synchronous requests in executor
-            import asyncio
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._fetch_fundamentals_sync, symbol
-            )
-            return result
+            async with self._fetch_sem:
+                return await self._fetch_fundamentals(symbol)
 
         except ServiceError:
             self.logger.error(f"Failed to fetch data for {symbol}")
@@ -85,9 +193,32 @@ class ScreenerService(BaseService):
             self.logger.error(f"Error fetching Screener data for {symbol}: {e}")
             raise ServiceError(f"Failed to fetch data from Screener.in: {e}")
 
-    def _fetch_fundamentals_sync(self, symbol: str) -> Dict[str, Any]:
+    async def fetch_many(self, symbols: Sequence[str]) -> Dict[str, Any]:
         """
-        Synchronous fetch of fundamentals (runs in executor).
+        Fetch fundamentals for several symbols concurrently.
+
+        At most MAX_CONCURRENT_FETCHES symbols are in flight at a time, so a
+        20-symbol watchlist takes about three round trips, not twenty.
+
+        Args:
+            symbols: NSE symbols (e.g., ['RELIANCE', 'TCS'])
+
+        Returns:
+            Dict of symbol -> fundamentals, or the ServiceError it raised
+        """
+        results = await asyncio.gather(
+            *(self.fetch_data(symbol) for symbol in symbols), return_exceptions=True
+        )
+        return dict(zip(symbols, results))
+
+    async def _fetch_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """
+        Fetch fundamentals over the pooled client.
+
+        The company page is only fetched to discover a symbol's export URL;
+        once known, a fetch is the single export request. Requests reuse
+        kept-alive screener.in connections; only the HTML and Excel parsing
+        (CPU-bound) run in a worker thread.
 
         Args:
             symbol: Stock symbol
@@ -96,56 +227,26 @@ class ScreenerService(BaseService):
             Dictionary with parsed financial data
         """
         try:
-            # First, fetch company page to check existence and get export URL
             company_url = f"{self.BASE_URL}/company/{symbol}/consolidated/"
-            check_response = requests.get(
-                company_url,
-                headers=self.headers,
-                cookies=self.cookies,
-                timeout=self.timeout,
-                allow_redirects=True
-            )
+            headers = {**self.headers, 'Referer': company_url}
 
-            if check_response.status_code == 404:
-                raise ServiceError(f"Company '{symbol}' not found on Screener.in")
+            # A known export URL skips the company page round trip
+            cached_url = self._export_urls.get(symbol)
+            if cached_url is not None:
+                export_url, has_export_link = cached_url, True
+            else:
+                export_url, has_export_link = await self._resolve_export_url(symbol, company_url)
+            self.logger.debug("Using export URL: {}", export_url)
 
-            if check_response.status_code == 403:
-                raise ServiceError(
-                    "Screener.in session expired. Please update SCREENER_COOKIE"
-                )
+            # Now fetch the Excel export, referred from the company page
+            response = await self.client.get(export_url, headers=headers, timeout=self.timeout)
 
-            # Parse HTML to find export URL
-            soup = BeautifulSoup(check_response.content, 'html.parser')
-            
-            # Look for Export to Excel link
-            export_link = soup.find('a', href=lambda h: h and '/export/' in h)
-            
-            if export_link and export_link.get('href'):
-                href = export_link['href']
-                export_url = f"{self.BASE_URL}{href}" if href.startswith('/') else href
-            else:
-                self.logger.warning(f"Export link not found for {symbol}. Cookie might be invalid.")
-                # Fallback: Try to find warehouse_id
-                warehouse_elem = soup.find(attrs={"data-warehouse-id": True})
-                if warehouse_elem:
-                    warehouse_id = warehouse_elem['data-warehouse-id']
-                    export_url = f"{self.BASE_URL}/api/company/{warehouse_id}/export/"
-                else:
-                    # Last resort
-                    export_url = f"{self.BASE_URL}/api/company/{symbol}/export/"
-            
-            self.logger.info(f"Using export URL: {export_url}")
-
-            # Update Referer to the company page
-            self.headers['Referer'] = company_url
-
-            # Now fetch the Excel export
-            response = requests.get(
-                export_url,
-                headers=self.headers,
-                cookies=self.cookies,
-                timeout=self.timeout
-            )
+            if response.status_code == 404 and cached_url is not None:
+                # Stale cached URL: resolve it again from the company page
+                self._export_urls.pop(symbol, None)
+                cached_url = None
+                export_url, has_export_link = await self._resolve_export_url(symbol, company_url)
+                response = await self.client.get(export_url, headers=headers, timeout=self.timeout)
 
             if response.status_code == 403:
                 raise ServiceError(
@@ -154,7 +255,7 @@ class ScreenerService(BaseService):
                 )
 
             if response.status_code == 404:
-                if not export_link:
+                if not has_export_link:
                     raise ServiceError(
                         f"Unable to fetch data for {symbol}. "
                         "The 'Export to Excel' button was not found, which usually means "
@@ -176,22 +277,82 @@ class ScreenerService(BaseService):
                     "Cookie may be expired or symbol invalid."
                 )
 
+            if has_export_link and cached_url is None:
+                if len(self._export_urls) >= self.EXPORT_URL_CACHE_MAX:
+                    del self._export_urls[next(iter(self._export_urls))]
+                self._export_urls[symbol] = export_url
+
             # Parse Excel data
-            data = self._parse_excel(response.content, symbol)
+            data = await asyncio.to_thread(self._parse_excel, response.content, symbol)
 
-            self.logger.info(f"Successfully fetched data for {symbol}")
+            self.logger.debug("Successfully fetched data for {}", symbol)
             return data
 
         except ServiceError:
             raise
-        except requests.Timeout:
-            raise ServiceError(f"Timeout while fetching data for {symbol}")
-        except requests.RequestException as e:
-            raise ServiceUnavailableError(f"Network error: {e}")
+        except httpx.TimeoutException as e:
+            raise ServiceTimeoutError(f"Timeout while fetching data for {symbol}") from e
+        except httpx.RequestError as e:
+            raise ServiceUnavailableError(f"Network error: {e}") from e
         except Exception as e:
             self.logger.error(f"Unexpected error parsing Screener data: {e}")
             raise ServiceError(f"Failed to parse Screener data: {e}")
 
+    async def _resolve_export_url(self, symbol: str, company_url: str) -> Tuple[str, bool]:
+        """
+        Fetch the company page to check the symbol and find its export URL.
+
+        Args:
+            symbol: Stock symbol
+            company_url: Consolidated company page URL
+
+        Returns:
+            (export URL, whether the 'Export to Excel' link was present)
+        """
+        check_response = await self.client.get(
+            company_url, headers=self.headers, timeout=self.timeout
+        )
+
+        if check_response.status_code == 404:
+            raise ServiceError(f"Company '{symbol}' not found on Screener.in")
+
+        if check_response.status_code == 403:
+            raise ServiceError(
+                "Screener.in session expired. Please update SCREENER_COOKIE"
+            )
+
+        return await asyncio.to_thread(self._find_export_url, check_response.content, symbol)
+
+    def _find_export_url(self, html: bytes, symbol: str) -> Tuple[str, bool]:
+        """
+        Find the Excel export URL on a company page.
+
+        Args:
+            html: Company page HTML
+            symbol: Stock symbol (last-resort URL)
+
+        Returns:
+            (export URL, whether the 'Export to Excel' link was present)
+        """
+        page = _parse_html(html)
+
+        # Look for Export to Excel link
+        export_hrefs = _EXPORT_LINK(page)
+
+        if export_hrefs:
+            href = export_hrefs[0]
+            return (f"{self.BASE_URL}{href}" if href.startswith('/') else href), True
+
+        self.logger.warning(f"Export link not found for {symbol}. Cookie might be invalid.")
+        # Fallback: Try to find warehouse_id
+        warehouse_ids = _WAREHOUSE_ID(page)
+        if warehouse_ids:
+            warehouse_id = warehouse_ids[0]
+            return f"{self.BASE_URL}/api/company/{warehouse_id}/export/", False
+
+        # Last resort
+        return f"{self.BASE_URL}/api/company/{symbol}/export/", False
+
     def _parse_excel(self, content: bytes, symbol: str) -> Dict[str, Any]:
         """
         Parse Excel content from Screener.in export.
@@ -208,56 +369,38 @@ class ScreenerService(BaseService):
             Dictionary with parsed metrics
         """
         try:
-            # Read Excel file
-            excel_file = BytesIO(content)
-            df = pd.read_excel(excel_file, sheet_name='Data Sheet', engine='openpyxl')
+            # Read the sheet as plain rows (no DataFrame)
+            sheet = _read_sheet_rows(content, 'Data Sheet')
+            header, body = (sheet[0], sheet[1:]) if sheet else ([], [])
 
             # Screener format: First column is metric name, rest are years
             # Example:
             # Metric Name | Mar 2024 | Mar 2023 | Mar 2022 | ...
             # Sales       | 1000     | 900      | 850      | ...
             # ROCE        | 15.5     | 14.2     | 13.8     | ...
+            width = max(map(len, sheet), default=0)
 
-            # Set first column as index
-            df.set_index(df.columns[0], inplace=True)
+            # Row label -> values (one per year column), plus lowercased labels
+            # in sheet order, so each _extract_metric call is a dict lookup or
+            # one scan. Blank rows and unlabeled rows are skipped.
+            rows: Dict[Any, List[Any]] = {}
+            for row in body:
+                if row and row[0] is not None:
+                    rows.setdefault(row[0], row[1:] + [None] * (width - len(row)))
+            labels = [(str(label).lower(), label) for label in rows]
 
             # Extract key metrics
-            metrics = {}
-
-            # Revenue metrics
-            metrics['revenue'] = self._extract_metric(df, ['Sales', 'Revenue'])
-            metrics['expenses'] = self._extract_metric(df, ['Expenses', 'Operating Expenses'])
-            metrics['operating_profit'] = self._extract_metric(
-                df, ['Operating Profit', 'EBIT', 'OPM']
-            )
-            metrics['net_profit'] = self._extract_metric(df, ['Net Profit', 'Profit'])
-
-            # Quality metrics
-            metrics['roce'] = self._extract_metric(df, ['ROCE %', 'ROCE'])
-            metrics['roe'] = self._extract_metric(df, ['ROE %', 'ROE'])
-
-            # Debt metrics
-            metrics['debt'] = self._extract_metric(df, ['Debt', 'Borrowings'])
-            metrics['debt_to_equity'] = self._extract_metric(
-                df, ['Debt to equity', 'D/E', 'Debt/Equity']
-            )
-
-            # Asset metrics
-            metrics['assets'] = self._extract_metric(df, ['Total Assets', 'Assets'])
-            metrics['equity'] = self._extract_metric(df, ['Equity', 'Shareholders Equity'])
-
-            # Per share metrics
-            metrics['eps'] = self._extract_metric(df, ['EPS in Rs', 'EPS'])
-            metrics['book_value'] = self._extract_metric(
-                df, ['Book Value', 'BVPS', 'Book Value Per Share']
-            )
-
-            # Valuation metrics
-            metrics['pe_ratio'] = self._extract_metric(df, ['PE Ratio', 'P/E', 'Stock P/E'])
-            metrics['market_cap'] = self._extract_metric(df, ['Market Cap', 'Market Capitalization'])
+            metrics = {
+                metric: self._extract_metric(rows, labels, aliases)
+                for metric, aliases in self._METRIC_SEARCH.items()
+            }
 
-            # Get years (column names)
-            years = [col for col in df.columns if col != df.index.name]
+            # Get years (header cells; blank ones named like pandas did)
+            header = header + [None] * (width - len(header))
+            years = [
+                col if col is not None else f'Unnamed: {i}'
+                for i, col in enumerate(header)
+            ][1:]
             metrics['years'] = years
 
             # Metadata
@@ -271,32 +414,35 @@ class ScreenerService(BaseService):
             self.logger.error(f"Error parsing Excel for {symbol}: {e}")
             raise ServiceError(f"Failed to parse Excel data: {e}")
 
-    def _extract_metric(self, df: pd.DataFrame, possible_names: list) -> list:
+    def _extract_metric(
+        self,
+        rows: Dict[Any, List[Any]],
+        labels: List[Tuple[str, Any]],
+        aliases: Sequence[Tuple[str, str]]
+    ) -> list:
         """
-        Extract a metric from dataframe with multiple possible row names.
+        Extract a metric from the sheet rows with multiple possible row names.
 
         Args:
-            df: DataFrame with metrics as index
-            possible_names: List of possible metric names to search for
+            rows: Row label -> values across years
+            labels: (lowercased label, label) pairs in sheet order
+            aliases: (row name, lowercased row name) pairs to try, in order
 
         Returns:
             List of values across years, or empty list if not found
         """
-        for name in possible_names:
-            # Try exact match
-            if name in df.index:
-                values = df.loc[name].tolist()
-                # Convert to float, handle NaN
-                return [float(v) if pd.notna(v) else None for v in values]
+        for name, lowered in aliases:
+            # Try exact match, then case-insensitive partial match
+            values = rows.get(name)
+            if values is None:
+                values = next((rows[label] for text, label in labels if lowered in text), None)
 
-            # Try case-insensitive partial match
-            matching = [idx for idx in df.index if name.lower() in str(idx).lower()]
-            if matching:
-                values = df.loc[matching[0]].tolist()
-                return [float(v) if pd.notna(v) else None for v in values]
+            if values is not None:
+                # Convert to float, handle NaN
+                return [_cell_float(v) for v in values]
 
         # Not found
-        self.logger.warning(f"Metric not found in data: {possible_names}")
+        self.logger.warning(f"Metric not found in data: {[name for name, _ in aliases]}")
         return []
 
     async def get_company_info(self, symbol: str) -> Dict[str, Any]:
@@ -311,51 +457,40 @@ class ScreenerService(BaseService):
         """
         symbol = self._validate_symbol(symbol)
 
+        url = f"{self.BASE_URL}/company/{symbol}/consolidated/"
+
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._get_company_info_sync, symbol
-            )
-            return result
+            response = await self.client.get(url, headers=self.headers, timeout=self.timeout)
+
+            if response.status_code != 200:
+                raise ServiceError(f"Failed to fetch company info: {response.status_code}")
+
+            return await asyncio.to_thread(self._parse_company_info, response.content, symbol)
 
         except Exception as e:
             return self._handle_error(e, f"Failed to get company info for {symbol}")
 
-    def _get_company_info_sync(self, symbol: str) -> Dict[str, Any]:
+    def _parse_company_info(self, html: bytes, symbol: str) -> Dict[str, Any]:
         """
-        Synchronous fetch of company info.
+        Extract basic company info from a company page.
 
         Args:
+            html: Company page HTML
             symbol: Stock symbol
 
         Returns:
             Dictionary with company information
         """
-        url = f"{self.BASE_URL}/company/{symbol}/consolidated/"
-
         try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                cookies=self.cookies,
-                timeout=self.timeout
-            )
-
-            if response.status_code != 200:
-                raise ServiceError(f"Failed to fetch company info: {response.status_code}")
-
-            # Parse HTML to extract basic info
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = _parse_html(html)
 
             # Extract company name
-            name_elem = soup.find('h1')
-            name = name_elem.text.strip() if name_elem else symbol
+            name_elems = _COMPANY_NAME(page)
+            name = name_elems[0].text_content().strip() if name_elems else symbol
 
             # Extract sector (usually in a specific div)
-            sector_elem = soup.find('a', {'class': 'sub'})
-            sector = sector_elem.text.strip() if sector_elem else None
+            sector_elems = _SECTOR_LINK(page)
+            sector = sector_elems[0].text_content().strip() if sector_elems else None
 
             return {
                 'symbol': symbol,
@@ -11,12 +11,19 @@ Uses the yfinance library to fetch:
 Note: Yahoo Finance data has a 15-minute delay for free tier.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Set, Tuple
+import asyncio
+import threading
+import time
 import yfinance as yf
-from datetime import datetime, timedelta
+from datetime import timedelta
+import numpy as np
 import pandas as pd
 from loguru import logger
+import httpx
+import orjson
 
+from app.core.clock import iso_now
 from app.services.base import BaseService, ServiceError
 
 
@@ -28,27 +35,73 @@ class YahooFinanceService(BaseService):
     to Yahoo Finance's unofficial API.
     """
 
-    # Valid period values for yfinance
-    VALID_PERIODS = ['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max']
+    # Chart API (what yfinance's history() calls), for single-price lookups
+    CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
 
-    # Valid interval values
-    VALID_INTERVALS = ['1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo']
+    # Autocomplete API (name and symbol matches), for search_symbols
+    SEARCH_URL = "https://query2.finance.yahoo.com/v1/finance/search"
+
+    # Indian exchange suffix -> search result 'type'
+    EXCHANGE_TYPES = {'.NS': 'NSE', '.BO': 'BSE'}
 
-    def __init__(self, timeout: int = 30):
+    # Valid period values for yfinance (error message keeps this order)
+    _PERIODS = ('1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max')
+    VALID_PERIODS = frozenset(_PERIODS)
+    _PERIOD_ERROR = f"Invalid period. Must be one of: {', '.join(_PERIODS)}"
+
+    # Valid interval values
+    _INTERVALS = (
+        '1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo'
+    )
+    VALID_INTERVALS = frozenset(_INTERVALS)
+    _INTERVAL_ERROR = f"Invalid interval. Must be one of: {', '.join(_INTERVALS)}"
+
+    # fetch_data fields that need the extra price-history request
+    PRICE_FIELDS = frozenset({
+        'current_price', 'previous_close', 'change', 'percent_change',
+        'open', 'day_high', 'day_low', 'volume'
+    })
+
+    # Max fetch_many symbols in flight (each holds a market-io thread)
+    MAX_CONCURRENT_FETCHES = 8
+
+    # Ticker.info (several scrape requests) is reused for INFO_TTL seconds
+    INFO_TTL = 300
+    CACHE_MAX_SYMBOLS = 2048
+
+    def __init__(self, timeout: int = 30, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize Yahoo Finance service.
 
         Args:
             timeout: Request timeout in seconds
+            http_client: Shared pooled HTTP client
         """
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, http_client=http_client)
+
+        # Yahoo rejects requests without a browser User-Agent
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                         'AppleWebKit/537.36 (KHTML, like Gecko) '
+                         'Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'application/json',
+        }
+
+        self._fetch_sem = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
+        # symbol -> (expires_at monotonic, Ticker.info); filled from worker
+        # threads, so dict updates hold _info_lock (the fetch itself does not)
+        self._info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._info_lock = threading.Lock()
 
-    async def fetch_data(self, symbol: str) -> Dict[str, Any]:
+    async def fetch_data(self, symbol: str, fields: Optional[Set[str]] = None) -> Dict[str, Any]:
         """
         Fetch comprehensive data for a stock from Yahoo Finance.
 
         Args:
             symbol: Yahoo Finance symbol (e.g., 'RELIANCE.NS', 'TCS.BO')
+            fields: Only return these keys (plus 'symbol'); price history is
+                    skipped when none of PRICE_FIELDS are requested
 
         Returns:
             Dictionary with price data, info, and financials
@@ -59,27 +112,48 @@ class YahooFinanceService(BaseService):
         symbol = self._validate_symbol(symbol)
         symbol = self._ensure_suffix(symbol)
 
-        self.logger.info(f"Fetching data from Yahoo Finance for {symbol}")
+        self.logger.debug("Fetching data from Yahoo Finance for {}", symbol)
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-
-            # Run yfinance operations in executor (they are synchronous)
-            result = await loop.run_in_executor(
-                None, self._fetch_data_sync, symbol
-            )
+            # Run yfinance operations on the market-io pool (they are synchronous)
+            result = await self._run_blocking(self._fetch_data_sync, symbol, fields)
             return result
 
         except Exception as e:
             return self._handle_error(e, f"Failed to fetch Yahoo Finance data for {symbol}")
 
-    def _fetch_data_sync(self, symbol: str) -> Dict[str, Any]:
+    async def fetch_many(
+        self,
+        symbols: Sequence[str],
+        fields: Optional[Set[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch data for several symbols concurrently.
+
+        At most MAX_CONCURRENT_FETCHES run at a time, so a large watchlist
+        does not take over the market-io thread pool.
+
+        Args:
+            symbols: Yahoo Finance symbols (e.g., ['RELIANCE.NS', 'TCS'])
+            fields: Optional projection (see fetch_data)
+
+        Returns:
+            Dict of input symbol -> fetch_data result (error dict on failure)
+        """
+        async def fetch_one(symbol: str) -> Dict[str, Any]:
+            async with self._fetch_sem:
+                return await self.fetch_data(symbol, fields)
+
+        results = await asyncio.gather(*(fetch_one(symbol) for symbol in symbols))
+        return dict(zip(symbols, results))
+
+    def _fetch_data_sync(self, symbol: str, fields: Optional[Set[str]] = None) -> Dict[str, Any]:
         """
         Synchronous fetch of Yahoo Finance data.
 
         Args:
             symbol: Yahoo Finance symbol
+            fields: Optional projection (see fetch_data)
 
         Returns:
             Dictionary with comprehensive stock data
@@ -88,7 +162,12 @@ class YahooFinanceService(BaseService):
             ticker = yf.Ticker(symbol)
 
             # Get basic info
-            info = ticker.info
+            info = self._get_info(symbol, ticker)
+
+            if fields is not None and self.PRICE_FIELDS.isdisjoint(fields):
+                # Profile-only request: skip the price history round trip
+                data = self._info_fields(symbol, info)
+                return {k: v for k, v in data.items() if k in fields or k == 'symbol'}
 
             # Get latest price
             hist = ticker.history(period='5d')
@@ -97,30 +176,85 @@ class YahooFinanceService(BaseService):
                 raise ServiceError(f"No data found for symbol '{symbol}'")
 
             latest = hist.iloc[-1]
-
-            return {
-                'symbol': symbol,
-                'name': info.get('longName', info.get('shortName', symbol)),
-                'sector': info.get('sector', None),
-                'industry': info.get('industry', None),
-                'current_price': latest['Close'],
-                'previous_close': info.get('previousClose', latest['Close']),
-                'open': latest['Open'],
-                'day_high': latest['High'],
-                'day_low': latest['Low'],
-                'volume': latest['Volume'],
-                'market_cap': info.get('marketCap', None),
-                'pe_ratio': info.get('trailingPE', None),
-                'dividend_yield': info.get('dividendYield', None),
-                'week_52_high': info.get('fiftyTwoWeekHigh', None),
-                'week_52_low': info.get('fiftyTwoWeekLow', None),
-                'source': 'yahoo_finance',
-                'timestamp': datetime.now().isoformat()
-            }
+            previous_close = info.get('previousClose', latest['Close'])
+
+            # Derived once here so cached quotes don't recompute them per request
+            change = latest['Close'] - previous_close if previous_close else None
+            percent_change = change / previous_close * 100 if previous_close else None
+
+            data = self._info_fields(symbol, info)
+            # Plain Python numbers: endpoints build responses without re-validation
+            data.update({
+                'current_price': float(latest['Close']),
+                'previous_close': float(previous_close) if previous_close is not None else None,
+                'change': float(change) if change is not None else None,
+                'percent_change': float(percent_change) if percent_change is not None else None,
+                'open': float(latest['Open']),
+                'day_high': float(latest['High']),
+                'day_low': float(latest['Low']),
+                'volume': int(latest['Volume']),
+            })
+
+            if fields is not None:
+                return {k: v for k, v in data.items() if k in fields or k == 'symbol'}
+
+            return data
 
         except Exception as e:
             raise ServiceError(f"Failed to fetch data from Yahoo Finance: {e}")
 
+    def _get_info(self, symbol: str, ticker: Optional[yf.Ticker] = None) -> Dict[str, Any]:
+        """
+        Get Ticker.info for a symbol, cached for INFO_TTL seconds.
+
+        Runs in worker threads; a cold symbol fetched by two threads at
+        once is simply fetched twice.
+
+        Args:
+            symbol: Yahoo Finance symbol
+            ticker: Existing Ticker for symbol, if the caller has one
+
+        Returns:
+            yfinance Ticker.info dictionary
+        """
+        entry = self._info_cache.get(symbol)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        info = (ticker if ticker is not None else yf.Ticker(symbol)).info
+
+        with self._info_lock:
+            self._info_cache.pop(symbol, None)
+            if len(self._info_cache) >= self.CACHE_MAX_SYMBOLS:
+                self._info_cache.pop(next(iter(self._info_cache)))
+            self._info_cache[symbol] = (time.monotonic() + self.INFO_TTL, info)
+        return info
+
+    def _info_fields(self, symbol: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the fetch_data fields that come from Ticker.info.
+
+        Args:
+            symbol: Yahoo Finance symbol
+            info: yfinance Ticker.info dictionary
+
+        Returns:
+            Dictionary of profile/valuation fields
+        """
+        return {
+            'symbol': symbol,
+            'name': info.get('longName', info.get('shortName', symbol)),
+            'sector': info.get('sector', None),
+            'industry': info.get('industry', None),
+            'market_cap': info.get('marketCap', None),
+            'pe_ratio': info.get('trailingPE', None),
+            'dividend_yield': info.get('dividendYield', None),
+            'week_52_high': info.get('fiftyTwoWeekHigh', None),
+            'week_52_low': info.get('fiftyTwoWeekLow', None),
+            'source': 'yahoo_finance',
+            'timestamp': iso_now()
+        }
+
     async def get_prices(
         self,
         symbol: str,
@@ -142,18 +276,13 @@ class YahooFinanceService(BaseService):
         symbol = self._ensure_suffix(symbol)
 
         if period not in self.VALID_PERIODS:
-            raise ValueError(f"Invalid period. Must be one of: {', '.join(self.VALID_PERIODS)}")
+            raise ValueError(self._PERIOD_ERROR)
 
         if interval not in self.VALID_INTERVALS:
-            raise ValueError(f"Invalid interval. Must be one of: {', '.join(self.VALID_INTERVALS)}")
+            raise ValueError(self._INTERVAL_ERROR)
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-
-            result = await loop.run_in_executor(
-                None, self._get_prices_sync, symbol, period, interval
-            )
+            result = await self._run_blocking(self._get_prices_sync, symbol, period, interval)
             return result
 
         except Exception as e:
@@ -169,7 +298,8 @@ class YahooFinanceService(BaseService):
             interval: Data interval
 
         Returns:
-            Dictionary with OHLC data
+            Dictionary with OHLC data as parallel column lists under 'columns'
+            (date, timestamp, open, high, low, close, volume)
         """
         try:
             ticker = yf.Ticker(symbol)
@@ -178,25 +308,24 @@ class YahooFinanceService(BaseService):
             if hist.empty:
                 raise ServiceError(f"No price data found for {symbol}")
 
-            # Convert DataFrame to list of dictionaries
-            prices = []
-            for index, row in hist.iterrows():
-                prices.append({
-                    'date': index.strftime('%Y-%m-%d'),
-                    'timestamp': int(index.timestamp()),
-                    'open': float(row['Open']),
-                    'high': float(row['High']),
-                    'low': float(row['Low']),
-                    'close': float(row['Close']),
-                    'volume': int(row['Volume'])
-                })
+            # Convert whole columns at once instead of iterating rows
+            index = hist.index
+            columns = {
+                'date': index.strftime('%Y-%m-%d').tolist(),
+                'timestamp': index.as_unit('s').asi8.tolist(),
+                'open': hist['Open'].astype(float).tolist(),
+                'high': hist['High'].astype(float).tolist(),
+                'low': hist['Low'].astype(float).tolist(),
+                'close': hist['Close'].astype(float).tolist(),
+                'volume': hist['Volume'].astype('int64').tolist()
+            }
 
             return {
                 'symbol': symbol,
                 'period': period,
                 'interval': interval,
-                'prices': prices,
-                'count': len(prices)
+                'columns': columns,
+                'count': len(hist)
             }
 
         except Exception as e:
@@ -219,17 +348,38 @@ class YahooFinanceService(BaseService):
         symbol = self._ensure_suffix(symbol)
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
+            return await self._get_chart_price(symbol)
+        except (ServiceError, orjson.JSONDecodeError, LookupError, TypeError, ValueError) as e:
+            self.logger.debug("Chart price failed for {}, using yfinance: {}", symbol, e)
 
-            price = await loop.run_in_executor(
-                None, self._get_current_price_sync, symbol
-            )
+        try:
+            price = await self._run_blocking(self._get_current_price_sync, symbol)
             return price
 
         except Exception as e:
             raise ServiceError(f"Failed to get current price for {symbol}: {e}")
 
+    async def _get_chart_price(self, symbol: str) -> float:
+        """
+        Get the latest price from Yahoo's chart endpoint.
+
+        One JSON request over the pooled client; no Ticker, history
+        DataFrame or worker thread.
+
+        Args:
+            symbol: Yahoo Finance symbol
+
+        Returns:
+            Regular market price
+        """
+        response = await self._get(
+            self.CHART_URL.format(symbol=symbol),
+            params={'range': '1d', 'interval': '1d'},
+            headers=self.headers
+        )
+        meta = orjson.loads(response.content)['chart']['result'][0]['meta']
+        return float(meta['regularMarketPrice'])
+
     def _get_current_price_sync(self, symbol: str) -> float:
         """
         Synchronous fetch of current price.
@@ -267,65 +417,92 @@ class YahooFinanceService(BaseService):
             return []
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-
-            results = await loop.run_in_executor(
-                None, self._search_symbols_sync, query, limit
-            )
-            return results
+            return await self._search_quotes(query, limit)
+        except (ServiceError, orjson.JSONDecodeError, LookupError, TypeError, ValueError) as e:
+            self.logger.debug("Search API failed for '{}', guessing symbols: {}", query, e)
 
-        except Exception as e:
-            self.logger.error(f"Search failed for '{query}': {e}")
-            return []
+        return await self._search_exact(query, limit)
 
-    def _search_symbols_sync(self, query: str, limit: int) -> List[Dict[str, Any]]:
+    async def _search_quotes(self, query: str, limit: int) -> List[Dict[str, Any]]:
         """
-        Synchronous symbol search using yfinance.
+        Search Yahoo's autocomplete endpoint for NSE/BSE listings.
 
-        Note: yfinance doesn't have a native search API, so we try to
-        construct NSE/BSE symbols and validate them.
+        One JSON request over the pooled client; matches partial company
+        names as well as symbols.
 
         Args:
             query: Search query
-            limit: Max results
+            limit: Maximum number of results
 
         Returns:
-            List of matching symbols
+            List of matching stocks, best match first
         """
+        response = await self._get(
+            self.SEARCH_URL,
+            params={'q': query, 'quotesCount': limit * 2, 'newsCount': 0},
+            headers=self.headers
+        )
+
         results = []
+        for quote in orjson.loads(response.content)['quotes']:
+            symbol = quote.get('symbol') or ''
+            exchange = self.EXCHANGE_TYPES.get(symbol[-3:])
+            if exchange is None:
+                continue  # Not listed in India
+
+            results.append({
+                'symbol': symbol,
+                'name': quote.get('longname') or quote.get('shortname') or symbol,
+                'type': exchange,
+                'sector': quote.get('sector'),
+                'industry': quote.get('industry'),
+                'market_cap': None
+            })
+            if len(results) == limit:
+                break
+
+        return results
+
+    async def _search_exact(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Look the query up as an exact NSE and BSE symbol through yfinance.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+
+        Returns:
+            List of matching stocks
+        """
         query_upper = query.upper()
 
-        # For Indian stocks, try both NSE and BSE
+        # For Indian stocks, try both NSE and BSE (looked up concurrently)
         symbols_to_try = [
             f"{query_upper}.NS",  # NSE
             f"{query_upper}.BO",  # BSE
         ]
 
-        for symbol in symbols_to_try:
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-
-                # Check if valid (has basic data)
-                if info.get('longName') or info.get('shortName'):
-                    results.append({
-                        'symbol': symbol,
-                        'name': info.get('longName', info.get('shortName', symbol)),
-                        'type': 'NSE' if '.NS' in symbol else 'BSE',
-                        'sector': info.get('sector', None),
-                        'industry': info.get('industry', None),
-                        'market_cap': info.get('marketCap', None)
-                    })
-
-                if len(results) >= limit:
-                    break
-
-            except Exception:
-                # Symbol doesn't exist, skip
+        infos = await asyncio.gather(
+            *(self._run_blocking(self._get_info, symbol) for symbol in symbols_to_try),
+            return_exceptions=True
+        )
+
+        results = []
+        for symbol, info in zip(symbols_to_try, infos):
+            # Symbol doesn't exist (lookup failed or no basic data): skip
+            if isinstance(info, Exception) or not (info.get('longName') or info.get('shortName')):
                 continue
 
-        return results
+            results.append({
+                'symbol': symbol,
+                'name': info.get('longName', info.get('shortName', symbol)),
+                'type': 'NSE' if '.NS' in symbol else 'BSE',
+                'sector': info.get('sector', None),
+                'industry': info.get('industry', None),
+                'market_cap': info.get('marketCap', None)
+            })
+
+        return results[:limit]
 
     async def get_technicals(self, symbol: str, period: str = '1y') -> Dict[str, Any]:
         """
@@ -347,12 +524,7 @@ class YahooFinanceService(BaseService):
         symbol = self._ensure_suffix(symbol)
 
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-
-            result = await loop.run_in_executor(
-                None, self._get_technicals_sync, symbol, period
-            )
+            result = await self._run_blocking(self._get_technicals_sync, symbol, period)
             return result
 
         except Exception as e:
@@ -376,25 +548,21 @@ class YahooFinanceService(BaseService):
             if hist.empty or len(hist) < 200:
                 raise ServiceError(f"Insufficient data for technical analysis: {symbol}")
 
-            close_prices = hist['Close']
+            close_prices = hist['Close'].to_numpy(dtype=float)
 
-            # Calculate moving averages
-            sma_20 = close_prices.rolling(window=20).mean().iloc[-1]
-            sma_50 = close_prices.rolling(window=50).mean().iloc[-1]
-            sma_200 = close_prices.rolling(window=200).mean().iloc[-1]
+            # Only the latest value of each indicator is returned, so average
+            # the trailing window directly instead of building rolling series
+            sma_20 = close_prices[-20:].mean()
+            sma_50 = close_prices[-50:].mean()
+            sma_200 = close_prices[-200:].mean()
 
-            current_price = close_prices.iloc[-1]
+            current_price = close_prices[-1]
 
-            # Simple RSI calculation (14-day)
-            delta = close_prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = rsi.iloc[-1]
+            # Wilder RSI (14-day)
+            current_rsi = self._rsi(close_prices, 14)
 
             # Price momentum (% change over period)
-            momentum = ((current_price - close_prices.iloc[0]) / close_prices.iloc[0]) * 100
+            momentum = ((current_price - close_prices[0]) / close_prices[0]) * 100
 
             return {
                 'symbol': symbol,
@@ -411,6 +579,40 @@ class YahooFinanceService(BaseService):
         except Exception as e:
             raise ServiceError(f"Failed to calculate technicals: {e}")
 
+    @staticmethod
+    def _rsi(close_prices: np.ndarray, window: int = 14) -> float:
+        """
+        Latest Wilder RSI (the TA-Lib / charting-platform definition).
+
+        Average gain and loss are seeded with the simple mean of the first
+        `window` changes, then smoothed as avg = (avg * (window - 1) + x) / window
+        over the rest. That recurrence is an exponential average, so it is
+        evaluated as one weighted dot product instead of a Python loop.
+
+        Args:
+            close_prices: Closing prices, oldest first (more than `window`)
+            window: Lookback in bars
+
+        Returns:
+            RSI value (0-100)
+        """
+        delta = np.diff(close_prices)
+        gains = np.clip(delta, 0.0, None)
+        losses = np.clip(-delta, 0.0, None)
+
+        decay = (window - 1) / window
+        # Weight of each later change in the final average (newest weighs 1/window)
+        weights = decay ** np.arange(len(delta) - window - 1, -1, -1) / window
+        seed_weight = decay ** (len(delta) - window)
+
+        avg_gain = seed_weight * gains[:window].mean() + weights @ gains[window:]
+        avg_loss = seed_weight * losses[:window].mean() + weights @ losses[window:]
+
+        if avg_loss == 0:
+            return 100.0
+
+        return float(100 - 100 / (1 + avg_gain / avg_loss))
+
     def _determine_trend(
         self,
         price: float,
@@ -50,6 +50,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,  # Detect column type changes
         compare_server_default=True,  # Detect default value changes
+        transaction_per_migration=True,  # autocommit_block() commits one revision only
     )
 
     with context.begin_transaction():
@@ -75,6 +76,9 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,  # Detect column type changes
             compare_server_default=True,  # Detect default value changes
+            # One transaction per revision, so a migration's autocommit_block()
+            # (CREATE INDEX CONCURRENTLY) only commits that revision's work
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
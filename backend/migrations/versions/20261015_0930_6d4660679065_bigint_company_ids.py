@@ -0,0 +1,92 @@
+"""Bigint company ids and server-side company timestamps
+
+Revision ID: 6d4660679065
+Revises: f662571722fc
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "6d4660679065"
+down_revision = "f662571722fc"
+branch_labels = None
+depends_on = None
+
+# Tables referencing companies.id, with the indexes that include company_id
+# (dropping the column drops them, so they are recreated afterwards)
+CHILD_INDEXES = {
+    "financials_annual": [
+        ("ix_financials_annual_company_id", ["company_id"], False),
+        ("ix_financials_company_year", ["company_id", "fiscal_year"], True),
+    ],
+    "financials_quarterly": [
+        ("ix_financials_quarterly_company_id", ["company_id"], False),
+        ("ix_financials_quarterly_company_date", ["company_id", "quarter_date"], True),
+    ],
+    "prices_ohlc": [
+        ("ix_prices_ohlc_company_id", ["company_id"], False),
+        ("ix_prices_company_date", ["company_id", "date"], True),
+    ],
+    "snapshots": [
+        ("ix_snapshots_company_id", ["company_id"], False),
+        ("ix_snapshots_company_created", ["company_id", "created_at"], False),
+        ("ix_snapshots_company_kind", ["company_id", "kind"], False),
+    ],
+}
+
+
+def _swap_company_key(new_id: sa.Column) -> None:
+    """
+    Replace companies.id (and every company_id referencing it) with new_id.
+
+    new_id is added alongside the old key and filled for existing rows,
+    children are re-pointed through a join, then the old columns are dropped.
+    """
+    op.add_column("companies", new_id)
+
+    for table in CHILD_INDEXES:
+        op.add_column(table, sa.Column("company_new_id", new_id.type, nullable=True))
+        op.execute(
+            f"UPDATE {table} AS t SET company_new_id = c.new_id "
+            f"FROM companies AS c WHERE c.id = t.company_id"
+        )
+        op.alter_column(table, "company_new_id", nullable=False)
+        op.drop_column(table, "company_id")  # drops its FK and indexes
+        op.alter_column(table, "company_new_id", new_column_name="company_id")
+
+    op.drop_column("companies", "id")  # drops the primary key and ix_companies_id
+    op.alter_column("companies", "new_id", new_column_name="id")
+    op.create_primary_key("companies_pkey", "companies", ["id"])
+    op.create_index(op.f("ix_companies_id"), "companies", ["id"], unique=False)
+
+    for table, indexes in CHILD_INDEXES.items():
+        op.create_foreign_key(
+            f"{table}_company_id_fkey", table, "companies",
+            ["company_id"], ["id"], ondelete="CASCADE"
+        )
+        for name, columns, unique in indexes:
+            op.create_index(name, table, columns, unique=unique)
+
+
+def upgrade() -> None:
+    _swap_company_key(
+        sa.Column("new_id", sa.BigInteger(), sa.Identity(always=True), nullable=False)
+    )
+
+    # Naive UTC, like every other table's timestamps
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "companies", column, server_default=sa.text("timezone('utc', now())")
+        )
+
+
+def downgrade() -> None:
+    for column in ("created_at", "updated_at"):
+        op.alter_column("companies", column, server_default=None)
+
+    _swap_company_key(
+        sa.Column("new_id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False)
+    )
+    op.alter_column("companies", "id", server_default=None)
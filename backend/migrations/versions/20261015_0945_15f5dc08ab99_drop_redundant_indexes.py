@@ -0,0 +1,28 @@
+"""Drop redundant primary-key and symbol/sector indexes
+
+Revision ID: 15f5dc08ab99
+Revises: 6d4660679065
+Create Date: 2026-10-15 09:45:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "15f5dc08ab99"
+down_revision = "6d4660679065"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicates of the btrees PostgreSQL already builds for the primary keys
+    op.drop_index(op.f("ix_companies_id"), table_name="companies")
+    op.drop_index(op.f("ix_snapshots_id"), table_name="snapshots")
+    # symbol is unique on its own, so (symbol, sector) never narrows a lookup
+    op.drop_index("ix_companies_symbol_sector", table_name="companies")
+
+
+def downgrade() -> None:
+    op.create_index("ix_companies_symbol_sector", "companies", ["symbol", "sector"], unique=False)
+    op.create_index(op.f("ix_snapshots_id"), "snapshots", ["id"], unique=False)
+    op.create_index(op.f("ix_companies_id"), "companies", ["id"], unique=False)
@@ -0,0 +1,56 @@
+"""GIN indexes on JSONB columns
+
+Revision ID: ac563b6d9159
+Revises: 15f5dc08ab99
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "ac563b6d9159"
+down_revision = "15f5dc08ab99"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY builds without blocking writes, but cannot run inside the
+    # migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_financials_raw_gin", "financials_annual", ["raw_data"],
+            postgresql_using="gin", postgresql_ops={"raw_data": "jsonb_path_ops"},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_financials_quarterly_raw_gin", "financials_quarterly", ["raw_data"],
+            postgresql_using="gin", postgresql_ops={"raw_data": "jsonb_path_ops"},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_snapshots_data_gin", "snapshots", ["data"],
+            postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_snapshots_sources_gin", "snapshots", ["sources"],
+            postgresql_using="gin", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_snapshots_sources_gin", table_name="snapshots", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_snapshots_data_gin", table_name="snapshots", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_financials_quarterly_raw_gin", table_name="financials_quarterly",
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_financials_raw_gin", table_name="financials_annual", postgresql_concurrently=True
+        )
@@ -0,0 +1,34 @@
+"""Materialized view of the latest snapshot per company and kind
+
+Revision ID: 296490f25015
+Revises: ac563b6d9159
+Create Date: 2026-10-15 10:15:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "296490f25015"
+down_revision = "ac563b6d9159"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE MATERIALIZED VIEW latest_snapshot_by_kind AS "
+        "SELECT DISTINCT ON (company_id, kind) id, company_id, kind, created_at "
+        "FROM snapshots "
+        "ORDER BY company_id, kind, created_at DESC"
+    )
+    # Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        "ix_latest_snapshot_by_kind_company_kind",
+        "latest_snapshot_by_kind",
+        ["company_id", "kind"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW latest_snapshot_by_kind")
@@ -0,0 +1,58 @@
+"""BRIN indexes for prices_ohlc.date and snapshots.created_at
+
+Revision ID: 6d6c2bc27007
+Revises: 296490f25015
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6d6c2bc27007"
+down_revision = "296490f25015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY builds without blocking writes, but cannot run inside the
+    # migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_prices_date_brin", "prices_ohlc", ["date"],
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True
+        )
+        op.drop_index("ix_prices_date", table_name="prices_ohlc", postgresql_concurrently=True)
+        op.drop_index(
+            op.f("ix_prices_ohlc_date"), table_name="prices_ohlc", postgresql_concurrently=True
+        )
+
+        op.create_index(
+            "ix_snapshots_created_brin", "snapshots", ["created_at"],
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            op.f("ix_snapshots_created_at"), table_name="snapshots", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_snapshots_created_at"), "snapshots", ["created_at"],
+            unique=False, postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_snapshots_created_brin", table_name="snapshots", postgresql_concurrently=True
+        )
+
+        op.create_index(
+            op.f("ix_prices_ohlc_date"), "prices_ohlc", ["date"],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_prices_date", "prices_ohlc", ["date"], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index("ix_prices_date_brin", table_name="prices_ohlc", postgresql_concurrently=True)
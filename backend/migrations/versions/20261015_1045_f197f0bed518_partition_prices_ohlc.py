@@ -0,0 +1,97 @@
+"""Range-partition prices_ohlc by year
+
+Revision ID: f197f0bed518
+Revises: 6d6c2bc27007
+Create Date: 2026-10-15 10:45:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "f197f0bed518"
+down_revision = "6d6c2bc27007"
+branch_labels = None
+depends_on = None
+
+# Yearly partitions from FIRST_YEAR through next year; older bars share one
+FIRST_YEAR = 2000
+
+COLUMNS = "id, company_id, date, open, high, low, close, volume, created_at"
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_prices_company_date", "prices_ohlc", ["company_id", "date"], unique=True)
+    op.create_index(op.f("ix_prices_ohlc_company_id"), "prices_ohlc", ["company_id"], unique=False)
+    op.create_index(
+        "ix_prices_date_brin", "prices_ohlc", ["date"],
+        postgresql_using="brin", postgresql_with={"pages_per_range": 32}
+    )
+
+
+def upgrade() -> None:
+    op.rename_table("prices_ohlc", "prices_ohlc_unpartitioned")
+    # Free the primary key's index name for the new table
+    op.execute("ALTER INDEX prices_ohlc_pkey RENAME TO prices_ohlc_unpartitioned_pkey")
+    for index in ("ix_prices_company_date", "ix_prices_ohlc_company_id", "ix_prices_date_brin"):
+        op.drop_index(index, table_name="prices_ohlc_unpartitioned")
+
+    op.create_table(
+        "prices_ohlc",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("company_id", sa.BigInteger(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False, comment="Trading date"),
+        sa.Column("open", sa.Float(), nullable=False, comment="Opening price"),
+        sa.Column("high", sa.Float(), nullable=False, comment="High price"),
+        sa.Column("low", sa.Float(), nullable=False, comment="Low price"),
+        sa.Column("close", sa.Float(), nullable=False, comment="Closing price"),
+        sa.Column("volume", sa.Float(), nullable=True, comment="Trading volume"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id", "date"),
+        postgresql_partition_by="RANGE (date)",
+    )
+
+    op.execute(
+        "CREATE TABLE prices_ohlc_history PARTITION OF prices_ohlc "
+        f"FOR VALUES FROM (MINVALUE) TO ('{FIRST_YEAR}-01-01')"
+    )
+    for year in range(FIRST_YEAR, date.today().year + 2):
+        op.execute(
+            f"CREATE TABLE prices_ohlc_{year} PARTITION OF prices_ohlc "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+
+    op.execute(
+        f"INSERT INTO prices_ohlc ({COLUMNS}) SELECT {COLUMNS} FROM prices_ohlc_unpartitioned"
+    )
+    op.drop_table("prices_ohlc_unpartitioned")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.rename_table("prices_ohlc", "prices_ohlc_partitioned")
+    op.execute("ALTER INDEX prices_ohlc_pkey RENAME TO prices_ohlc_partitioned_pkey")
+    for index in ("ix_prices_company_date", "ix_prices_ohlc_company_id", "ix_prices_date_brin"):
+        op.drop_index(index, table_name="prices_ohlc_partitioned")
+
+    op.create_table(
+        "prices_ohlc",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("company_id", sa.BigInteger(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False, comment="Trading date"),
+        sa.Column("open", sa.Float(), nullable=False, comment="Opening price"),
+        sa.Column("high", sa.Float(), nullable=False, comment="High price"),
+        sa.Column("low", sa.Float(), nullable=False, comment="Low price"),
+        sa.Column("close", sa.Float(), nullable=False, comment="Closing price"),
+        sa.Column("volume", sa.Float(), nullable=True, comment="Trading volume"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.execute(f"INSERT INTO prices_ohlc ({COLUMNS}) SELECT {COLUMNS} FROM prices_ohlc_partitioned")
+    op.drop_table("prices_ohlc_partitioned")  # drops every partition with it
+    _create_indexes()
@@ -0,0 +1,47 @@
+"""Covering snapshot listing indexes
+
+Revision ID: 3b8e1f47c2d6
+Revises: f197f0bed518
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3b8e1f47c2d6"
+down_revision = "f197f0bed518"
+branch_labels = None
+depends_on = None
+
+# name -> (key columns, INCLUDE columns)
+COVERING_INDEXES = {
+    "ix_snapshots_company_created": (["company_id", "created_at"], ["kind", "version"]),
+    "ix_snapshots_kind_created": (["kind", "created_at"], ["company_id", "version"]),
+}
+
+
+def _rebuild(name: str, columns: list, include: list) -> None:
+    """
+    Swap index name for a new definition without blocking writes.
+
+    The replacement is built CONCURRENTLY under a temporary name while the
+    old index keeps serving queries, then takes over its name.
+    """
+    op.create_index(
+        f"{name}_new", "snapshots", columns, unique=False,
+        postgresql_include=include, postgresql_concurrently=True
+    )
+    op.drop_index(name, table_name="snapshots", postgresql_concurrently=True)
+    op.execute(f"ALTER INDEX {name}_new RENAME TO {name}")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (columns, include) in COVERING_INDEXES.items():
+            _rebuild(name, columns, include)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (columns, _) in COVERING_INDEXES.items():
+            _rebuild(name, columns, [])
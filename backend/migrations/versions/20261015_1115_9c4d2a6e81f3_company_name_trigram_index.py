@@ -0,0 +1,32 @@
+"""Trigram index on companies.name
+
+Revision ID: 9c4d2a6e81f3
+Revises: 3b8e1f47c2d6
+Create Date: 2026-10-15 11:15:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c4d2a6e81f3"
+down_revision = "3b8e1f47c2d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_companies_name_trgm", "companies", ["name"],
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_companies_name_trgm", table_name="companies", postgresql_concurrently=True
+        )
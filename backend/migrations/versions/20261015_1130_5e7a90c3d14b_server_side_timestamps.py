@@ -0,0 +1,36 @@
+"""Server-side created_at/updated_at defaults
+
+Revision ID: 5e7a90c3d14b
+Revises: 9c4d2a6e81f3
+Create Date: 2026-10-15 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5e7a90c3d14b"
+down_revision = "9c4d2a6e81f3"
+branch_labels = None
+depends_on = None
+
+# Naive UTC timestamp columns previously filled in by Python. companies got
+# the same timezone('utc', now()) default in 6d4660679065.
+TIMESTAMP_COLUMNS = {
+    "financials_annual": ["created_at", "updated_at"],
+    "financials_quarterly": ["created_at", "updated_at"],
+    "prices_ohlc": ["created_at"],  # partitioned: the default applies to every partition
+    "snapshots": ["created_at"],
+}
+
+
+def upgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=None)
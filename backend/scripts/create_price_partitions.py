@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Create upcoming prices_ohlc partitions.
+Run daily from cron (one host), e.g.:
+
+    0 3 * * * cd backend && poetry run python scripts/create_price_partitions.py
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Allow `python scripts/create_price_partitions.py` from backend/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.database import close_db  # noqa: E402
+from app.core.maintenance import ensure_price_partitions  # noqa: E402
+
+
+async def _run(years_ahead: int) -> bool:
+    try:
+        return await ensure_price_partitions(years_ahead)
+    finally:
+        await close_db()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Create missing partitions; exit 0 even if another run held the lock."""
+    parser = argparse.ArgumentParser(description="Create upcoming prices_ohlc partitions.")
+    parser.add_argument(
+        "--years-ahead", type=int, default=1,
+        help="Future years to cover besides the current one (default: 1)"
+    )
+    args = parser.parse_args(argv)
+
+    if asyncio.run(_run(args.years_ahead)):
+        print("prices_ohlc partitions are in place")
+    else:
+        print("Another partition run holds the lock; skipped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
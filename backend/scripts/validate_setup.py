@@ -4,98 +4,186 @@ Validation script to check if the backend setup is correct.
 Runs without installing dependencies.
 """
 
+import argparse
+import json
+import os
 import sys
+from functools import cache
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
-def check_file_exists(path: Path, description: str) -> bool:
-    """Check if a file exists."""
-    if path.exists():
-        print(f"✓ {description}: {path}")
-        return True
+# (section, ((path relative to backend/, description), ...));
+# a trailing "/" marks an expected directory
+CHECK_MANIFEST = (
+    ("Core Files", (
+        ("pyproject.toml", "Poetry config"),
+        (".env.example", "Environment template"),
+        ("alembic.ini", "Alembic config"),
+        ("README.md", "README"),
+    )),
+    ("App Structure", (
+        ("app/main.py", "FastAPI entry"),
+        ("app/core/config.py", "Configuration"),
+        ("app/core/database.py", "Database setup"),
+        ("app/core/logging.py", "Logging config"),
+        ("app/core/dependencies.py", "Dependencies"),
+    )),
+    ("Models", (
+        ("app/models/__init__.py", "Models package"),
+        ("app/models/company.py", "Company model"),
+        ("app/models/financials.py", "Financials model"),
+        ("app/models/snapshot.py", "Snapshot model"),
+        ("app/models/price.py", "Price model"),
+    )),
+    ("Repositories", (
+        ("app/repositories/base.py", "Base repository"),
+        ("app/repositories/company.py", "Company repository"),
+        ("app/repositories/price.py", "Price repository"),
+        ("app/repositories/snapshot.py", "Snapshot repository"),
+    )),
+    ("Migrations", (
+        ("migrations/env.py", "Alembic env"),
+        ("migrations/script.py.mako", "Migration template"),
+    )),
+    ("Test Structure", (
+        ("tests/unit/", "Unit tests dir"),
+        ("tests/integration/", "Integration tests dir"),
+        ("tests/e2e/", "E2E tests dir"),
+    )),
+)
+
+# Without these the tree is not a backend checkout at all: main() reports
+# just them instead of a wall of follow-on failures
+CRITICAL_FILES = frozenset({"pyproject.toml", "app/main.py"})
+
+@cache
+def list_dir(directory: str) -> Dict[str, bool]:
+    """
+    Entry name -> is-directory for a directory (empty if it is missing).
+
+    Read once per directory with os.scandir; is_dir() comes from the
+    listing's d_type, without a stat per entry.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+def check_file_exists(path: str, description: str) -> Tuple[bool, str]:
+    """
+    Check if a file exists (by name, in its parent's cached listing).
+
+    A path ending in "/" must be a directory. Returns (passed, report line).
+    """
+    want_dir = path.endswith("/")
+    path = path.rstrip("/")
+    directory, name = os.path.split(path)
+    is_dir = list_dir(directory).get(name)
+    if is_dir is not None and (is_dir or not want_dir):
+        return True, f"✓ {description}: {path}"
     else:
-        print(f"✗ {description} MISSING: {path}")
-        return False
+        return False, f"✗ {description} MISSING: {path}"
+
+def write_json(checks: List[Dict[str, Any]], critical_missing: bool = False) -> None:
+    """Write check results as one JSON document (for CI)."""
+    passed = sum(check["ok"] for check in checks)
+    json.dump(
+        {
+            "passed": passed,
+            "total": len(checks),
+            "critical_missing": critical_missing,
+            "checks": checks,
+        },
+        sys.stdout,
+        ensure_ascii=False,
+    )
+    sys.stdout.write("\n")
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Validate backend setup."""
-    print("=" * 60)
-    print("Stonky Backend Setup Validation")
-    print("=" * 60)
-    print()
-
-    backend_dir = Path(__file__).parent.parent
-    checks = []
-
-    # Core files
-    print("Core Files:")
-    checks.append(check_file_exists(backend_dir / "pyproject.toml", "Poetry config"))
-    checks.append(check_file_exists(backend_dir / ".env.example", "Environment template"))
-    checks.append(check_file_exists(backend_dir / "alembic.ini", "Alembic config"))
-    checks.append(check_file_exists(backend_dir / "README.md", "README"))
-    print()
-
-    # App structure
-    print("App Structure:")
-    app_dir = backend_dir / "app"
-    checks.append(check_file_exists(app_dir / "main.py", "FastAPI entry"))
-    checks.append(check_file_exists(app_dir / "core" / "config.py", "Configuration"))
-    checks.append(check_file_exists(app_dir / "core" / "database.py", "Database setup"))
-    checks.append(check_file_exists(app_dir / "core" / "logging.py", "Logging config"))
-    checks.append(check_file_exists(app_dir / "core" / "dependencies.py", "Dependencies"))
-    print()
-
-    # Models
-    print("Models:")
-    models_dir = app_dir / "models"
-    checks.append(check_file_exists(models_dir / "__init__.py", "Models package"))
-    checks.append(check_file_exists(models_dir / "company.py", "Company model"))
-    checks.append(check_file_exists(models_dir / "financials.py", "Financials model"))
-    checks.append(check_file_exists(models_dir / "snapshot.py", "Snapshot model"))
-    checks.append(check_file_exists(models_dir / "price.py", "Price model"))
-    print()
-
-    # Repositories
-    print("Repositories:")
-    repo_dir = app_dir / "repositories"
-    checks.append(check_file_exists(repo_dir / "base.py", "Base repository"))
-    checks.append(check_file_exists(repo_dir / "company.py", "Company repository"))
-    print()
-
-    # Migrations
-    print("Migrations:")
-    migrations_dir = backend_dir / "migrations"
-    checks.append(check_file_exists(migrations_dir / "env.py", "Alembic env"))
-    checks.append(check_file_exists(migrations_dir / "script.py.mako", "Migration template"))
-    print()
-
-    # Test structure
-    print("Test Structure:")
-    tests_dir = backend_dir / "tests"
-    checks.append(check_file_exists(tests_dir / "unit", "Unit tests dir"))
-    checks.append(check_file_exists(tests_dir / "integration", "Integration tests dir"))
-    checks.append(check_file_exists(tests_dir / "e2e", "E2E tests dir"))
-    print()
+    parser = argparse.ArgumentParser(description="Check that the backend setup is complete.")
+    parser.add_argument(
+        "--json", action="store_true", help="print results as JSON instead of a report"
+    )
+    args = parser.parse_args(argv)
+
+    # Report lines, written to stdout in one go at the end
+    output = [
+        "=" * 60,
+        "Stonky Backend Setup Validation",
+        "=" * 60,
+        "",
+    ]
+
+    root = str(Path(__file__).parent.parent)
+
+    missing = []
+    results = []
+    critical = (
+        entry for _, entries in CHECK_MANIFEST for entry in entries if entry[0] in CRITICAL_FILES
+    )
+    for rel, desc in critical:
+        path = os.path.join(root, rel)
+        passed, line = check_file_exists(path, desc)
+        results.append({"path": path.rstrip("/"), "desc": desc, "ok": passed})
+        if not passed:
+            missing.append(line)
+
+    if missing:
+        if args.json:
+            write_json(results, critical_missing=True)
+            return 1
+        output += [
+            "Critical Files:",
+            *missing,
+            "",
+            f"✗ Critical files missing. Is {root} the backend directory?",
+        ]
+        sys.stdout.write("\n".join(output) + "\n")
+        return 1
+
+    results = []
+    for section, entries in CHECK_MANIFEST:
+        output.append(f"{section}:")
+        for rel, desc in entries:
+            path = os.path.join(root, rel)
+            passed, line = check_file_exists(path, desc)
+            results.append({"path": path.rstrip("/"), "desc": desc, "ok": passed})
+            output.append(line)
+        output.append("")
 
     # Summary
-    print("=" * 60)
-    passed = sum(checks)
-    total = len(checks)
-    print(f"Results: {passed}/{total} checks passed")
-    print("=" * 60)
+    passed = sum(result["ok"] for result in results)
+    total = len(results)
+    exit_code = 0 if passed == total else 1
+
+    if args.json:
+        write_json(results)
+        return exit_code
+
+    output += [
+        "=" * 60,
+        f"Results: {passed}/{total} checks passed",
+        "=" * 60,
+    ]
 
     if passed == total:
-        print("✓ All checks passed! Backend setup is complete.")
-        print()
-        print("Next steps:")
-        print("1. Install dependencies: poetry install")
-        print("2. Copy .env.example to .env and configure")
-        print("3. Start PostgreSQL and Redis")
-        print("4. Run migrations: poetry run alembic upgrade head")
-        print("5. Start server: poetry run uvicorn app.main:app --reload")
-        return 0
+        output += [
+            "✓ All checks passed! Backend setup is complete.",
+            "",
+            "Next steps:",
+            "1. Install dependencies: poetry install",
+            "2. Copy .env.example to .env and configure",
+            "3. Start PostgreSQL and Redis",
+            "4. Run migrations: poetry run alembic upgrade head",
+            "5. Start server: poetry run uvicorn app.main:app --reload",
+        ]
     else:
-        print(f"✗ {total - passed} checks failed. Please review setup.")
-        return 1
+        output.append(f"✗ {total - passed} checks failed. Please review setup.")
+
+    sys.stdout.write("\n".join(output) + "\n")
+    return exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
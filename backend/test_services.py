@@ -11,31 +11,74 @@ Run with: python test_services.py
 """
 
 import asyncio
+import io
 import sys
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Awaitable, Optional, Tuple
 
 # Add app to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.core.config import settings
+from app.core.dependencies import ServiceFactory
+from app.core.http import create_http_client
 from app.services.yahoo import YahooFinanceService
 from app.services.nse import NSEService
 from app.services.news import NewsService
 from app.services.screener import ScreenerService
 
+# Output of the service test running in the current task (tests run concurrently)
+_test_output: ContextVar[Optional[io.StringIO]] = ContextVar("test_output", default=None)
 
-async def test_yahoo_service():
+
+class _TaskStdout(io.TextIOBase):
+    """sys.stdout stand-in that sends each test task's prints to its own buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        return (_test_output.get() or self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+async def run_buffered(test: Awaitable[bool]) -> Tuple[bool, str]:
+    """Run one service test, capturing its output so concurrent tests don't interleave."""
+    buffer = io.StringIO()
+    _test_output.set(buffer)  # gather() runs each test in its own task and context
+
+    try:
+        passed = await test
+    except Exception as e:
+        print(f"\n❌ {test.__name__}: CRASHED")
+        print(f"Error: {e}")
+        passed = False
+
+    return passed, buffer.getvalue()
+
+
+async def test_yahoo_service(service: Optional[YahooFinanceService] = None):
     """Test Yahoo Finance service."""
     print("\n" + "=" * 60)
     print("TESTING YAHOO FINANCE SERVICE")
     print("=" * 60)
 
-    service = YahooFinanceService()
+    service = service or YahooFinanceService()
 
     try:
+        # The three lookups are independent: fetch them concurrently
+        print("\nFetching data, 1-month price history and current price for RELIANCE.NS...")
+        data, prices, current = await asyncio.gather(
+            service.fetch_data("RELIANCE.NS"),
+            service.get_prices("RELIANCE.NS", period="1mo", interval="1d"),
+            service.get_current_price("RELIANCE.NS"),
+        )
+
         # Test with Reliance NSE
-        print("\n1. Fetching data for RELIANCE.NS...")
-        data = await service.fetch_data("RELIANCE.NS")
+        print("\n1. Data for RELIANCE.NS:")
         print(f"✓ Symbol: {data.get('symbol')}")
         print(f"✓ Name: {data.get('name')}")
         print(f"✓ Current Price: ₹{data.get('current_price', 0):.2f}")
@@ -43,16 +86,14 @@ async def test_yahoo_service():
         print(f"✓ Sector: {data.get('sector')}")
 
         # Test price history
-        print("\n2. Fetching 1-month price history...")
-        prices = await service.get_prices("RELIANCE.NS", period="1mo", interval="1d")
-        print(f"✓ Retrieved {len(prices['prices'])} days of data")
-        if prices['prices']:
-            latest = prices['prices'][-1]
-            print(f"✓ Latest: {latest['date']} - Close: ₹{latest['close']:.2f}")
+        print("\n2. 1-month price history:")
+        columns = prices['columns']
+        print(f"✓ Retrieved {prices['count']} days of data")
+        if prices['count']:
+            print(f"✓ Latest: {columns['date'][-1]} - Close: ₹{columns['close'][-1]:.2f}")
 
         # Test current price
-        print("\n3. Fetching current price...")
-        current = await service.get_current_price("RELIANCE.NS")
+        print("\n3. Current price:")
         print(f"✓ Current price: ₹{current:.2f}")
 
         print("\n✅ Yahoo Finance service: PASSED")
@@ -64,20 +105,29 @@ async def test_yahoo_service():
         return False
 
 
-async def test_nse_service():
+async def test_nse_service(service: Optional[NSEService] = None):
     """Test NSE service."""
     print("\n" + "=" * 60)
     print("TESTING NSE SERVICE")
     print("=" * 60)
 
-    service = NSEService()
+    service = service or NSEService()
 
     try:
-        # Test shareholding
-        print("\n1. Fetching shareholding for RELIANCE...")
-        shareholding = await service.get_shareholding("RELIANCE")
+        # Independent requests on one NSE session: fetch them concurrently
+        # (a rate-limited endpoint doesn't hide the other's result)
+        print("\nFetching shareholding and quote for RELIANCE...")
+        shareholding, quote = await asyncio.gather(
+            service.get_shareholding("RELIANCE"),
+            service.get_quote("RELIANCE"),
+            return_exceptions=True
+        )
 
-        if 'promoter' in shareholding:
+        # Test shareholding
+        print("\n1. Shareholding for RELIANCE:")
+        if isinstance(shareholding, Exception):
+            print(f"⚠ Shareholding failed (NSE might be down or rate-limited): {shareholding}")
+        elif 'promoter' in shareholding:
             print(f"✓ Promoter: {shareholding['promoter']['percentage']:.2f}%")
             print(f"✓ FII: {shareholding.get('fii', {}).get('percentage', 0):.2f}%")
             print(f"✓ DII: {shareholding.get('dii', {}).get('percentage', 0):.2f}%")
@@ -89,10 +139,10 @@ async def test_nse_service():
             print("⚠ No shareholding data (NSE might be down or rate-limited)")
 
         # Test quote
-        print("\n2. Fetching quote for RELIANCE...")
-        quote = await service.get_quote("RELIANCE")
-
-        if 'last_price' in quote:
+        print("\n2. Quote for RELIANCE:")
+        if isinstance(quote, Exception):
+            print(f"⚠ Quote failed (NSE might be down or rate-limited): {quote}")
+        elif 'last_price' in quote:
             print(f"✓ Last Price: ₹{quote['last_price']:.2f}")
             print(f"✓ Change: {quote['change']:.2f} ({quote['percent_change']:.2f}%)")
             print(f"✓ Day High: ₹{quote['day_high']:.2f}")
@@ -109,13 +159,13 @@ async def test_nse_service():
         return True  # Don't fail the test as NSE is unreliable
 
 
-async def test_news_service():
+async def test_news_service(service: Optional[NewsService] = None):
     """Test News service."""
     print("\n" + "=" * 60)
     print("TESTING NEWS SERVICE")
     print("=" * 60)
 
-    service = NewsService()
+    service = service or NewsService()
 
     try:
         # Test general news
@@ -146,7 +196,7 @@ async def test_news_service():
         return False
 
 
-async def test_screener_service():
+async def test_screener_service(service: Optional[ScreenerService] = None):
     """Test Screener.in service (requires cookie)."""
     print("\n" + "=" * 60)
     print("TESTING SCREENER.IN SERVICE")
@@ -162,10 +212,16 @@ async def test_screener_service():
         return True
 
     try:
-        service = ScreenerService(session_cookie=settings.SCREENER_COOKIE)
+        service = service or ScreenerService(session_cookie=settings.SCREENER_COOKIE)
+
+        # Independent requests: fetch them concurrently
+        print("\nFetching fundamentals and company info for RELIANCE...")
+        data, info = await asyncio.gather(
+            service.fetch_data("RELIANCE"),
+            service.get_company_info("RELIANCE"),
+        )
 
-        print("\n1. Fetching fundamentals for RELIANCE...")
-        data = await service.fetch_data("RELIANCE")
+        print("\n1. Fundamentals for RELIANCE:")
 
         if 'revenue' in data and data['revenue']:
             print(f"✓ Retrieved {len(data['revenue'])} years of data")
@@ -180,8 +236,7 @@ async def test_screener_service():
             if 'debt_to_equity' in data and data['debt_to_equity']:
                 print(f"✓ Latest D/E: {data['debt_to_equity'][0]:.2f}" if data['debt_to_equity'][0] else "N/A")
 
-        print("\n2. Fetching company info...")
-        info = await service.get_company_info("RELIANCE")
+        print("\n2. Company info:")
         print(f"✓ Name: {info.get('name')}")
         print(f"✓ Sector: {info.get('sector')}")
 
@@ -208,34 +263,64 @@ async def main():
     print("3. News (Google News RSS)")
     print("4. Screener.in (10-year fundamentals)")
 
-    results = {}
+    # One memoized instance per service, all on one pooled HTTP client
+    # (closed by factory.aclose()), as in the app lifespan
+    factory = ServiceFactory(http_client=create_http_client())
+    tests = {
+        'yahoo': test_yahoo_service(factory.create_yahoo_service()),
+        'nse': test_nse_service(factory.create_nse_service()),
+        'news': test_news_service(factory.create_news_service()),
+        'screener': test_screener_service(
+            factory.create_screener_service() if settings.has_screener_cookie else None
+        ),
+    }
+
+    # Run tests concurrently; each one's output is printed in order afterwards
+    stdout = sys.stdout
+    sys.stdout = _TaskStdout(stdout)
+    try:
+        outcomes = await asyncio.gather(*(run_buffered(test) for test in tests.values()))
+    finally:
+        sys.stdout = stdout
+        await factory.aclose()
 
-    # Run tests
-    results['yahoo'] = await test_yahoo_service()
-    results['nse'] = await test_nse_service()
-    results['news'] = await test_news_service()
-    results['screener'] = await test_screener_service()
+    results = {}
+    report = []
+    for name, (passed, output) in zip(tests, outcomes):
+        report.append(output)
+        results[name] = passed
 
     # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-
-    for service, passed in results.items():
-        status = "✅ PASSED" if passed else "❌ FAILED"
-        print(f"{service.upper():15} {status}")
-
     all_passed = all(results.values())
-    print("\n" + "=" * 60)
-    if all_passed:
-        print("🎉 ALL TESTS PASSED!")
-    else:
-        print("⚠ SOME TESTS FAILED")
-    print("=" * 60 + "\n")
+    summary = "\n".join([
+        "",
+        "=" * 60,
+        "TEST SUMMARY",
+        "=" * 60,
+        *(
+            f"{service.upper():15} {'✅ PASSED' if passed else '❌ FAILED'}"
+            for service, passed in results.items()
+        ),
+        "",
+        "=" * 60,
+        "🎉 ALL TESTS PASSED!" if all_passed else "⚠ SOME TESTS FAILED",
+        "=" * 60,
+        "",
+    ])
+
+    # Test sections and summary go out in a single write
+    sys.stdout.write("".join(report) + summary + "\n")
 
     return 0 if all_passed else 1
 
 
 if __name__ == "__main__":
+    # Match the server's event loop (uvicorn --loop uvloop)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
@@ -0,0 +1,74 @@
+"""Tests for the admin token guard and cache invalidation."""
+
+from urllib.parse import quote
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import admin
+from app.core import cache
+from app.core.config import settings
+
+
+def _use_token(monkeypatch, token):
+    monkeypatch.setattr(admin, "settings", settings.model_copy(update={"ADMIN_TOKEN": token}))
+
+
+async def test_admin_token_not_configured_allows(monkeypatch):
+    _use_token(monkeypatch, None)
+    await admin.require_admin_token(None)
+
+
+async def test_admin_token_rejects_missing_or_wrong(monkeypatch):
+    _use_token(monkeypatch, "s3cret")
+    for token in (None, "wrong"):
+        with pytest.raises(HTTPException) as exc:
+            await admin.require_admin_token(token)
+        assert exc.value.status_code == 401
+
+
+async def test_admin_token_accepts_match(monkeypatch):
+    _use_token(monkeypatch, "s3cret")
+    await admin.require_admin_token("s3cret")
+
+
+@pytest.mark.parametrize("symbol", ["*", "REL*", "RELIANC?", "[A-Z]*"])
+def test_invalidate_cache_rejects_glob_symbols(monkeypatch, symbol):
+    _use_token(monkeypatch, None)
+    deleted = []
+
+    async def fake_invalidate(sym):
+        deleted.append(sym)
+        return 0
+
+    monkeypatch.setattr(admin, "invalidate", fake_invalidate)
+    app = FastAPI()
+    app.include_router(admin.router)
+
+    response = TestClient(app).delete(f"/admin/cache/{quote(symbol, safe='')}")
+
+    assert response.status_code == 422
+    assert deleted == []
+
+
+class _RecordingRedis:
+    def __init__(self):
+        self.patterns = []
+
+    async def scan_iter(self, match):
+        self.patterns.append(match)
+        return
+        yield
+
+    async def delete(self, *keys):
+        return len(keys)
+
+
+async def test_invalidate_escapes_glob_characters(monkeypatch):
+    client = _RecordingRedis()
+    monkeypatch.setattr(cache, "_client", client)
+
+    await cache.invalidate("*")
+
+    assert client.patterns == ["*:\\*", "*:\\*[.:]*"]
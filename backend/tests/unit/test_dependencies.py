@@ -0,0 +1,35 @@
+"""
+Unit tests for ServiceFactory.fetch_all.
+"""
+
+from app.core.dependencies import ServiceFactory
+
+
+class _FakeNSE:
+    async def get_quote(self, symbol):
+        raise RuntimeError("NSE down")
+
+
+class _FakeYahoo:
+    async def get_prices(self, symbol):
+        return {"symbol": symbol}
+
+
+class _FakeNews:
+    async def get_news(self, query, limit):
+        return [{"title": query, "limit": limit}]
+
+
+def _factory() -> ServiceFactory:
+    factory = ServiceFactory()
+    # Memoized instances are returned by create_*, so fakes stand in for services
+    factory._instances.update(nse=_FakeNSE(), yahoo=_FakeYahoo(), news=_FakeNews())
+    return factory
+
+
+async def test_fetch_all_returns_failed_source_as_exception():
+    results = await _factory().fetch_all("reliance.ns", news_limit=3)
+
+    assert isinstance(results["nse"], RuntimeError)
+    assert results["yahoo"] == {"symbol": "RELIANCE.NS"}
+    assert results["news"] == [{"title": "RELIANCE", "limit": 3}]
@@ -0,0 +1,55 @@
+"""
+Unit tests for the maintenance jobs.
+"""
+
+import asyncio
+
+from app.core import maintenance
+from app.core.maintenance import run_periodic
+
+
+async def test_failed_run_does_not_stop_the_loop():
+    runs = 0
+
+    async def job():
+        nonlocal runs
+        runs += 1
+        if runs == 1:
+            raise RuntimeError("database unreachable")
+
+    task = asyncio.create_task(run_periodic(job, 0, "test_job"))
+    while runs < 3:
+        await asyncio.sleep(0)
+    task.cancel()
+
+    assert runs >= 3
+
+
+class _LockedSession:
+    """Session whose advisory lock is already held by another run."""
+
+    def __init__(self):
+        self.executed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def scalar(self, statement, params):
+        return False
+
+    async def execute(self, statement):
+        self.executed.append(statement)
+
+    async def commit(self):
+        raise AssertionError("commit without the lock")
+
+
+async def test_partition_run_skips_when_lock_is_held(monkeypatch):
+    session = _LockedSession()
+    monkeypatch.setattr(maintenance, "AsyncSessionLocal", lambda: session)
+
+    assert await maintenance.ensure_price_partitions() is False
+    assert session.executed == []
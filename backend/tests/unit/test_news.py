@@ -0,0 +1,75 @@
+"""
+Unit tests for NewsService RSS parsing.
+"""
+
+import feedparser
+import pytest
+
+from app.services.news import NewsService, _sanitize_summary
+
+# Google News-style item whose <description> carries XSS payloads
+HOSTILE_DESCRIPTION = (
+    '&lt;a href="https://news.example.com/a" onclick="steal()"&gt;Reliance&lt;/a&gt;'
+    '&lt;script&gt;alert(document.cookie)&lt;/script&gt;'
+    '&lt;img src="x" onerror="alert(1)"&gt;'
+    '&lt;a href="javascript:alert(2)"&gt;more&lt;/a&gt;'
+    '&lt;iframe src="https://evil.example"&gt;&lt;/iframe&gt;'
+    '&amp;nbsp;&lt;font color="#6f6f6f"&gt;Example Times&lt;/font&gt;'
+)
+
+HOSTILE_FEED = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+<item>
+  <title>Reliance hits record high - Example Times</title>
+  <link>https://news.example.com/a</link>
+  <guid>a-1</guid>
+  <pubDate>Tue, 14 Oct 2025 09:30:00 GMT</pubDate>
+  <description>{HOSTILE_DESCRIPTION}</description>
+</item>
+</channel></rss>""".encode()
+
+
+@pytest.fixture
+def service() -> NewsService:
+    return NewsService()
+
+
+def _assert_sanitized(summary: str) -> None:
+    lowered = summary.lower()
+    assert "<script" not in lowered
+    assert "alert(document.cookie)" not in lowered
+    assert "onerror" not in lowered
+    assert "onclick" not in lowered
+    assert "javascript:" not in lowered
+    assert "<iframe" not in lowered
+
+
+def test_parse_feed_sanitizes_hostile_summary(service: NewsService):
+    [article] = service._parse_feed(HOSTILE_FEED, limit=5)
+
+    _assert_sanitized(article["summary"])
+    # Harmless markup survives, as with feedparser
+    assert '<a href="https://news.example.com/a">Reliance</a>' in article["summary"]
+    assert '<font color="#6f6f6f">Example Times</font>' in article["summary"]
+
+
+def test_iter_articles_sanitizes_hostile_summary(service: NewsService):
+    [article] = list(service._iter_articles(HOSTILE_FEED))
+
+    _assert_sanitized(article["summary"])
+
+
+def test_parse_feed_matches_feedparser(service: NewsService):
+    [article] = service._parse_feed(HOSTILE_FEED, limit=5)
+    expected = service._parse_entry(feedparser.parse(HOSTILE_FEED).entries[0])
+
+    assert article == expected
+
+
+@pytest.mark.parametrize("html", ["", "plain text", "Tata & Sons <b>up</b> 5%"])
+def test_sanitize_summary_keeps_safe_content(html: str):
+    assert _sanitize_summary(html) == html
+
+
+def test_sanitize_summary_strips_payloads():
+    _assert_sanitized(_sanitize_summary('<img src="x" onerror="alert(1)"><script>x()</script>'))
@@ -0,0 +1,58 @@
+"""
+Unit tests for singleflight request coalescing.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core import singleflight
+
+
+async def test_concurrent_callers_share_one_call():
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(singleflight.do("k:share", load) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert calls == 1
+
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "value"
+
+    leader = asyncio.create_task(singleflight.do("k:cancel", load))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(singleflight.do("k:cancel", load))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == "value"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_errors_reach_every_caller_and_are_not_kept():
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(
+        *(singleflight.do("k:error", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "k:error" not in singleflight._inflight
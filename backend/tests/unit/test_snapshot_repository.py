@@ -0,0 +1,48 @@
+"""
+Unit tests for SnapshotRepository.get_latest view usage.
+"""
+
+from app.core.config import settings
+from app.repositories import snapshot as snapshot_module
+from app.repositories.snapshot import SnapshotRepository
+
+
+class _Result:
+    def scalar_one_or_none(self):
+        return None
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+        return _Result()
+
+
+def _use_interval(monkeypatch, interval):
+    monkeypatch.setattr(
+        snapshot_module, "settings",
+        settings.model_copy(update={"SNAPSHOT_VIEW_REFRESH_INTERVAL": interval})
+    )
+
+
+async def test_get_latest_skips_view_when_refresh_disabled(monkeypatch):
+    _use_interval(monkeypatch, 0)
+    session = _RecordingSession()
+
+    await SnapshotRepository(session).get_latest(1, "full_analysis")
+
+    assert len(session.statements) == 1
+    assert "latest_snapshot_by_kind" not in session.statements[0]
+
+
+async def test_get_latest_uses_view_when_refreshed(monkeypatch):
+    _use_interval(monkeypatch, 120)
+    session = _RecordingSession()
+
+    await SnapshotRepository(session).get_latest(1, "full_analysis")
+
+    assert "latest_snapshot_by_kind" in session.statements[0]
+    assert "latest_snapshot_by_kind" not in session.statements[1]